@@ -0,0 +1,148 @@
+import struct
+import zlib
+from array import array
+
+import football_sim as fs
+from codec import _Reader, _Strings, _column_map, _i32_array, _i32_bytes
+
+# ============================
+# --- CAREER ARCHIVE ---
+# ============================
+# FSA2: magic + row count, then a zlib'd body that opens with the stat and rating field names,
+# so columns are matched by name when fields are added or reordered (as codec saves are).
+# FSA1 archives only recorded the field counts and load only while those still match.
+MAGIC = b"FSA2"
+MAGIC_V1 = b"FSA1"
+HEADER = struct.Struct("<4sI")        # magic, rows
+HEADER_V1 = struct.Struct("<4sIBB")   # magic, rows, stat fields, rating fields
+
+def _by_name(saved_column, rows, saved, current):
+    """Row-major columns written under the saved field list -> the current one (missing fields are 0)"""
+    if list(saved) == list(current):
+        return saved_column
+    out = array("i", bytes(4 * rows * len(current)))
+    for src, dst in _column_map(saved, current):
+        out[dst::len(current)] = saved_column[src::len(saved)]
+    return out
+
+def _strings(values):
+    table = _Strings()
+    for v in values:
+        table(v)
+    return table.encode()
+
+class CareerArchive:
+    """Columnar store of retired players, taken off the live rosters at season end.
+
+    One row per retired player: name, last team and position (interned string codes),
+    retirement season, years played, final ratings and final-season stats (flat i32 columns
+    in RATING_ATTRS/STAT_ATTRS order). No Player objects are kept alive.
+    """
+    def __init__(self):
+        self.names = []
+        self.strings = []
+        self._codes = {}
+        self.team = array("H")
+        self.position = array("H")
+        self.season = array("H")
+        self.years_played = array("H")
+        self.ratings = array("i")
+        self.stats = array("i")
+
+    def __len__(self):
+        return len(self.names)
+
+    def _code(self, s):
+        if s not in self._codes:
+            self._codes[s] = len(self.strings)
+            self.strings.append(s)
+        return self._codes[s]
+
+    def add(self, player, team_name, season):
+        self.names.append(player.name)
+        self.team.append(self._code(team_name))
+        self.position.append(self._code(player.position))
+        self.season.append(season)
+        self.years_played.append(player.years_played)
+        self.ratings.extend(player.ratings)
+        self.stats.extend(player.stats)
+
+    def row(self, i):
+        """One archived player as a dict"""
+        n_stats, n_ratings = len(fs.STAT_ATTRS), len(fs.RATING_ATTRS)
+        row = {
+            "name": self.names[i],
+            "team": self.strings[self.team[i]],
+            "position": self.strings[self.position[i]],
+            "retired_season": self.season[i],
+            "years_played": self.years_played[i],
+        }
+        row.update(zip(fs.RATING_ATTRS, self.ratings[i * n_ratings:(i + 1) * n_ratings]))
+        row.update(zip(fs.STAT_ATTRS, self.stats[i * n_stats:(i + 1) * n_stats]))
+        return row
+
+    def find(self, name):
+        return [self.row(i) for i, n in enumerate(self.names) if n == name]
+
+    def column(self, attr):
+        """Final-season values of one stat or rating for every archived player"""
+        if attr in fs.STAT_INDEX:
+            return self.stats[fs.STAT_INDEX[attr]::len(fs.STAT_ATTRS)]
+        return self.ratings[fs.RATING_ATTRS.index(attr)::len(fs.RATING_ATTRS)]
+
+    # --- Binary form (embedded in codec saves, or written on its own) ---
+    _dumped = None  # (rows, bytes) of the last dumps(); rows are only ever appended
+
+    def dumps(self):
+        """FSA2 bytes, re-encoded only when rows were added since the last call (every save embeds them)"""
+        if self._dumped is not None and self._dumped[0] == len(self):
+            return self._dumped[1]
+        s = _Strings()
+        for name in self.strings:
+            s(name)
+        names = _Strings()
+        name_ids = [names(n) for n in self.names]
+        body = [_strings(fs.STAT_ATTRS), _strings(fs.RATING_ATTRS)]
+        body += [s.encode(), names.encode(), struct.pack(f"<{len(name_ids)}I", *name_ids)]
+        body += [_i32_bytes(col) for col in (self.team, self.position, self.season, self.years_played)]
+        body += [_i32_bytes(self.ratings), _i32_bytes(self.stats)]
+        data = HEADER.pack(MAGIC, len(self)) + zlib.compress(b"".join(body))
+        self._dumped = (len(self), data)
+        return data
+
+    @classmethod
+    def loads(cls, data):
+        magic = data[:len(MAGIC)]
+        if magic == MAGIC:
+            _, rows = HEADER.unpack_from(data)
+            r = _Reader(zlib.decompress(data[HEADER.size:]))
+            stat_fields, rating_fields = r.strings(), r.strings()
+        elif magic == MAGIC_V1:
+            _, rows, n_stats, n_ratings = HEADER_V1.unpack_from(data)
+            if (n_stats, n_ratings) != (len(fs.STAT_ATTRS), len(fs.RATING_ATTRS)):
+                raise ValueError(f"career archive {magic.decode()} predates a stat/rating layout change "
+                                 f"and has no field names to remap by")
+            r = _Reader(zlib.decompress(data[HEADER_V1.size:]))
+            stat_fields, rating_fields = fs.STAT_ATTRS, fs.RATING_ATTRS
+        else:
+            raise ValueError("not a career archive")
+        archive = cls()
+        for s in r.strings():
+            archive._code(s)
+        names = r.strings()
+        archive.names = [names[i] for i in r.unpack(struct.Struct(f"<{rows}I"))]
+        for col in ("team", "position", "season", "years_played"):
+            getattr(archive, col).extend(_i32_array(r.take(4 * rows)).tolist())
+        archive.ratings = _by_name(_i32_array(r.take(4 * rows * len(rating_fields))), rows,
+                                   rating_fields, fs.RATING_ATTRS)
+        archive.stats = _by_name(_i32_array(r.take(4 * rows * len(stat_fields))), rows, stat_fields, fs.STAT_ATTRS)
+        return archive
+
+    def save(self, filename):
+        with open(filename, "wb") as f:
+            f.write(self.dumps())
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename, "rb") as f:
+            return cls.loads(f.read())
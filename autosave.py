@@ -0,0 +1,77 @@
+import threading
+
+import codec
+
+# ============================
+# --- BACKGROUND AUTOSAVE ---
+# ============================
+class Autosaver:
+    """Franchise saves written on a background thread.
+
+    save() only freezes the franchise (codec.freeze: rosters encoded, nothing compressed or
+    written), so the week loop carries on after a stall that grows with the rosters only (the
+    career archive's bytes are reused until the off-season adds to it). The writer thread
+    compresses, fsyncs and swaps the file in atomically. A save requested while a write is in progress replaces
+    any save still waiting, so only the newest state is written next.
+    """
+    def __init__(self, filename="franchise_save.pkl"):
+        self.filename = filename
+        self.saves = 0       # files written
+        self.coalesced = 0   # requested saves superseded before they were written
+        self.error = None
+        self._pending = None
+        self._writing = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def save(self, franchise):
+        frozen = codec.freeze(franchise)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("autosaver is closed")
+            if self._pending is not None:
+                self.coalesced += 1
+            self._pending = frozen
+            self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                frozen, self._pending = self._pending, None
+                self._writing = True
+            try:
+                codec.write_atomic(self.filename, frozen.pack())
+                self.saves += 1
+            except Exception as e:  # surfaced on the main thread by flush()
+                self.error = e
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
+
+    def flush(self):
+        """Block until every requested save is on disk; re-raises a failed write"""
+        with self._cond:
+            while self._pending is not None or self._writing:
+                self._cond.wait()
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def close(self):
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,296 @@
+from array import array
+
+import numpy as np
+
+from football_sim import SIM_COUNTERS, STAT_ATTRS, STAT_INDEX as S, add_game_stats
+
+# Uniform draws used by one batched step (one row per decision in simulate_drive/simulate_play)
+(U_FG_TRY, U_FG_GOOD, U_RB, U_DEF, U_PLAY_TYPE, U_RB_TARGET, U_RECEIVER,
+ U_PRESSURE, U_SACK, U_SACK_YARDS, U_SCRAMBLE_FUMBLE, U_INT, U_INCOMPLETE,
+ U_DROP, U_BIG_PLAY, U_YARDS, U_FUMBLE, U_RECOVERY, U_QB_PRESSURE,
+ U_DEFLECTION) = range(20)
+N_UNIFORMS = 20
+
+def _randint(u, a, b):
+    """Vectorized random.randint(a, b) from uniforms in [0, 1)"""
+    return a + (u * (b - a + 1)).astype(np.int64)
+
+def _pick(table, counts, team, u):
+    """Vectorized random.choice over each team's padded starter list"""
+    return table[team, (u * counts[team]).astype(np.int64)]
+
+def _slots(team):
+    """The starters a game can involve, in slot order: QB, RBs, WRs/TEs, defenders"""
+    return team.qb_starters[:1] + team.rb_starters + team.wr_starters + team.te_starters + team.defense_starters
+
+# ============================
+# --- BATCHED GAMES ---
+# ============================
+class BatchGames:
+    """Advance N games in lockstep, resolving every active game's next play per step.
+
+    Follows the same rules as simulate_play/simulate_drive/simulate_game. Players are
+    (team, slot) pairs, slots as _slots orders them; per-game stats are accumulated in
+    self.stats[game, side, slot] (one column per STAT_ATTRS). stats=False plays for the
+    score only, like simulate_game(..., stats=False), and keeps no per-player arrays.
+    """
+    def __init__(self, matchups, seed=None, stats=True):
+        self.rng = np.random.default_rng(seed)
+        self.matchups = [tuple(m) for m in matchups]
+        n = len(self.matchups)
+
+        # Index teams and their starters so each game only carries small integers
+        self.teams = []
+        team_ids = {}
+        for pair in self.matchups:
+            for team in pair:
+                if id(team) not in team_ids:
+                    team_ids[id(team)] = len(self.teams)
+                    self.teams.append(team)
+        self.slots = [_slots(t) for t in self.teams]
+
+        width = lambda lists: max(1, max(len(x) for x in lists))
+        self.qb = np.zeros(len(self.teams), dtype=np.int64)
+        rbs, receivers, defenders = [], [], []
+        for t in self.teams:
+            first_rec = 1 + len(t.rb_starters)
+            first_dfn = first_rec + len(t.wr_starters) + len(t.te_starters)
+            rbs.append(range(1, first_rec))
+            receivers.append(range(first_rec, first_dfn))
+            defenders.append(range(first_dfn, first_dfn + len(t.defense_starters)))
+        self.rb, self.rb_n = self._pad(rbs, width)
+        self.rec, self.rec_n = self._pad(receivers, width)
+        self.dfn, self.dfn_n = self._pad(defenders, width)
+        self.skill, _ = self._pad([[p.skill for p in slots] for slots in self.slots], width)
+
+        # Per-game state
+        self.side = np.array([[team_ids[id(a)], team_ids[id(b)]] for a, b in self.matchups],
+                             dtype=np.int64).reshape(n, 2)
+        self.score = np.zeros((n, 2), dtype=np.int64)
+        self.possession = np.zeros(n, dtype=np.int64)  # 0 = first team on offense
+        self.drives_left = 2 * self.rng.integers(11, 14, n)
+        self.down = np.zeros(n, dtype=np.int64)
+        self.distance = np.zeros(n, dtype=np.int64)
+        self.yards_to_go = np.zeros(n, dtype=np.int64)
+        self.in_drive = np.zeros(n, dtype=bool)
+        self.active = np.ones(n, dtype=bool)
+        self.winner = np.full(n, -1, dtype=np.int64)
+        self.plays = 0
+
+        self.stats = self.appeared = None
+        if stats:
+            shape = (n, 2, self.skill.shape[1])
+            self.stats = np.zeros(shape + (len(STAT_ATTRS),), dtype=np.int64)
+            self.appeared = np.zeros(shape, dtype=bool)  # had a line in simulate_game's GameStats
+
+    @staticmethod
+    def _pad(lists, width):
+        w = width(lists)
+        table = np.zeros((len(lists), w), dtype=np.int64)
+        counts = np.zeros(len(lists), dtype=np.int64)
+        for i, ids in enumerate(lists):
+            table[i, :len(ids)] = ids
+            counts[i] = len(ids)
+        return table, counts
+
+    # A step runs one play per game, so (game, side, slot) never repeats within a call:
+    # plain fancy indexing is safe where np.add.at would otherwise be needed
+    def _add(self, attr, at, who, mask, values=1):
+        g, side = at
+        values = np.broadcast_to(values, mask.shape)
+        self.stats[g[mask], side[mask], who[mask], S[attr]] += values[mask]
+
+    def _max(self, attr, at, who, mask, values):
+        g, side = at
+        index = (g[mask], side[mask], who[mask], S[attr])
+        self.stats[index] = np.maximum(self.stats[index], values[mask])
+
+    def _end_drives(self, g):
+        """Close drives for game indices g, flip possession and finish completed games"""
+        if not g.size:
+            return
+        self.in_drive[g] = False
+        self.possession[g] ^= 1
+        self.drives_left[g] -= 1
+        done = g[self.drives_left[g] == 0]
+        if not done.size:
+            return
+        self.active[done] = False
+        s = self.score[done]
+        winner = np.where(s[:, 0] > s[:, 1], 0, 1)
+        # Overtime / tie-breaker
+        tied = s[:, 0] == s[:, 1]
+        if tied.any():
+            winner[tied] = self.rng.integers(0, 2, tied.sum())
+            self.score[done[tied], winner[tied]] += 3
+        self.winner[done] = winner
+
+    def step(self):
+        """Resolve one play (or 4th-down decision) for every active game"""
+        rng = self.rng
+
+        # Start a new drive wherever the previous one ended
+        start = np.flatnonzero(self.active & ~self.in_drive)
+        if start.size:
+            self.yards_to_go[start] = 100 - rng.integers(20, 41, start.size)
+            self.down[start] = 1
+            self.distance[start] = 10
+            self.in_drive[start] = True
+
+        g = np.flatnonzero(self.in_drive)
+        if not g.size:
+            return 0
+        u = rng.random((N_UNIFORMS, g.size))
+        poss = self.possession[g]
+        ytg = self.yards_to_go[g]
+        dist = self.distance[g]
+
+        # Handle 4th down BEFORE simulating play
+        fourth = self.down[g] == 4
+        fg = fourth & (ytg <= 40) & (u[U_FG_TRY] < 0.75)
+        made = fg & (u[U_FG_GOOD] < 0.80)
+        self.score[g[made], poss[made]] += 3
+        go = fourth & ~fg & (dist <= 2) & (u[U_FG_GOOD] < 0.30)
+        self._end_drives(g[fourth & ~go])
+
+        play = ~fourth | go
+        g, u, poss, ytg, dist = g[play], u[:, play], poss[play], ytg[play], dist[play]
+        self.plays += g.size
+        if not g.size:
+            return 0
+
+        off = self.side[g, poss]
+        dfn = self.side[g, 1 - poss]
+        skill = self.skill
+        qb = self.qb[off]
+        rb = _pick(self.rb, self.rb_n, off, u[U_RB])
+        dp = _pick(self.dfn, self.dfn_n, dfn, u[U_DEF])
+
+        # Choose play type based on down and distance
+        down = self.down[g]
+        pass_rate = np.where((down == 3) & (dist > 7), 0.75, np.where(dist <= 3, 0.45, 0.6))
+        is_pass = u[U_PLAY_TYPE] < pass_rate
+        is_run = ~is_pass
+
+        # --- Pass play ---
+        rb_target = u[U_RB_TARGET] < 0.30
+        receiver = np.where(rb_target, rb, _pick(self.rec, self.rec_n, off, u[U_RECEIVER]))
+        pressure = is_pass & (u[U_PRESSURE] < 0.08)
+        sack = pressure & (u[U_SACK] < 0.60)
+        scramble = pressure & ~sack
+        scramble_fumble = scramble & (u[U_SCRAMBLE_FUMBLE] < 0.02)
+        intercept = is_pass & ~pressure & (u[U_INT] < 0.025)
+        qb_skill, dp_skill = skill[off, qb], skill[dfn, dp]
+        success_rate = 0.63 + (qb_skill - dp_skill) / 200
+        incomplete = is_pass & ~pressure & ~intercept & (u[U_INCOMPLETE] > success_rate)
+        complete = is_pass & ~pressure & ~intercept & ~incomplete
+
+        yards = np.zeros(g.size, dtype=np.int64)
+        yards = np.where(sack, -_randint(u[U_SACK_YARDS], 3, 8), yards)
+        yards = np.where(scramble, _randint(u[U_SACK_YARDS], 2, 12), yards)
+        big = u[U_BIG_PLAY] < 0.08
+        rec_adj = (skill[off, receiver] - dp_skill) // 20
+        pass_yards = np.where(big, _randint(u[U_YARDS], 20, 75),
+                              np.where(rb_target, _randint(u[U_YARDS], 1, 12), _randint(u[U_YARDS], 3, 18)) + rec_adj)
+        yards = np.where(complete, pass_yards, yards)
+
+        # --- Run play ---
+        big_run = u[U_BIG_PLAY] < 0.05
+        run_yards = np.where(big_run, _randint(u[U_YARDS], 15, 80),
+                             _randint(u[U_YARDS], -2, 10) + (skill[off, rb] - dp_skill) // 20)
+        yards = np.where(is_run, run_yards, yards)
+        fumble = is_run & (u[U_FUMBLE] < 0.015)
+        recovered = fumble & (u[U_RECOVERY] < 0.5)
+
+        turnover = scramble_fumble | intercept | recovered
+        live = ~turnover
+        td = live & (ytg - yards <= 0)
+
+        # --- Player stats (same attribution as simulate_play) ---
+        if self.stats is not None:
+            o, d = (g, poss), (g, 1 - poss)
+            seen = self.appeared
+            seen[g, poss, qb] = seen[g, poss, rb] = seen[g, 1 - poss, dp] = True
+            seen[g[is_pass], poss[is_pass], receiver[is_pass]] = True
+            self._add("pass_attempts", o, qb, is_pass)
+            self._add("rec_targets", o, receiver, is_pass)
+            self._add("sacks_taken", o, qb, sack)
+            self._add("rush_attempts", o, qb, scramble)
+            self._add("rush_yards", o, qb, scramble, yards)
+            self._max("longest_rush", o, qb, scramble, yards)
+            self._add("fumbles", o, qb, scramble_fumble)
+            self._add("interceptions", o, qb, intercept)
+            self._add("interceptions_def", d, dp, intercept)
+            self._add("drops", o, receiver, incomplete & (u[U_DROP] < 0.15))
+            self._add("pass_completions", o, qb, complete)
+            self._add("pass_yards", o, qb, complete, yards)
+            self._add("rec_catches", o, receiver, complete)
+            self._add("rec_yards", o, receiver, complete, yards)
+            self._max("longest_pass", o, qb, complete, yards)
+            self._max("longest_rec", o, receiver, complete, yards)
+            self._add("rush_attempts", o, rb, is_run)
+            self._add("rush_yards", o, rb, is_run, yards)
+            self._max("longest_rush", o, rb, is_run, yards)
+            self._add("fumbles", o, rb, fumble)
+            self._add("forced_fumbles", d, dp, fumble)
+            self._add("fumble_recoveries", d, dp, recovered)
+            self._add("tackles", d, dp, live)
+            self._add("qb_pressure", d, dp, live & (u[U_QB_PRESSURE] < 0.12))
+            self._add("pass_deflections", d, dp, live & is_pass & (u[U_DEFLECTION] < 0.08))
+            self._add("pass_td", o, qb, td & is_pass)
+            self._add("rec_td", o, receiver, td & is_pass)
+            self._add("rush_td", o, rb, td & is_run)
+        self.score[g[td], poss[td]] += 7
+
+        # --- Drive bookkeeping (same as simulate_drive) ---
+        ytg = ytg - yards
+        dist = dist - yards
+        first_down = dist <= 0
+        down = np.where(first_down, 1, down + 1)
+        self.yards_to_go[g] = ytg
+        self.distance[g] = np.where(first_down, 10, dist)
+        self.down[g] = down
+        self._end_drives(g[turnover | (live & (ytg <= 0)) | (down > 4)])
+        return g.size
+
+    def run(self):
+        """Step until every game is final; returns the (n, 2) score array"""
+        while self.active.any():
+            self.step()
+        return self.score
+
+    def results(self):
+        """[(team1, team2, score1, score2)] per game, ties already broken"""
+        return [(team1, team2, s1, s2) for (team1, team2), (s1, s2) in zip(self.matchups, self.score.tolist())]
+
+    def _lines(self, game, side):
+        team = self.side[game, side]
+        stats, seen = self.stats[game, side].tolist(), self.appeared[game, side].tolist()
+        return [(p, array("i", row)) for p, row, s in zip(self.slots[team], stats, seen) if s]
+
+    def lines(self, game, side):
+        """{player name: game stat vector} for one side's players who appeared (stats=True only)"""
+        return {p.name: line for p, line in self._lines(game, side)}
+
+    def apply(self):
+        """Write results back onto the Team and Player objects like simulate_game does"""
+        for i, (team1, team2, s1, s2) in enumerate(self.results()):
+            team1.score, team2.score = s1, s2
+            team1.record_game(s1, s2, s1 > s2)
+            team2.record_game(s2, s1, s2 > s1)
+            if self.stats is not None:
+                for side, team in enumerate((team1, team2)):
+                    lines = self._lines(i, side)
+                    for player, line in lines:
+                        add_game_stats(player.stats, line)
+                    team.last_game_stats = {p.name: line for p, line in lines}
+        SIM_COUNTERS["games"] += len(self.matchups)
+        SIM_COUNTERS["plays"] += self.plays
+
+def simulate_games_batched(matchups, seed=None, apply=True, stats=True):
+    """Simulate a list of (team1, team2) games in lockstep; returns the BatchGames state"""
+    batch = BatchGames(matchups, seed=seed, stats=stats)
+    batch.run()
+    if apply:
+        batch.apply()
+    return batch
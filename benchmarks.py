@@ -0,0 +1,285 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import codec
+import football_sim as fs
+
+# ============================
+# --- FIXED INPUTS ---
+# ============================
+SEED = 1234
+
+def fixed_league(source="excel", seed=SEED):
+    """Same 32 teams every run: Excel rosters, or create_full_roster under a fixed seed"""
+    random.seed(seed)
+    return fs.create_new_league(generated=(source == "generated"))
+
+def fixed_franchise(source="excel", seed=SEED, weeks_played=0):
+    teams = fixed_league(source, seed)
+    franchise = fs.Franchise(teams, teams[0].name)
+    for _ in range(weeks_played):
+        fs.simulate_week(franchise, out=fs.SILENT_OUTPUT)
+        franchise.current_week += 1
+    return franchise
+
+# ============================
+# --- BENCHMARK CASES ---
+# ============================
+# Each case builds its inputs once and returns (op, number): op() is timed `number` times per sample.
+# A case holding resources returns (op, number, teardown); teardown() runs once the case is measured.
+def bench_play(source):
+    teams = fixed_league(source)
+    off, dfn = teams[0], teams[1]
+    return lambda: fs.simulate_play(off, dfn, 1, 10, 75), 2000
+
+def bench_drive(source):
+    teams = fixed_league(source)
+    off, dfn = teams[0], teams[1]
+    return lambda: fs.simulate_drive(off, dfn), 200
+
+def bench_game(source):
+    teams = fixed_league(source)
+    return lambda: fs.simulate_game(teams[0], teams[1], out=fs.SILENT_OUTPUT), 20
+
+def bench_game_scores(source):
+    """Score-only game (stats=False), as projections play them"""
+    teams = fixed_league(source)
+    return lambda: fs.simulate_game(teams[0], teams[1], out=fs.SILENT_OUTPUT, stats=False), 20
+
+def bench_game_drives(source):
+    """Drive-level score-only game: one draw per drive from a prepared DriveModel"""
+    from drive_engine import DriveModel
+    teams = fixed_league(source)
+    drives = DriveModel().prepare(teams[:2])
+    return lambda: fs.simulate_game(teams[0], teams[1], out=fs.SILENT_OUTPUT, stats=False, drives=drives), 200
+
+def bench_game_kernel(source):
+    """Full-stats game through sim_kernel (numba-compiled when installed; compiled before timing)"""
+    import sim_kernel
+    teams = fixed_league(source)
+    seeds = iter(range(1 << 62))
+    sim_kernel.run_kernel(teams[0], teams[1], 0)
+    return lambda: sim_kernel.simulate_game(teams[0], teams[1], out=fs.SILENT_OUTPUT, seed=next(seeds)), 20
+
+def bench_game_kernel_scores(source):
+    """Score-only game on the kernel (sim_kernel.KernelScores), as project_season(engine="kernel") plays them"""
+    import sim_kernel
+    teams = fixed_league(source)
+    drives = sim_kernel.KernelScores()
+    sim_kernel.play_scores(teams[0], teams[1], 0)
+    return lambda: fs.simulate_game(teams[0], teams[1], out=fs.SILENT_OUTPUT, stats=False, drives=drives), 200
+
+def bench_week(source):
+    franchise = fixed_franchise(source)
+    return lambda: fs.simulate_week(franchise, out=fs.SILENT_OUTPUT), 2
+
+def bench_season(source):
+    franchise = fixed_franchise(source)
+    def op():
+        fs.reset_season(franchise)
+        for _ in range(fs.SEASON_GAMES):
+            fs.simulate_week(franchise, out=fs.SILENT_OUTPUT)
+    return op, 1
+
+def bench_playoffs(source):
+    franchise = fixed_franchise(source, weeks_played=fs.SEASON_GAMES)
+    return lambda: fs.run_playoffs(franchise, interactive=False, out=fs.SILENT_OUTPUT), 2
+
+def bench_league(source):
+    return lambda: fs.create_new_league(generated=(source == "generated")), 1
+
+def bench_franchise(source):
+    def op():
+        franchise = fixed_franchise(source)
+        fs.reset_season(franchise)
+        for _ in range(fs.SEASON_GAMES):
+            fs.simulate_week(franchise, out=fs.SILENT_OUTPUT)
+        fs.run_playoffs(franchise, interactive=False, out=fs.SILENT_OUTPUT)
+        fs.run_offseason(franchise, [], out=fs.SILENT_OUTPUT)
+    return op, 1
+
+def bench_save(source):
+    """Blocking save of a mid-season franchise (encode, compress, fsync, rename)"""
+    franchise = fixed_franchise(source, weeks_played=4)
+    path = os.path.join(tempfile.gettempdir(), "football_sim_save_bench.pkl")
+    return lambda: codec.save(franchise, path), 2
+
+def bench_autosave(source):
+    """Main-thread cost of a background autosave (the week loop's stall).
+
+    What's timed is codec.freeze, which still encodes every roster on this thread: O(players),
+    a few ms for 32 teams. The career archive's bytes are reused until it grows. Compression,
+    fsync and the rename finish on the writer thread, which shares the core on one-CPU machines
+    and so shows up in these timings too.
+    """
+    import autosave
+    franchise = fixed_franchise(source, weeks_played=4)
+    saver = autosave.Autosaver(os.path.join(tempfile.gettempdir(), "football_sim_autosave_bench.pkl"))
+    return lambda: saver.save(franchise), 2, saver.close  # close waits for the last write
+
+# Launch-to-menu budget for loading a saved franchise
+STARTUP_TARGET_S = 0.100
+STARTUP_SCRIPT = (
+    "import sys, football_sim as fs\n"
+    "fs.load_franchise(sys.argv[1])\n"
+    "heavy = [m for m in ('pandas', 'prettytable', 'numpy') if m in sys.modules]\n"
+    "sys.exit(f'loaded at startup: {heavy}' if heavy else 0)\n"
+)
+
+def bench_startup(source):
+    """Fresh interpreter: import the simulator and load a save, as the Load Game menu path does"""
+    path = os.path.join(tempfile.gettempdir(), "football_sim_startup_bench.pkl")
+    codec.save(fixed_franchise(source), path)
+    cwd = os.path.dirname(os.path.abspath(fs.__file__))
+    def op():
+        subprocess.run([sys.executable, "-c", STARTUP_SCRIPT, path], cwd=cwd, check=True,
+                       stdout=subprocess.DEVNULL)
+    return op, 1
+
+BENCHMARKS = {
+    "play": bench_play,
+    "drive": bench_drive,
+    "game": bench_game,
+    "game_scores": bench_game_scores,
+    "game_drives": bench_game_drives,
+    "game_kernel": bench_game_kernel,
+    "game_kernel_scores": bench_game_kernel_scores,
+    "week": bench_week,
+    "season": bench_season,
+    "playoffs": bench_playoffs,
+    "league": bench_league,
+    "franchise": bench_franchise,
+    "save": bench_save,
+    "autosave": bench_autosave,
+    "startup": bench_startup,
+}
+
+# ============================
+# --- RUNNER ---
+# ============================
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[k]
+
+def run_benchmark(name, source="excel", samples=15, seed=SEED):
+    """Time one case; returns ops/sec, per-op latency percentiles and peak traced memory"""
+    op, number, *teardown = BENCHMARKS[name](source)
+    try:
+        random.seed(seed)
+        op()  # warm-up
+
+        times = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            for _ in range(number):
+                op()
+            times.append((time.perf_counter() - start) / number)
+
+        # Peak memory is traced separately so tracemalloc overhead stays out of the timings
+        random.seed(seed)
+        tracemalloc.start()
+        op()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        for done in teardown:
+            done()
+
+    total = sum(times)
+    return {
+        "ops_per_sec": len(times) / total if total else 0.0,
+        "mean_s": total / len(times),
+        "p50_s": percentile(times, 50),
+        "p90_s": percentile(times, 90),
+        "p99_s": percentile(times, 99),
+        "samples": samples,
+        "ops_per_sample": number,
+        "peak_memory_kb": peak / 1024,
+    }
+
+def run_suite(names=None, source="excel", samples=15, seed=SEED):
+    results = {
+        "meta": {
+            "source": source,
+            "seed": seed,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+        },
+        "results": {},
+    }
+    for name in names or BENCHMARKS:
+        results["results"][name] = run_benchmark(name, source, samples, seed)
+    return results
+
+def compare(current, baseline, threshold=0.10):
+    """Return a list of (name, old ops/sec, new ops/sec, change) that regressed past threshold"""
+    regressions = []
+    for name, res in current["results"].items():
+        old = baseline.get("results", {}).get(name)
+        if not old or not old["ops_per_sec"]:
+            continue
+        change = res["ops_per_sec"] / old["ops_per_sec"] - 1
+        if change < -threshold:
+            regressions.append((name, old["ops_per_sec"], res["ops_per_sec"], change))
+    return regressions
+
+def print_results(results):
+    print(f"\n{'Benchmark':<12}{'ops/sec':>12}{'p50':>12}{'p90':>12}{'p99':>12}{'peak KB':>12}")
+    print("-" * 72)
+    for name, r in results["results"].items():
+        print(f"{name:<12}{r['ops_per_sec']:>12.1f}{r['p50_s']*1e3:>10.3f}ms{r['p90_s']*1e3:>10.3f}ms"
+              f"{r['p99_s']*1e3:>10.3f}ms{r['peak_memory_kb']:>12.1f}")
+    startup = results["results"].get("startup")
+    if startup:
+        verdict = "OK" if startup["p50_s"] <= STARTUP_TARGET_S else "OVER BUDGET"
+        print(f"\nstartup p50 {startup['p50_s']*1e3:.1f}ms vs {STARTUP_TARGET_S*1e3:.0f}ms target: {verdict}")
+
+# ============================
+# --- CLI ---
+# ============================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulator throughput benchmarks")
+    parser.add_argument("names", nargs="*", help=f"benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument("--source", choices=["excel", "generated"], default="excel",
+                        help="roster source: fake_nfl_rosters.xlsx or create_full_roster")
+    parser.add_argument("--samples", type=int, default=15)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--output", default=None, help="save results as JSON")
+    parser.add_argument("--baseline", default=None, help="JSON results from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed ops/sec drop vs baseline (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+    unknown = [n for n in args.names if n not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    results = run_suite(args.names or None, args.source, args.samples, args.seed)
+    print_results(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSaved results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for name, old, new, change in regressions:
+            print(f"REGRESSION {name}: {old:.1f} -> {new:.1f} ops/sec ({change:+.1%})")
+        if regressions:
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%} vs {args.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+from itertools import chain
+
+import numpy as np
+
+# ============================
+# --- BLOCK RNG ---
+# ============================
+BLOCK_SIZE = 1024  # roughly one game's worth of draws
+
+class BlockRNG:
+    """Per-game random stream: uniforms pre-generated in blocks by a seeded NumPy Generator.
+
+    Covers the part of the random.Random interface the simulator uses (random, randint,
+    choice). random() is a C-level next() over the current block, refilled automatically;
+    integers and picks are derived from those uniforms, so every draw costs one value.
+    """
+    def __init__(self, seed=None, block_size=BLOCK_SIZE):
+        self.generator = np.random.default_rng(seed)
+        self.block_size = block_size
+        self.random = chain.from_iterable(self._blocks()).__next__
+
+    def _blocks(self):
+        generator, n = self.generator, self.block_size
+        while True:
+            yield generator.random(n).tolist()
+
+    def randint(self, a, b):
+        """Integer in [a, b], both ends included"""
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
@@ -0,0 +1,333 @@
+import io
+import os
+import pickle
+import struct
+import sys
+import zlib
+from array import array
+
+import football_sim as fs
+
+# ============================
+# --- FORMAT ---
+# ============================
+# HEADER, u32 length of the zlib'd main body, then one separately zlib'd roster block per team.
+# Main body:
+#   string table   u32 count, then (u16 length + utf-8) per string; every name/position/
+#                  league/division/stat-field string is stored once and referenced by index
+#   schema         u8 count + u32 string index per stat field, then the same for rating fields
+#   franchise      FRANCHISE record (+ u64 base seed with FLAG_SEED, version 3), then a TEAM record per team
+#                  (record + roster block length)
+# Roster block: PLAYER record + ratings + stats (fixed-width i32 vectors in schema order) per
+# player, starter lists as roster indices, and the last game's stat lines.
+# With FLAG_ARCHIVE, a u32 length + CareerArchive bytes (archive.py) follow the roster blocks.
+# Keeping rosters in their own blocks lets load() build teams and standings from the main body
+# and decode a roster only when that team's players are first touched.
+# Readers map stat/rating columns by name, so a save written before a field was added or
+# reordered loads with the new field at its default. Version 1 files kept the rosters inline in
+# the main body (no length prefix); version 2 had no seed field. Flag bits a reader doesn't know
+# mean a layout it can't read, so they are rejected. Files without MAGIC are older pickles.
+MAGIC = b"FSB1"
+CODEC_VERSION = 3
+FLAG_STORE = 1
+FLAG_ARCHIVE = 2
+FLAG_SEED = 4
+KNOWN_FLAGS = FLAG_STORE | FLAG_ARCHIVE | FLAG_SEED
+
+HEADER = struct.Struct("<4sHH")           # magic, version, flags
+FRANCHISE = struct.Struct("<IHHH")        # user team, season, week, team count
+TEAM = struct.Struct("<IIIiiiiiHI")       # name, league, division, score, W, L, PF, PA, players, roster bytes
+TEAM_V1 = struct.Struct("<IIIiiiiiH")
+PLAYER = struct.Struct("<IIHBii")         # name, position, years played, retired, starter rank, pid
+LINE = struct.Struct("<I")                # last-game line: player name
+NONE_STR = 0xFFFFFFFF
+NONE_INT = -2**31
+STARTER_LISTS = ("qb_starters", "rb_starters", "wr_starters", "te_starters", "defense_starters")
+
+def _i32_bytes(values):
+    if sys.byteorder == "little" and isinstance(values, array) and values.typecode == "i":
+        return values.tobytes()
+    vec = array("i", values)
+    if sys.byteorder != "little":
+        vec.byteswap()
+    return vec.tobytes()
+
+def _i32_array(buf):
+    vec = array("i")
+    vec.frombytes(buf)
+    if sys.byteorder != "little":
+        vec.byteswap()
+    return vec
+
+class _Strings:
+    """Interning table: each distinct string is written once"""
+    def __init__(self):
+        self.index = {}
+        self.values = []
+
+    def __call__(self, s):
+        if s is None:
+            return NONE_STR
+        if s not in self.index:
+            self.index[s] = len(self.values)
+            self.values.append(s)
+        return self.index[s]
+
+    def encode(self):
+        parts = [struct.pack("<I", len(self.values))]
+        for s in self.values:
+            data = s.encode("utf-8")
+            parts.append(struct.pack("<H", len(data)))
+            parts.append(data)
+        return b"".join(parts)
+
+# ============================
+# --- ENCODE ---
+# ============================
+def _line_vector(line):
+    """Last-game lines are stat vectors, or name -> value dicts in older saves"""
+    if isinstance(line, dict):
+        return [line.get(attr, 0) for attr in fs.STAT_ATTRS]
+    return line
+
+def _encode_roster(t, s):
+    parts = []
+    roster_index = {}
+    for i, p in enumerate(t.players):
+        roster_index[id(p)] = i
+        parts.append(PLAYER.pack(s(p.name), s(p.position), p.years_played, bool(p.retired),
+                                 NONE_INT if p.starter_rank is None else p.starter_rank,
+                                 NONE_INT if p.pid is None else p.pid))
+        parts.append(_i32_bytes(p.ratings))
+        parts.append(_i32_bytes(p.stats))
+    for attr in STARTER_LISTS:
+        idx = [roster_index[id(p)] for p in getattr(t, attr) if id(p) in roster_index]
+        parts.append(struct.pack(f"<H{len(idx)}H", len(idx), *idx))
+    parts.append(struct.pack("<H", len(t.last_game_stats)))
+    for name, line in t.last_game_stats.items():
+        parts.append(LINE.pack(s(name)) + _i32_bytes(_line_vector(line)))
+    return b"".join(parts)
+
+class Frozen:
+    """A franchise encoded but not yet compressed: built on the caller's thread, packed on any thread"""
+    def __init__(self, flags, main, team_offsets, rosters, archived):
+        self.flags = flags
+        self.main = main
+        self.team_offsets = team_offsets
+        self.rosters = rosters
+        self.archived = archived
+
+    def pack(self):
+        rosters = [zlib.compress(block) for block in self.rosters]
+        main = bytearray(self.main)
+        for offset, roster in zip(self.team_offsets, rosters):
+            struct.pack_into("<I", main, offset + TEAM.size - 4, len(roster))  # roster bytes field
+        main = zlib.compress(main)
+        parts = [HEADER.pack(MAGIC, CODEC_VERSION, self.flags), struct.pack("<I", len(main)), main] + rosters
+        if self.archived is not None:
+            parts += [struct.pack("<I", len(self.archived)), self.archived]
+        return b"".join(parts)
+
+def freeze(franchise):
+    """Copy everything a save needs out of the live franchise (no compression)"""
+    s = _Strings()
+    rosters = [_encode_roster(t, s) for t in franchise.teams]
+    body = []
+    for fields in (fs.STAT_ATTRS, fs.RATING_ATTRS):
+        body.append(struct.pack(f"<B{len(fields)}I", len(fields), *map(s, fields)))
+    body.append(FRANCHISE.pack(s(franchise.user_team_name), franchise.current_season,
+                               franchise.current_week, len(franchise.teams)))
+    seed = getattr(franchise, "seed", None)
+    if seed is not None:
+        body.append(struct.pack("<Q", seed))
+    team_records = []
+    for t in franchise.teams:
+        team_records.append(sum(map(len, body)))
+        body.append(TEAM.pack(s(t.name), s(t.league), s(t.division), t.score, t.wins, t.losses,
+                              t.points_for, t.points_against, len(t.players), 0))
+
+    flags = FLAG_STORE if getattr(franchise, "store", None) is not None else 0
+    if seed is not None:
+        flags |= FLAG_SEED
+    archived = None
+    if getattr(franchise, "archive", None) is not None:
+        flags |= FLAG_ARCHIVE
+        archived = franchise.archive.dumps()
+    strings = s.encode()
+    return Frozen(flags, strings + b"".join(body), [len(strings) + at for at in team_records], rosters, archived)
+
+def dumps(franchise):
+    """Encode a Franchise (teams, rosters, stats, last game lines) as versioned binary"""
+    return freeze(franchise).pack()
+
+# ============================
+# --- DECODE ---
+# ============================
+class _Reader:
+    def __init__(self, buf):
+        self.buf = buf
+        self.pos = 0
+
+    def unpack(self, st):
+        values = st.unpack_from(self.buf, self.pos)
+        self.pos += st.size
+        return values
+
+    def take(self, n):
+        data = self.buf[self.pos:self.pos + n]
+        self.pos += n
+        return data
+
+    def u8(self):
+        self.pos += 1
+        return self.buf[self.pos - 1]
+
+    def u16s(self, n):
+        return self.unpack(struct.Struct(f"<{n}H"))
+
+    def strings(self):
+        (count,) = self.unpack(struct.Struct("<I"))
+        values = []
+        for _ in range(count):
+            (n,) = self.u16s(1)
+            values.append(self.take(n).decode("utf-8"))
+        return values
+
+def _column_map(saved, current):
+    """(saved position, current position) pairs for the fields both layouts share"""
+    index = {name: i for i, name in enumerate(current)}
+    return [(i, index[name]) for i, name in enumerate(saved) if name in index]
+
+def _remap(vec, columns, template):
+    """vec in the saved layout -> array in the current layout (missing fields keep template values)"""
+    if columns is None:
+        return vec
+    out = array("i", template)
+    for src, dst in columns:
+        out[dst] = vec[src]
+    return out
+
+class _Layout:
+    """String table and stat/rating column layout shared by every block of one save"""
+    def __init__(self, r):
+        self.strings = r.strings()
+        schemas = []
+        for current in (fs.STAT_ATTRS, fs.RATING_ATTRS):
+            n = r.u8()
+            saved = [self.strings[i] for i in r.unpack(struct.Struct(f"<{n}I"))]
+            schemas.append((n * 4, None if saved == list(current) else _column_map(saved, current)))
+        (self.stats_size, self.stat_columns), (self.ratings_size, self.rating_columns) = schemas
+
+    def text(self, i):
+        return None if i == NONE_STR else self.strings[i]
+
+    def read_roster(self, r, t, n_players):
+        """Fill t.players, the starter lists and t.last_game_stats from a roster block"""
+        t.players = []
+        for _ in range(n_players):
+            name, position, years_played, retired, starter_rank, pid = r.unpack(PLAYER)
+            p = fs.Player(self.text(name), self.text(position), 0, 0)
+            p.ratings = _remap(_i32_array(r.take(self.ratings_size)), self.rating_columns, p.ratings)
+            p.stats = _remap(_i32_array(r.take(self.stats_size)), self.stat_columns, fs.ZERO_STATS)
+            p.years_played = years_played
+            p.retired = bool(retired)
+            p.starter_rank = None if starter_rank == NONE_INT else starter_rank
+            p.pid = None if pid == NONE_INT else pid
+            t.players.append(p)
+        for attr in STARTER_LISTS:
+            (n,) = r.u16s(1)
+            setattr(t, attr, [t.players[i] for i in r.u16s(n)])
+        t.last_game_stats = {}
+        (n_lines,) = r.u16s(1)
+        for _ in range(n_lines):
+            (name,) = r.unpack(LINE)
+            t.last_game_stats[self.strings[name]] = _remap(_i32_array(r.take(self.stats_size)),
+                                                           self.stat_columns, fs.ZERO_STATS)
+
+def _roster_loader(layout, block, n_players):
+    return lambda t: layout.read_roster(_Reader(zlib.decompress(block)), t, n_players)
+
+def loads(data, lazy=False):
+    """Decode bytes from dumps() into a Franchise.
+
+    With lazy=True, teams, records and standings are built immediately and each team's
+    roster block is decoded the first time its players (or starters/last game) are touched.
+    """
+    magic, version, flags = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a binary franchise save")
+    if version > CODEC_VERSION:
+        raise ValueError(f"save format version {version} is newer than this simulator ({CODEC_VERSION})")
+    if flags & ~KNOWN_FLAGS:
+        raise ValueError(f"save uses unknown format flags {flags & ~KNOWN_FLAGS:#x}")
+
+    if version == 1:
+        r = _Reader(zlib.decompress(data[HEADER.size:]))
+        blocks_at = None
+    else:
+        (main_size,) = struct.unpack_from("<I", data, HEADER.size)
+        start = HEADER.size + 4
+        r = _Reader(zlib.decompress(data[start:start + main_size]))
+        blocks_at = start + main_size
+    layout = _Layout(r)
+
+    user_team, season, week, n_teams = r.unpack(FRANCHISE)
+    seed = r.unpack(struct.Struct("<Q"))[0] if flags & FLAG_SEED else None
+    teams = []
+    for _ in range(n_teams):
+        if version == 1:
+            name, league, division, score, wins, losses, pf, pa, n_players = r.unpack(TEAM_V1)
+        else:
+            name, league, division, score, wins, losses, pf, pa, n_players, size = r.unpack(TEAM)
+        t = fs.Team(layout.text(name))
+        t.league, t.division = layout.text(league), layout.text(division)
+        t.score, t.wins, t.losses, t.points_for, t.points_against = score, wins, losses, pf, pa
+        if version == 1:
+            layout.read_roster(r, t, n_players)  # inline, so it can't be deferred
+        else:
+            block = data[blocks_at:blocks_at + size]
+            blocks_at += size
+            if lazy:
+                t.defer_roster(_roster_loader(layout, block, n_players))
+            else:
+                layout.read_roster(_Reader(zlib.decompress(block)), t, n_players)
+        teams.append(t)
+
+    franchise = fs.Franchise(teams, layout.text(user_team), season, week, seed)
+    if flags & FLAG_ARCHIVE:
+        from archive import CareerArchive
+        (size,) = struct.unpack_from("<I", data, blocks_at)
+        franchise.archive = CareerArchive.loads(data[blocks_at + 4:blocks_at + 4 + size])
+    if flags & FLAG_STORE:
+        franchise.attach_store()
+    return franchise
+
+# ============================
+# --- FILES ---
+# ============================
+class _LegacyUnpickler(pickle.Unpickler):
+    """Saves pickled from `python football_sim.py` name their classes under __main__"""
+    def find_class(self, module, name):
+        if module == "__main__" and hasattr(fs, name):
+            return getattr(fs, name)
+        return super().find_class(module, name)
+
+def write_atomic(filename, data):
+    """Write data aside, fsync it, then swap it in, so a crash leaves the old save or the new one"""
+    tmp = filename + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, filename)
+
+def save(franchise, filename):
+    write_atomic(filename, dumps(franchise))
+
+def load(filename, lazy=True):
+    """Load a binary save (rosters decoded on first touch unless lazy=False), or an older pickle save"""
+    with open(filename, "rb") as f:
+        data = f.read()
+    if data[:len(MAGIC)] == MAGIC:
+        return loads(data, lazy)
+    return _LegacyUnpickler(io.BytesIO(data)).load()
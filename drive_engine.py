@@ -0,0 +1,190 @@
+import numpy as np
+
+import football_sim as fs
+from football_sim import FLAG_FUMBLE_LOST, FLAG_INTERCEPTION, PASS_ODDS, AliasTable, pass_outcomes, run_outcomes
+
+# ============================
+# --- PLAY MIXTURES ---
+# ============================
+# Yards are indexed y - Y_MIN; the tables never produce gains outside [Y_MIN, Y_MAX]
+Y_MIN, Y_MAX = -10, 80
+YARDS = np.arange(Y_MIN, Y_MAX + 1)
+START_YTG = range(60, 81)  # simulate_drive starts at the 20-40 yard line
+
+def _vector(dist):
+    """(flags, yards) -> p as probability per yard of the plays that keep the ball"""
+    vec = np.zeros(len(YARDS))
+    for (flags, yards), p in dist.items():
+        if flags & (FLAG_INTERCEPTION | FLAG_FUMBLE_LOST):
+            continue
+        if not Y_MIN <= yards <= Y_MAX:
+            raise ValueError(f"{yards} yard outcome is outside the drive model's range [{Y_MIN}, {Y_MAX}]")
+        vec[yards - Y_MIN] += p
+    return vec
+
+class _Vectors:
+    """pass_outcomes/run_outcomes as yard vectors, cached by skill differential"""
+    def __init__(self):
+        self.cache = {}
+
+    def passing(self, qb_diff, rec_offset, rb_target):
+        key = (fs.PLAY_PASS, qb_diff, rec_offset, rb_target)
+        if key not in self.cache:
+            self.cache[key] = _vector(pass_outcomes(qb_diff, rec_offset, rb_target))
+        return self.cache[key]
+
+    def running(self, rb_offset):
+        key = (fs.PLAY_RUN, rb_offset)
+        if key not in self.cache:
+            self.cache[key] = _vector(run_outcomes(rb_offset))
+        return self.cache[key]
+
+def play_mixture(offense, defense, vectors):
+    """Yard probabilities of one play per down/distance bucket (turnovers are the missing mass),
+    averaged over the RB, defender and receiver picks simulate_play makes"""
+    qb = offense.qb_starters[0].skill
+    rbs = [p.skill for p in offense.rb_starters]
+    receivers = [p.skill for p in offense.wr_starters + offense.te_starters]
+    defenders = [p.skill for p in defense.defense_starters]
+
+    # Many picks share a skill differential: weigh each distinct table once
+    passing, running = {}, {}
+    for d in defenders:
+        for r in rbs:
+            key = (qb - d, (r - d) // 20, True)
+            passing[key] = passing.get(key, 0.0) + 0.30 / len(rbs)
+            running[(r - d) // 20] = running.get((r - d) // 20, 0.0) + 1.0 / len(rbs)
+        for r in receivers:
+            key = (qb - d, (r - d) // 20, False)
+            passing[key] = passing.get(key, 0.0) + 0.70 / len(receivers)
+    passing = sum(w * vectors.passing(*key) for key, w in passing.items()) / len(defenders)
+    running = sum(w * vectors.running(key) for key, w in running.items()) / len(defenders)
+    return np.array([p * passing + (1 - p) * running for p in PASS_ODDS])
+
+# ============================
+# --- DRIVE MARKOV CHAIN ---
+# ============================
+TD, FG, PLAYS = range(3)  # value columns: P(touchdown), P(field goal), expected plays run
+TOUCHDOWN = np.array([1.0, 0.0, 0.0])
+
+def _buckets(down, distance):
+    """Vectorized fs.down_distance_bucket"""
+    return np.where((down == 3) & (distance > 7), 0, np.where(distance <= 3, 1, 2))
+
+def drive_values(probs):
+    """Exact [P(TD), P(FG), E[plays]] of a drive from 1st & 10 at every yards-to-go up to 80.
+
+    A set of downs that starts at 1st & 10 with Y to go keeps distance - yards_to_go fixed, so
+    its states are (down, t = yards to go). Each play ends in a touchdown, a first down (a new
+    set at least 10 yards closer), the next down of the same set, or the end of the drive
+    (turnover, failed 4th down). Sets starting within 10 yards of each other never reach one
+    another, so ten of them are solved at a time, nearest the goal line first, downs 4..1.
+    """
+    used = np.flatnonzero(probs.any(axis=0))
+    probs, yards = probs[:, used[0]:used[-1] + 1], YARDS[used[0]:used[-1] + 1]
+    loss = max(0, -yards[0])
+    first = np.zeros((START_YTG.stop, 3))  # first[Y]: value of 1st & 10 with Y to go
+    first[0] = TOUCHDOWN
+    # Outcomes are looked up by r = t - yards - Y: below -9 a first down (a set already solved),
+    # from -9 up the next down of this set; anything at or past the goal line is a touchdown
+    gained = np.arange(-9 - yards[-1], -9)
+
+    # Per down, the states' offsets t - Y and a (state, r) transition matrix shared by every set
+    downs = []
+    for down in (4, 3, 2, 1):
+        offset = np.arange(-9, loss * (down - 1) + 1) if down > 1 else np.array([0])
+        distance = offset + 10
+        matrix = np.zeros((len(offset), len(gained) + loss * down + 10))
+        rows = np.arange(len(offset))[:, None]
+        matrix[rows, offset[:, None] - yards[None, :] - gained[0]] = probs[_buckets(down, distance)]
+        downs.append((down, offset, distance, matrix))
+
+    for start in range(1, START_YTG.stop, 10):
+        Y = np.arange(start, min(start + 10, START_YTG.stop))[:, None]
+        following = None
+        for down, offset, distance, matrix in downs:
+            same_set = following if following is not None else np.zeros((len(Y), loss * down + 10, 3))
+            same_set[Y + np.arange(-9, loss * down + 1) <= 0] = TOUCHDOWN
+            value = matrix @ np.concatenate((first[np.maximum(Y + gained, 0)], same_set), axis=1)
+            value[..., PLAYS] += 1.0
+            if down == 4:
+                field_goal = np.where(Y + offset <= 40, 0.75, 0.0)
+                go = (1 - field_goal) * np.where(distance <= 2, 0.30, 0.0)
+                value *= go[..., None]
+                value[..., FG] += 0.80 * field_goal
+            following = value
+        first[Y[:, 0]] = value[:, 0]
+    return first
+
+def drive_outcomes(offense, defense, vectors=None):
+    """(P(TD), P(FG), E[plays]) for one drive of offense against defense, as simulate_drive plays it"""
+    first = drive_values(play_mixture(offense, defense, vectors or _Vectors()))
+    return tuple(first[list(START_YTG)].mean(axis=0))
+
+def game_points(td, fg, possessions):
+    """{points: p} for a team's total over `possessions` independent drives"""
+    drive = np.zeros(8)
+    drive[0], drive[3], drive[7] = max(0.0, 1.0 - td - fg), fg, td
+    total = np.ones(1)
+    for _ in range(possessions):
+        total = np.convolve(total, drive)
+    return {points: p for points, p in enumerate(total.tolist()) if p > 0}
+
+# ============================
+# --- DRIVE-LEVEL GAMES ---
+# ============================
+POSSESSIONS = range(11, 14)  # simulate_game's drives per team
+
+class DriveModel:
+    """Score-only games drawn from exact drive outcomes instead of played down by down.
+
+    Each matchup's drive outcome (TD / FG / nothing) comes from drive_outcomes; drives are
+    independent, so a team's game total over n possessions is one alias draw from their
+    n-fold convolution. Tables are built on first use and stay valid until rosters or ratings
+    change (call clear() after the off-season). Pass it as simulate_game(..., stats=False,
+    drives=model): only scores and records come out, so anything needing player stats or
+    events still runs play by play.
+    """
+    def __init__(self):
+        self.drives = {}  # (offense, defense) -> (P(TD), P(FG), E[plays])
+        self.tables = {}  # (offense, defense, possessions) -> AliasTable of points
+        self._vectors = _Vectors()
+
+    def clear(self):
+        self.drives.clear()
+        self.tables.clear()
+
+    def drive(self, offense, defense):
+        key = (offense.name, defense.name)
+        outcome = self.drives.get(key)
+        if outcome is None:
+            outcome = self.drives[key] = drive_outcomes(offense, defense, self._vectors)
+        return outcome
+
+    def points(self, offense, defense, possessions):
+        key = (offense.name, defense.name, possessions)
+        table = self.tables.get(key)
+        if table is None:
+            td, fg, _ = self.drive(offense, defense)
+            table = self.tables[key] = AliasTable(game_points(td, fg, possessions))
+        return table
+
+    def prepare(self, teams, possessions=POSSESSIONS):
+        """Build every ordered matchup up front (e.g. before shipping the model to worker processes)"""
+        for offense in teams:
+            for defense in teams:
+                if offense is not defense:
+                    for n in possessions:
+                        self.points(offense, defense, n)
+        return self
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_vectors"] = _Vectors()
+        return state
+
+    def play_drives(self, team1, team2, possessions, rng):
+        """Add each team's points over `possessions` drives to its score; returns the expected plays run"""
+        team1.score += self.points(team1, team2, possessions).sample(rng)
+        team2.score += self.points(team2, team1, possessions).sample(rng)
+        return round(possessions * (self.drive(team1, team2)[PLAYS] + self.drive(team2, team1)[PLAYS]))
@@ -0,0 +1,151 @@
+import pickle
+import struct
+
+from football_sim import (FLAG_BIG_PLAY, FLAG_COMPLETE, FLAG_DROP, FLAG_FG_GOOD, FLAG_FUMBLE, FLAG_FUMBLE_LOST,
+                          FLAG_INCOMPLETE, FLAG_INTERCEPTION, FLAG_SACK, FLAG_SCRAMBLE, FLAG_TOUCHDOWN,
+                          PLAY_FIELD_GOAL, PLAY_PUNT, PLAY_RUN)
+
+# ============================
+# --- RECORD LAYOUT ---
+# ============================
+# game id, clock (game seconds elapsed), down, distance, yards to the end zone, play type,
+# offense team id, QB / target-or-carrier / defender player ids (NO_PLAYER if none), yards, flags
+PLAY_EVENT = struct.Struct("<IHBhhBHIIIhH")
+NO_PLAYER = 0xFFFFFFFF
+
+# ============================
+# --- EVENT LOG SINK ---
+# ============================
+class EventLog:
+    """Play-by-play sink: fixed-size records in one bytearray plus team/player name tables.
+
+    Pass it as `events=` to simulate_game/simulate_week. Records stay binary; text is only
+    produced by render().
+    """
+    def __init__(self):
+        self.buffer = bytearray()
+        self.teams = []
+        self.players = []
+        self.games = []  # game id -> [team1 id, team2 id, score1, score2, seed]
+        self._team_ids = {}
+        self._player_ids = {}
+
+    def __len__(self):
+        return len(self.buffer) // PLAY_EVENT.size
+
+    def team_id(self, team):
+        tid = self._team_ids.get(team.name)
+        if tid is None:
+            tid = self._team_ids[team.name] = len(self.teams)
+            self.teams.append(team.name)
+        return tid
+
+    def player_id(self, player):
+        if player is None:
+            return NO_PLAYER
+        pid = self._player_ids.get(player.name)
+        if pid is None:
+            pid = self._player_ids[player.name] = len(self.players)
+            self.players.append(player.name)
+        return pid
+
+    # --- Sink interface (called by the simulator) ---
+    def begin_game(self, team1, team2, seed=None):
+        self.games.append([self.team_id(team1), self.team_id(team2), 0, 0, seed])
+        return len(self.games) - 1
+
+    def end_game(self, game_id, score1, score2):
+        self.games[game_id][2:4] = [score1, score2]
+
+    def play(self, game_id, clock, down, distance, yards_to_go, play_type, offense, qb, target, defender, yards, flags):
+        self.buffer += PLAY_EVENT.pack(game_id, clock, down, distance, yards_to_go, play_type, self.team_id(offense),
+                                       self.player_id(qb), self.player_id(target), self.player_id(defender),
+                                       yards, flags)
+
+    # --- Reading ---
+    def records(self, game_id=None):
+        """Unpacked record tuples (PLAY_EVENT field order), optionally for one game"""
+        for record in PLAY_EVENT.iter_unpack(self.buffer):
+            if game_id is None or record[0] == game_id:
+                yield record
+
+    def render(self, game_id=None):
+        """Commentary lines built from the records on demand"""
+        lines = []
+        for record in self.records(game_id):
+            lines.append(render_play(record, self.teams, self.players))
+        return lines
+
+    def game_plays(self, game_id):
+        """A game's records with team/player ids resolved to names (comparable across logs)"""
+        team = self.teams.__getitem__
+        player = lambda pid: self.players[pid] if pid != NO_PLAYER else None
+        return [record[1:6] + (team(record[6]), player(record[7]), player(record[8]), player(record[9])) + record[10:]
+                for record in self.records(game_id)]
+
+    def find_game(self, seed):
+        """Game id of the game played on this seed, or None"""
+        for game_id, game in enumerate(self.games):
+            if game[4] == seed:
+                return game_id
+        return None
+
+    def save(self, filename):
+        with open(filename, "wb") as f:
+            pickle.dump({"buffer": bytes(self.buffer), "teams": self.teams, "players": self.players,
+                         "games": self.games}, f)
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename, "rb") as f:
+            state = pickle.load(f)
+        log = cls()
+        log.buffer = bytearray(state["buffer"])
+        log.teams, log.players, log.games = state["teams"], state["players"], state["games"]
+        log._team_ids = {name: i for i, name in enumerate(log.teams)}
+        log._player_ids = {name: i for i, name in enumerate(log.players)}
+        return log
+
+    def clear(self):
+        self.buffer.clear()
+        self.games.clear()
+
+def _ordinal_down(down):
+    return {1: "1st", 2: "2nd", 3: "3rd"}.get(down, f"{down}th")
+
+def render_play(record, teams, players):
+    """One line of commentary for a PLAY_EVENT tuple"""
+    game_id, clock, down, distance, yards_to_go, play_type, offense, qb, target, defender, yards, flags = record
+    name = lambda pid: players[pid] if pid != NO_PLAYER else "?"
+    quarter = min(4, clock // (15 * 60) + 1)
+    remaining = max(0, 15 * 60 - (clock - (quarter - 1) * 15 * 60))
+    prefix = (f"Q{quarter} {remaining // 60}:{remaining % 60:02d}  {teams[offense]}  "
+              f"{_ordinal_down(down)} & {distance} at the {yards_to_go}: ")
+
+    if play_type == PLAY_FIELD_GOAL:
+        return prefix + f"{yards}-yard field goal is {'GOOD' if flags & FLAG_FG_GOOD else 'no good'}"
+    if play_type == PLAY_PUNT:
+        return prefix + "punt"
+    if play_type == PLAY_RUN:
+        text = f"{name(target)} runs for {yards} yards"
+        if flags & FLAG_FUMBLE:
+            text += ", FUMBLE" + (f" recovered by {name(defender)}" if flags & FLAG_FUMBLE_LOST else ", offense recovers")
+    elif flags & FLAG_SACK:
+        text = f"{name(qb)} sacked by {name(defender)} for {yards}"
+    elif flags & FLAG_SCRAMBLE:
+        text = f"{name(qb)} scrambles for {yards} yards"
+        if flags & FLAG_FUMBLE:
+            text += ", FUMBLE lost"
+    elif flags & FLAG_INTERCEPTION:
+        text = f"{name(qb)} pass INTERCEPTED by {name(defender)}"
+    elif flags & FLAG_INCOMPLETE:
+        text = f"{name(qb)} pass incomplete to {name(target)}" + (" (dropped)" if flags & FLAG_DROP else "")
+    elif flags & FLAG_COMPLETE:
+        text = f"{name(qb)} pass complete to {name(target)} for {yards} yards"
+    else:
+        text = f"{name(qb)} pass play"
+    if flags & FLAG_BIG_PLAY:
+        text += " (big play)"
+    if flags & FLAG_TOUCHDOWN:
+        text += " TOUCHDOWN"
+    return prefix + text
@@ -1,6 +1,4 @@
-import pandas as pd
 import random
-from prettytable import PrettyTable
 import pickle 
 
 # ============================
@@ -39,94 +37,202 @@ class GameClock:
     def is_half_over(self):
         return self.quarter == 3 and self.time_remaining == 15 * 60
 
+# ============================
+# --- OUTCOME TABLES ---
+# ============================
+# A play's result depends only on the play call and the skill differentials involved, so each
+# (play type, skill differential) gets a precompiled distribution over (result flags, yards),
+# sampled with one alias-method draw. Odds are the ones simulate_play has always used.
+PASS_ODDS = (0.75, 0.45, 0.6)  # pass share by down/distance bucket: 3rd & long, short yardage, other
+
+def down_distance_bucket(down, distance):
+    if down == 3 and distance > 7:
+        return 0
+    if distance <= 3:
+        return 1
+    return 2
+
+class AliasTable:
+    """O(1) draws from a discrete distribution (Vose's alias method)"""
+    __slots__ = ("outcomes", "prob", "alias", "n")
+
+    def __init__(self, weights):
+        self.outcomes = [o for o, w in weights.items() if w > 0]
+        self.n = n = len(self.outcomes)
+        total = sum(weights[o] for o in self.outcomes)
+        scaled = [weights[o] * n / total for o in self.outcomes]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+    def sample(self, rng):
+        u = rng.random() * self.n
+        i = int(u)
+        return self.outcomes[i if u - i < self.prob[i] else self.alias[i]]
+
+    def distribution(self):
+        """{outcome: probability} as encoded by the table (checked by sim_checks.py outcome_tables)"""
+        dist = dict.fromkeys(self.outcomes, 0.0)
+        for i, p in enumerate(self.prob):
+            dist[self.outcomes[i]] += p / self.n
+            dist[self.outcomes[self.alias[i]]] += (1.0 - p) / self.n
+        return dist
+
+def _spread(dist, flags, lo, hi, p, offset=0):
+    """Add probability p spread evenly over yards lo..hi (+ offset)"""
+    share = p / (hi - lo + 1)
+    for yards in range(lo + offset, hi + offset + 1):
+        dist[(flags, yards)] = dist.get((flags, yards), 0.0) + share
+
+def pass_outcomes(qb_diff, rec_offset, rb_target):
+    """(flags, yards) -> probability for a pass; qb_diff = QB - defender skill, rec_offset = receiver edge // 20"""
+    dist = {}
+    _spread(dist, FLAG_SACK, -8, -3, 0.08 * 0.60)
+    _spread(dist, FLAG_SCRAMBLE, 2, 12, 0.08 * 0.40 * 0.98)
+    _spread(dist, FLAG_SCRAMBLE | FLAG_FUMBLE | FLAG_FUMBLE_LOST, 2, 12, 0.08 * 0.40 * 0.02)
+    dist[(FLAG_INTERCEPTION, 0)] = 0.92 * 0.025
+    thrown = 0.92 * 0.975
+    incomplete = min(1.0, max(0.0, 1 - (0.63 + qb_diff / 200)))
+    dist[(FLAG_INCOMPLETE, 0)] = thrown * incomplete * 0.85
+    dist[(FLAG_INCOMPLETE | FLAG_DROP, 0)] = thrown * incomplete * 0.15
+    complete = thrown * (1 - incomplete)
+    _spread(dist, FLAG_COMPLETE | FLAG_BIG_PLAY, 20, 75, complete * 0.08)
+    lo, hi = (1, 12) if rb_target else (3, 18)
+    _spread(dist, FLAG_COMPLETE, lo, hi, complete * 0.92, rec_offset)
+    return dist
+
+def run_outcomes(rb_offset):
+    """(flags, yards) -> probability for a run; rb_offset = (runner - defender skill) // 20"""
+    dist = {}
+    for flags, lo, hi, p, offset in ((FLAG_BIG_PLAY, 15, 80, 0.05, 0), (0, -2, 10, 0.95, rb_offset)):
+        _spread(dist, flags, lo, hi, p * 0.985, offset)
+        _spread(dist, flags | FLAG_FUMBLE, lo, hi, p * 0.015 * 0.5, offset)
+        _spread(dist, flags | FLAG_FUMBLE | FLAG_FUMBLE_LOST, lo, hi, p * 0.015 * 0.5, offset)
+    return dist
+
+class OutcomeTables:
+    """Alias tables by (play type, skill differential), built on first use.
+
+    Tables depend only on the differentials, so they stay valid as ratings change; the
+    off-season clears them so only matchups on current rosters are kept. Caches built from
+    these tables (e.g. sim_kernel's) register in derived and are cleared along with them.
+    """
+    def __init__(self):
+        self.tables = {}
+        self.derived = []
+
+    def passing(self, qb_diff, rec_offset, rb_target):
+        key = (PLAY_PASS, qb_diff, rec_offset, rb_target)
+        table = self.tables.get(key)
+        if table is None:
+            table = self.tables[key] = AliasTable(pass_outcomes(qb_diff, rec_offset, rb_target))
+        return table
+
+    def running(self, rb_offset):
+        key = (PLAY_RUN, rb_offset)
+        table = self.tables.get(key)
+        if table is None:
+            table = self.tables[key] = AliasTable(run_outcomes(rb_offset))
+        return table
+
+    def clear(self):
+        self.tables.clear()
+        for cache in self.derived:
+            cache.clear()
+
+OUTCOME_TABLES = OutcomeTables()
+
 # ============================
 # --- SIMULATE PLAY ---
 # ============================
-def simulate_play(offense, defense, down, distance, yards_to_go):
-    """Simulate a single play and return results"""
-    qb = offense.qb_starters[0]
-    rb = random.choice(offense.rb_starters)
-    def_player = random.choice(defense.defense_starters)
+def simulate_play(offense, defense, down, distance, yards_to_go, box=None, rng=None, stats=True):
+    """Simulate a single play and return results (player stats go to the GameStats box)
+
+    stats=False is the score-only mode (score_play): same outcomes, no player stats, clock or events.
+    """
+    if not stats:
+        return score_play(offense, defense, down, distance, yards_to_go, box or GameStats(rng=rng))
+    if box is None:
+        box = GameStats(rng=rng)
+        try:
+            return simulate_play(offense, defense, down, distance, yards_to_go, box)
+        finally:
+            box.fold()
+    
+    rng = box.rng
+    events = box.events
+    qb = box.line(offense.qb_starters[0])
+    rb = box.line(rng.choice(offense.rb_starters))
+    def_player = box.line(rng.choice(defense.defense_starters))
     
     # Choose play type based on down and distance
-    if down == 3 and distance > 7:
-        play_type = random.choices(["pass", "run"], weights=[0.75, 0.25])[0]
-    elif distance <= 3:
-        play_type = random.choices(["pass", "run"], weights=[0.45, 0.55])[0]
-    else:
-        play_type = random.choices(["pass", "run"], weights=[0.6, 0.4])[0]
+    play_type = "pass" if rng.random() < PASS_ODDS[down_distance_bucket(down, distance)] else "run"
     
     clock_stops = False
-    time_elapsed = 0
-    yards_gained = 0
     
     if play_type == "pass":
         qb.pass_attempts += 1
         
         # Randomly select target - 70% WR/TE, 30% RB
-        if random.random() < 0.30:
+        if rng.random() < 0.30:
             receiver = rb
             is_rb_target = True
         else:
-            receiver = random.choice(offense.wr_starters + offense.te_starters)
+            receiver = box.line(rng.choice(offense.wr_starters + offense.te_starters))
             is_rb_target = False
         
         receiver.rec_targets += 1
         
-        success_rate = 0.63 + (qb.skill - def_player.skill) / 200
+        def_skill = def_player.skill
+        flags, yards_gained = OUTCOME_TABLES.passing(qb.skill - def_skill, (receiver.skill - def_skill) // 20,
+                                                     is_rb_target).sample(rng)
         
-        # Check for sack OR QB scramble
-        if random.random() < 0.08:
-            if random.random() < 0.60:
-                # Sack
-                yards_gained = -random.randint(3, 8)
-                qb.sacks_taken += 1
-                time_elapsed = random.randint(4, 8)
-            else:
-                # QB Scramble
-                yards_gained = random.randint(2, 12)
-                qb.rush_attempts += 1
-                qb.rush_yards += yards_gained
-                if yards_gained > qb.longest_rush:
-                    qb.longest_rush = yards_gained
-                time_elapsed = random.randint(4, 8)
-                
-                # QB could fumble on scramble
-                if random.random() < 0.02:
-                    qb.fumbles += 1
-                    time_elapsed = random.randint(6, 10)
-                    clock_stops = True
-                    return yards_gained, time_elapsed, clock_stops, True  # Turnover
+        if flags & FLAG_SACK:
+            qb.sacks_taken += 1
+            time_elapsed = rng.randint(4, 8)
+        
+        elif flags & FLAG_SCRAMBLE:
+            qb.rush_attempts += 1
+            qb.rush_yards += yards_gained
+            if yards_gained > qb.longest_rush:
+                qb.longest_rush = yards_gained
+            
+            # QB could fumble on scramble
+            if flags & FLAG_FUMBLE:
+                qb.fumbles += 1
+                time_elapsed = rng.randint(6, 10)
+                clock_stops = True
+                if events is not None:
+                    _emit_play(box, offense, down, distance, yards_to_go, PLAY_PASS, qb, qb, def_player, yards_gained,
+                               time_elapsed, flags | FLAG_TURNOVER | FLAG_CLOCK_STOPS)
+                return yards_gained, time_elapsed, clock_stops, True  # Turnover
+            time_elapsed = rng.randint(4, 8)
         
-        # Check for interception
-        elif random.random() < 0.025:
+        elif flags & FLAG_INTERCEPTION:
             qb.interceptions += 1
             def_player.interceptions_def += 1
-            time_elapsed = random.randint(5, 12)
+            time_elapsed = rng.randint(5, 12)
             clock_stops = True
+            if events is not None:
+                _emit_play(box, offense, down, distance, yards_to_go, PLAY_PASS, qb, receiver, def_player, yards_gained,
+                           time_elapsed, FLAG_INTERCEPTION | FLAG_TURNOVER | FLAG_CLOCK_STOPS)
             return yards_gained, time_elapsed, clock_stops, True  # Turnover
         
-        # Incomplete pass
-        elif random.random() > success_rate:
-            yards_gained = 0
-            time_elapsed = random.randint(4, 8)
+        elif flags & FLAG_INCOMPLETE:
+            time_elapsed = rng.randint(4, 8)
             clock_stops = True
-            
-            # Check if it was a drop
-            if random.random() < 0.15:
+            if flags & FLAG_DROP:
                 receiver.drops += 1
         
         # Completed pass
         else:
-            # Check for big play (8% chance)
-            if random.random() < 0.08:
-                yards_gained = random.randint(20, 75)
-            else:
-                if is_rb_target:
-                    yards_gained = random.randint(1, 12) + (receiver.skill - def_player.skill) // 20
-                else:
-                    yards_gained = random.randint(3, 18) + (receiver.skill - def_player.skill) // 20
-            
             qb.pass_completions += 1
             qb.pass_yards += yards_gained
             receiver.rec_catches += 1
@@ -138,42 +244,40 @@ def simulate_play(offense, defense, down, distance, yards_to_go):
                 receiver.longest_rec = yards_gained
             
             # Check if player went out of bounds
-            if random.random() < 0.25:
+            if rng.random() < 0.25:
                 clock_stops = True
             
-            time_elapsed = random.randint(6, 12)
+            time_elapsed = rng.randint(6, 12)
     
     else:  # Run play
         rb.rush_attempts += 1
-        
-        # Check for big run (5% chance)
-        if random.random() < 0.05:
-            yards_gained = random.randint(15, 80)
-        else:
-            yards_gained = random.randint(-2, 10) + (rb.skill - def_player.skill) // 20
+        flags, yards_gained = OUTCOME_TABLES.running((rb.skill - def_player.skill) // 20).sample(rng)
         
         rb.rush_yards += yards_gained
         
         if yards_gained > rb.longest_rush:
             rb.longest_rush = yards_gained
         
-        time_elapsed = random.randint(3, 7)
-        
-        # Check for fumble
-        if random.random() < 0.015:
+        # Fumbles: forced, and lost half the time
+        if flags & FLAG_FUMBLE:
             rb.fumbles += 1
             def_player.forced_fumbles += 1
-            if random.random() < 0.5:
+            if flags & FLAG_FUMBLE_LOST:
                 def_player.fumble_recoveries += 1
-                time_elapsed = random.randint(6, 10)
+                time_elapsed = rng.randint(6, 10)
                 clock_stops = True
+                if events is not None:
+                    _emit_play(box, offense, down, distance, yards_to_go, PLAY_RUN, qb, rb, def_player, yards_gained,
+                               time_elapsed, flags | FLAG_TURNOVER | FLAG_CLOCK_STOPS)
                 return yards_gained, time_elapsed, clock_stops, True  # Turnover
+        
+        time_elapsed = rng.randint(3, 7)
     
     # Defensive stats
     def_player.tackles += 1
-    if random.random() < 0.12:
+    if rng.random() < 0.12:
         def_player.qb_pressure += 1
-    if play_type == "pass" and random.random() < 0.08:
+    if play_type == "pass" and rng.random() < 0.08:
         def_player.pass_deflections += 1
     
     # Check for touchdown
@@ -185,76 +289,181 @@ def simulate_play(offense, defense, down, distance, yards_to_go):
             rb.rush_td += 1
         offense.score += 7
         clock_stops = True
+        flags |= FLAG_TOUCHDOWN
     
+    if events is not None:
+        if play_type == "pass":
+            _emit_play(box, offense, down, distance, yards_to_go, PLAY_PASS, qb, receiver, def_player, yards_gained,
+                       time_elapsed, flags | (FLAG_CLOCK_STOPS if clock_stops else 0))
+        else:
+            _emit_play(box, offense, down, distance, yards_to_go, PLAY_RUN, qb, rb, def_player, yards_gained,
+                       time_elapsed, flags | (FLAG_CLOCK_STOPS if clock_stops else 0))
     return yards_gained, time_elapsed, clock_stops, False
 
+def score_play(offense, defense, down, distance, yards_to_go, box):
+    """simulate_play without player attribution: players are still picked for their skills and the
+    outcome comes from the same tables, but only the score changes. Returns (yards, 0, False, turnover)"""
+    rng = box.rng
+    rb = rng.choice(offense.rb_starters)
+    def_skill = rng.choice(defense.defense_starters).skill
+    if rng.random() < PASS_ODDS[down_distance_bucket(down, distance)]:
+        if rng.random() < 0.30:
+            table = OUTCOME_TABLES.passing(offense.qb_starters[0].skill - def_skill, (rb.skill - def_skill) // 20, True)
+        else:
+            receiver = rng.choice(offense.wr_starters + offense.te_starters)
+            table = OUTCOME_TABLES.passing(offense.qb_starters[0].skill - def_skill,
+                                           (receiver.skill - def_skill) // 20, False)
+    else:
+        table = OUTCOME_TABLES.running((rb.skill - def_skill) // 20)
+    flags, yards_gained = table.sample(rng)
+    if flags & (FLAG_INTERCEPTION | FLAG_FUMBLE_LOST):
+        return yards_gained, 0, False, True
+    if yards_to_go - yards_gained <= 0:
+        offense.score += 7
+    return yards_gained, 0, False, False
+
 # ============================
 # --- SIMULATE DRIVE ---
 # ============================
 # ============================
 # --- IMPORTS ---
 # ============================
+import hashlib
+import os
 import random
 import pickle
-import pandas as pd
-from prettytable import PrettyTable
+import sys
+from array import array
+from bisect import bisect_left
 
 FRANCHISE_LENGTH = 40
 SEASON_GAMES = 17
 
+# ============================
+# --- PLAYER STAT LAYOUT ---
+# ============================
+STAT_ATTRS = [
+    # Passing
+    "pass_attempts","pass_completions","pass_yards","pass_td","interceptions","longest_pass","sacks_taken",
+    # Rushing
+    "rush_attempts","rush_yards","rush_td","longest_rush","fumbles",
+    # Receiving
+    "rec_targets","rec_catches","rec_yards","rec_td","drops","longest_rec",
+    # Defense
+    "tackles","sacks","qb_pressure","interceptions_def","forced_fumbles","fumble_recoveries","pass_deflections"
+]
+STAT_INDEX = {attr: i for i, attr in enumerate(STAT_ATTRS)}
+LONGEST_ATTRS = ("longest_pass", "longest_rush", "longest_rec")
+LONGEST_INDEX = frozenset(STAT_INDEX[attr] for attr in LONGEST_ATTRS)
+ZERO_STATS = array("i", [0] * len(STAT_ATTRS))
+RATING_ATTRS = ("skill", "age", "durability")
+RECORD_ATTRS = ("wins", "losses", "points_for", "points_against")  # Team.record layout
+
+# ============================
+# --- PLAY EVENTS ---
+# ============================
+# Codes and result flags carried by play-by-play records (see GameStats.events / events.py)
+PLAY_RUN, PLAY_PASS, PLAY_FIELD_GOAL, PLAY_PUNT = range(4)
+(FLAG_COMPLETE, FLAG_INCOMPLETE, FLAG_DROP, FLAG_SACK, FLAG_SCRAMBLE, FLAG_INTERCEPTION, FLAG_FUMBLE,
+ FLAG_FUMBLE_LOST, FLAG_TOUCHDOWN, FLAG_BIG_PLAY, FLAG_CLOCK_STOPS, FLAG_TURNOVER, FLAG_FG_GOOD) = (1 << i for i in range(13))
+
+def _emit_play(box, offense, down, distance, yards_to_go, play_type, qb, target, defender, yards, time_elapsed, flags):
+    player = lambda line: line.player if line is not None else None
+    box.events.play(box.game_id, box.clock, down, distance, yards_to_go, play_type, offense,
+                    player(qb), player(target), player(defender), yards, flags)
+    box.clock += time_elapsed
+
+# pandas and prettytable are slow to import and only needed for an Excel re-parse or for
+# table output, so they load on first use and loading a save stays fast.
+def PrettyTable(*args, **kwargs):
+    from prettytable import PrettyTable as _PrettyTable
+    return _PrettyTable(*args, **kwargs)
+
+# ============================
+# --- OUTPUT SINK ---
+# ============================
+SILENT, SUMMARY, FULL = 0, 1, 2
+
+class OutputSink:
+    """Where simulator text goes: lines above the sink's level are dropped, the rest are buffered
+    and written in one go by flush() (per week/season, and before prompts).
+
+    Objects such as tables are only rendered to text when kept, but an f-string is formatted
+    before write() sees it: call sites that run in bulk (per game, per player, per sample)
+    check enabled(level) first so dropped lines cost nothing.
+    """
+    def __init__(self, level=FULL, stream=None):
+        self.level = level
+        self.stream = stream  # None: sys.stdout at flush time
+        self.lines = []
+
+    def enabled(self, level=FULL):
+        return level <= self.level
+
+    def write(self, text="", level=FULL):
+        if level <= self.level:
+            self.lines.append(str(text))  # tables are rendered here, only when kept
+
+    def flush(self):
+        if self.lines:
+            stream = self.stream or sys.stdout
+            stream.write("\n".join(self.lines) + "\n")
+            stream.flush()
+            self.lines.clear()
+
+    def ask(self, prompt):
+        """input() with everything buffered so far shown first"""
+        self.flush()
+        return input(prompt)
+
+OUTPUT = OutputSink()                # interactive default
+SILENT_OUTPUT = OutputSink(SILENT)   # bulk runs
+
 # ============================
 # --- PLAYER CLASS ---
 # ============================
 class Player:
+    # Stats live in one fixed-layout int vector (STAT_ATTRS order) and skill/age/durability
+    # in a second one (RATING_ATTRS order); the named attributes are properties over them.
+    # A LeagueStore can swap both vectors for row views of its league-wide columns.
+    __slots__ = ("name", "position", "years_played", "retired", "starter_rank", "stats", "ratings", "pid")
+    STATE_FIELDS = ("name", "position", "skill", "age", "durability", "years_played", "retired", "starter_rank", "pid")
+
     def __init__(self, name, position, skill, age, durability=95):
         self.name = name
         self.position = position
-        self.skill = skill
-        self.age = age
-        self.durability = durability
+        self.ratings = array("i", [skill, age, durability])
         self.years_played = 0
         self.retired = False
-
-        # Offensive stats
-        self.pass_attempts = 0
-        self.pass_completions = 0
-        self.pass_yards = 0
-        self.pass_td = 0
-        self.interceptions = 0
-        self.longest_pass = 0
-        self.sacks_taken = 0
-
-        self.rush_attempts = 0
-        self.rush_yards = 0
-        self.rush_td = 0
-        self.longest_rush = 0
-        self.fumbles = 0
-
-        self.rec_targets = 0
-        self.rec_catches = 0
-        self.rec_yards = 0
-        self.rec_td = 0
-        self.drops = 0
-        self.longest_rec = 0
-
-        # Defensive stats
-        self.tackles = 0
-        self.sacks = 0
-        self.qb_pressure = 0
-        self.interceptions_def = 0
-        self.forced_fumbles = 0
-        self.fumble_recoveries = 0
-        self.pass_deflections = 0
-
-        self.reset_stats()
+        self.starter_rank = None
+        self.stats = array("i", ZERO_STATS)
+        self.pid = None
 
     def reset_stats(self):
-        attrs = ["pass_attempts","pass_completions","pass_yards","pass_td","interceptions",
-                 "longest_pass","sacks_taken","rush_attempts","rush_yards","rush_td","longest_rush","fumbles",
-                 "rec_targets","rec_catches","rec_yards","rec_td","drops","longest_rec",
-                 "tackles","sacks","qb_pressure","interceptions_def","forced_fumbles","fumble_recoveries","pass_deflections"]
-        for attr in attrs:
-            setattr(self, attr, 0)
+        self.stats[:] = ZERO_STATS
+
+    def snapshot_stats(self):
+        """Copy of the stat vector"""
+        return array("i", self.stats)
+
+    def __getstate__(self):
+        state = {field: getattr(self, field) for field in self.STATE_FIELDS}
+        state["stats"] = [int(v) for v in self.stats]
+        return state
+
+    def __setstate__(self, state):
+        # Older saves pickled every stat as its own attribute in __dict__
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **(state[1] or {})}
+        # Start from constructor defaults so fields added since the save was written exist
+        self.__init__(state.get("name"), state.get("position"), state.get("skill"), state.get("age"))
+        if "stats" in state:
+            self.stats = array("i", state["stats"])
+        for key, value in state.items():
+            if key in STAT_INDEX:
+                self.stats[STAT_INDEX[key]] = value
+            elif key in self.STATE_FIELDS:
+                setattr(self, key, value)
 
     def progress(self):
         if self.retired: return
@@ -267,11 +476,103 @@ class Player:
 
     def should_retire(self):
         return self.age >= 35
+
+def _stat_property(i):
+    def get(self):
+        return self.stats[i]
+    def set(self, value):
+        self.stats[i] = value
+    return property(get, set)
+
+def _rating_property(i):
+    def get(self):
+        return self.ratings[i]
+    def set(self, value):
+        self.ratings[i] = value
+    return property(get, set)
+
+def _record_property(i):
+    def get(self):
+        return self.record[i]
+    def set(self, value):
+        self.record[i] = value
+    return property(get, set)
+
+for _i, _attr in enumerate(STAT_ATTRS):
+    setattr(Player, _attr, _stat_property(_i))
+for _i, _attr in enumerate(RATING_ATTRS):
+    setattr(Player, _attr, _rating_property(_i))
+
+def add_game_stats(season, game):
+    """Add a game's stat vector into season totals (longest_* take the max)"""
+    for i, value in enumerate(game):
+        if value:
+            if i in LONGEST_INDEX:
+                if value > season[i]:
+                    season[i] = value
+            else:
+                season[i] += value
+
+# ============================
+# --- GAME STAT ACCUMULATOR ---
+# ============================
+class StatLine:
+    """One player's stats for a single game; same stat attributes as Player"""
+    __slots__ = ("player", "stats")
+
+    def __init__(self, player):
+        self.player = player
+        self.stats = array("i", ZERO_STATS)
+
+    @property
+    def skill(self):
+        return self.player.skill
+
+for _i, _attr in enumerate(STAT_ATTRS):
+    setattr(StatLine, _attr, _stat_property(_i))
+
+class GameStats:
+    """Per-game accumulator: simulate_play writes here, fold() adds it to season totals once.
+
+    events is an optional play-by-play sink (events.EventLog or anything with the same
+    play() method); with None, the simulator's only cost is an `is not None` check per play.
+    rng is the stream every random draw of the game comes from.
+    """
+    __slots__ = ("lines", "events", "game_id", "clock", "rng")
+
+    def __init__(self, events=None, game_id=0, rng=None):
+        self.lines = {}
+        self.events = events
+        self.game_id = game_id
+        self.rng = rng if rng is not None else random  # the game's random stream (global by default)
+        self.clock = 0  # game seconds elapsed, advanced only while events are recorded
+
+    def line(self, player):
+        line = self.lines.get(player)
+        if line is None:
+            line = self.lines[player] = StatLine(player)
+        return line
+
+    def fold(self):
+        for player, line in self.lines.items():
+            add_game_stats(player.stats, line.stats)
+
+    def team_lines(self, team):
+        """{player name: game stat vector} for the team's players who appeared"""
+        lines = self.lines
+        return {p.name: lines[p].stats for p in team.players if p in lines}
     
 # ============================
 # --- TEAM CLASS ---
 # ============================
 class Team:
+    # wins/losses/points_for/points_against are properties over one int vector (RECORD_ATTRS
+    # order), which a LeagueStore can swap for a row view of its records column
+    standings = None  # StandingsIndex kept up to date by record_game (older saves lack the attribute)
+    roster_loader = None  # set by defer_roster() until the roster is first touched
+    ROSTER_FIELDS = ("players", "qb_starters", "rb_starters", "wr_starters", "te_starters",
+                     "defense_starters", "last_game_stats")
+
     def __init__(self, name):
         self.name = name
         self.players = []
@@ -281,14 +582,29 @@ class Team:
         self.te_starters = []
         self.defense_starters = []
         self.score = 0
-        self.wins = 0
-        self.losses = 0
-        self.points_for = 0
-        self.points_against = 0
+        self.record = array("i", [0] * len(RECORD_ATTRS))
         self.league = None
         self.division = None
         self.last_game_stats = {}
 
+    def defer_roster(self, loader):
+        """Drop the roster fields until first access; loader(team) then fills them in"""
+        for field in self.ROSTER_FIELDS:
+            self.__dict__.pop(field, None)
+        self.roster_loader = loader
+
+    def load_roster(self):
+        loader = self.__dict__.pop("roster_loader", None)
+        if loader is not None:
+            loader(self)
+
+    def __getattr__(self, name):
+        # Only reached when normal lookup fails, i.e. a deferred roster field
+        if name in self.ROSTER_FIELDS and "roster_loader" in self.__dict__:
+            self.load_roster()
+            return getattr(self, name)
+        raise AttributeError(name)
+
     def reset_score(self):
         self.score = 0
 
@@ -296,40 +612,289 @@ class Team:
         for p in self.players:
             p.reset_stats()
 
+    def record_game(self, points_for, points_against, won):
+        """Add a game result to the season record and the standings index"""
+        self.points_for += points_for
+        self.points_against += points_against
+        if won:
+            self.wins += 1
+        else:
+            self.losses += 1
+        if self.standings is not None:
+            self.standings.update(self)
+
+    def __getstate__(self):
+        self.load_roster()
+        state = self.__dict__.copy()
+        state.pop("standings", None)  # rebuilt by Franchise on load
+        state["record"] = [int(v) for v in self.record]
+        return state
+
+    def __setstate__(self, state):
+        # Older saves kept each record field as its own attribute
+        state = dict(state)
+        record = [state.pop(attr, 0) for attr in RECORD_ATTRS]
+        self.__dict__.update(state)
+        self.record = array("i", state.get("record", record))
+
+for _i, _attr in enumerate(RECORD_ATTRS):
+    setattr(Team, _attr, _record_property(_i))
+
+# ============================
+# --- STANDINGS INDEX ---
+# ============================
+def standings_key(team):
+    return (team.wins, team.points_for - team.points_against)
+
+class RankedList:
+    """Teams kept in order by key (best first). A result moves only the changed team: its old
+    entry is bisected out of the sorted keys and its new one bisected in, so an update is
+    O(log N) comparisons plus one list shift, and rank lookups bisect without sorting.
+    Ties keep insertion order."""
+    def __init__(self, teams, key):
+        self.key = key
+        self.tiebreak = {}
+        self._teams = list(teams)
+        for i, t in enumerate(self._teams):
+            self.tiebreak[t] = -i
+        self.rebuild()
+
+    def _sort_key(self, team):
+        return (self.key(team), self.tiebreak[team])
+
+    def rebuild(self):
+        # Stored worst first, so the sort keys ascend for bisect
+        self.sort_keys = {t: self._sort_key(t) for t in self._teams}
+        self._teams.sort(key=self.sort_keys.__getitem__)
+        self._keys = [self.sort_keys[t] for t in self._teams]
+
+    def update(self, team):
+        keys, teams = self._keys, self._teams
+        i = bisect_left(keys, self.sort_keys[team])
+        del keys[i], teams[i]
+        k = self.sort_keys[team] = self._sort_key(team)
+        i = bisect_left(keys, k)
+        keys.insert(i, k)
+        teams.insert(i, team)
+
+    @property
+    def order(self):
+        return self._teams[::-1]
+
+    def first(self):
+        return self._teams[-1]
+
+    def rank(self, team):
+        return len(self._keys) - bisect_left(self._keys, self.sort_keys[team])
+
+    def __iter__(self):
+        return reversed(self._teams)
+
+    def __len__(self):
+        return len(self._teams)
+
+class StandingsIndex:
+    """Division, conference, league, offense and defense orderings maintained incrementally"""
+    def __init__(self, teams):
+        self.teams = list(teams)
+        self.table = RankedList(self.teams, standings_key)
+        self.offense = RankedList(self.teams, lambda t: t.points_for)
+        self.defense = RankedList(self.teams, lambda t: -t.points_against)
+        self.conferences = {}
+        self.divisions = {}
+        for t in self.teams:
+            self.conferences.setdefault(t.league, []).append(t)
+            self.divisions.setdefault((t.league, t.division), []).append(t)
+        self.conferences = {c: RankedList(ts, standings_key) for c, ts in self.conferences.items()}
+        self.divisions = {d: RankedList(ts, standings_key) for d, ts in self.divisions.items()}
+        for t in self.teams:
+            t.standings = self
+
+    def _lists(self, team):
+        return (self.table, self.offense, self.defense,
+                self.conferences[team.league], self.divisions[(team.league, team.division)])
+
+    def update(self, team):
+        for ranked in self._lists(team):
+            ranked.update(team)
+
+    def rebuild(self):
+        """Re-sort everything (after records were reset or edited in bulk)"""
+        for ranked in (self.table, self.offense, self.defense, *self.conferences.values(), *self.divisions.values()):
+            ranked.rebuild()
+
+    def division_rank(self, team):
+        return self.divisions[(team.league, team.division)].rank(team)
+
+    def offense_rank(self, team):
+        return self.offense.rank(team)
+
+    def defense_rank(self, team):
+        return self.defense.rank(team)
+
+    def division_standings(self, league, division):
+        return list(self.divisions[(league, division)])
+
+    def division_winners(self, league):
+        winners = [d.first() for (lg, _), d in self.divisions.items() if lg == league]
+        winners.sort(key=self.conferences[league].rank)
+        return winners
+
+    def conference_seeds(self, league, wild_cards=3):
+        """Division winners plus the best non-winners, seeded by record"""
+        winners = set(d.first() for (lg, _), d in self.divisions.items() if lg == league)
+        seeds, wc = [], 0
+        for t in self.conferences[league]:
+            if t in winners:
+                seeds.append(t)
+            elif wc < wild_cards:
+                seeds.append(t)
+                wc += 1
+            if len(seeds) == len(winners) + wild_cards:
+                break
+        return seeds
+
+    def covers(self, teams):
+        """True if teams is this index's whole league"""
+        return bool(teams) and teams[0].standings is self and len(teams) == len(self.table)
+
+    def is_conference(self, teams):
+        """True if teams is one of this index's conferences"""
+        return (bool(teams) and teams[0].standings is self and len(self.conferences) > 1
+                and len(teams) == len(self.conferences[teams[0].league]))
+
 # ============================
 # --- FRANCHISE CLASS ---
 # ============================
 class Franchise:
-    def __init__(self, teams, user_team_name, current_season=1, current_week=1):
+    archive = None  # archive.CareerArchive of retired players, created by compact_rosters
+    seed = None  # base seed for per-game RNG streams (None: the global random module)
+
+    def __init__(self, teams, user_team_name, current_season=1, current_week=1, seed=None, store=False):
         self.teams = teams
         self.user_team_name = user_team_name
+        self.seed = None if seed is None else seed & 0xFFFFFFFFFFFFFFFF  # saves store it as a u64
         self.current_season = current_season
         self.current_week = current_week
+        self.store = None  # LeagueStore, opt-in: see attach_store
+        self.standings = StandingsIndex(teams)
+        if store:
+            self.attach_store()
+
+    def attach_store(self):
+        """Back every player's stats/ratings and every team's record with one LeagueStore.
+
+        Opt-in (Franchise(..., store=True), headless --store) because the store needs NumPy,
+        which the interactive game otherwise never loads. Saves of a franchise with a store
+        attach one again on load; reset_season and compact_rosters keep it current.
+        """
+        from league_store import LeagueStore
+        self.store = LeagueStore.from_teams(self.teams)
+        return self.store
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("standings", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.standings = StandingsIndex(self.teams)
 
 # ============================
 # --- LOAD ROSTERS FROM EXCEL ---
 # ============================
-import pandas as pd
-
-def load_rosters_from_excel(filename="fake_nfl_rosters.xlsx"):
+ROSTER_CACHE_VERSION = 1
+_ROSTER_MEMO = {}
+
+def roster_cache_path(filename):
+    """Binary roster cache kept next to the workbook"""
+    return filename + ".cache"
+
+def _file_digest(filename):
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _parse_roster_columns(filename):
+    """Read the workbook once and convert it column-wise (no per-row pandas access)"""
+    import pandas as pd  # only needed when the roster cache is cold
     df = pd.read_excel(filename)
     df.columns = df.columns.str.strip()  # remove extra spaces
-
-    teams = {}
-    for _, row in df.iterrows():
-        player = Player(
-            name=row["Player Name"],
-            position=row["Position"],
-            skill=row["Skill"],
-            age=row["Age"],
-        )
-        # Optional attributes
-        player.durability = row.get("Durability", 100)
-        player.starter_rank = row.get("Starter Rank", 1)
-
-        team_name = row["Team"]
-        if team_name not in teams:
-            teams[team_name] = []
+    if "Durability" not in df:
+        df["Durability"] = 100
+    if "Starter Rank" not in df:
+        df["Starter Rank"] = 1
+
+    team_names, team_codes = pd.factorize(df["Team"])
+    positions, position_codes = pd.factorize(df["Position"])
+    return {
+        "teams": list(team_codes),
+        "team": array("h", team_names.tolist()),
+        "name": df["Player Name"].tolist(),
+        "positions": list(position_codes),
+        "position": array("b", positions.tolist()),
+        "skill": array("i", df["Skill"].astype(int).tolist()),
+        "age": array("i", df["Age"].astype(int).tolist()),
+        "durability": array("i", df["Durability"].fillna(100).astype(int).tolist()),
+        "starter_rank": array("i", df["Starter Rank"].fillna(1).astype(int).tolist()),
+    }
+
+def load_roster_columns(filename="fake_nfl_rosters.xlsx", cache=True):
+    """Roster columns for a workbook, parsed at most once per file version.
+
+    The parsed columns are memoized in-process and written to roster_cache_path(filename).
+    The cache is trusted while the workbook's mtime and size match; otherwise the workbook's
+    sha256 is compared, and only a changed hash forces a re-parse.
+    """
+    st = os.stat(filename)
+    key = (os.path.abspath(filename), st.st_mtime_ns, st.st_size)
+    if key in _ROSTER_MEMO:
+        return _ROSTER_MEMO[key]
+
+    cache_file = roster_cache_path(filename)
+    header = None
+    if cache:
+        try:
+            with open(cache_file, "rb") as f:
+                header = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            header = None
+        if header is not None and header.get("version") != ROSTER_CACHE_VERSION:
+            header = None
+
+    columns = None
+    if header is not None and (header["mtime_ns"], header["size"]) == (st.st_mtime_ns, st.st_size):
+        columns = header["columns"]
+    else:
+        digest = _file_digest(filename)
+        if header is not None and header["sha256"] == digest:
+            columns = header["columns"]  # touched but unchanged
+        else:
+            columns = _parse_roster_columns(filename)
+        if cache:
+            try:
+                with open(cache_file, "wb") as f:
+                    pickle.dump({"version": ROSTER_CACHE_VERSION, "mtime_ns": st.st_mtime_ns, "size": st.st_size,
+                                 "sha256": digest, "columns": columns}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except OSError:
+                pass  # read-only location; the in-process memo still applies
+
+    _ROSTER_MEMO[key] = columns
+    return columns
+
+def load_rosters_from_excel(filename="fake_nfl_rosters.xlsx", cache=True):
+    """Fresh Player objects for every team in the workbook, split by the Team column"""
+    c = load_roster_columns(filename, cache)
+    teams = {name: [] for name in c["teams"]}
+    team_names = [c["teams"][i] for i in c["team"]]
+    positions = [c["positions"][i] for i in c["position"]]
+    for team_name, name, position, skill, age, durability, starter_rank in zip(
+            team_names, c["name"], positions, c["skill"], c["age"], c["durability"], c["starter_rank"]):
+        player = Player(name, position, skill, age, durability)
+        player.starter_rank = starter_rank
         teams[team_name].append(player)
 
     return teams  # dict: {team_name: [Player, Player, ...]}
@@ -378,53 +943,72 @@ def create_new_league():
 # ============================
 # --- INJURY CHECK FUNCTION ---
 # ============================
-def check_injury(player):
+def check_injury(player, rng=random):
+    # rng: the game's stream (a BlockRNG for seeded games), the global random module otherwise
     # Injuries are rare: 1 in 1000 chance per play * (100 - durability) factor
     chance = (100 - player.durability) / 100000
-    if random.random() < chance:
+    if rng.random() < chance:
         return True
     return False
 
 # ============================
 # --- SIMULATE DRIVE ---
 # ============================
-def simulate_drive(offense, defense):
-    """Simulate a full drive with multiple plays until TD, turnover, or punt"""
+def simulate_drive(offense, defense, box=None, rng=None, stats=True):
+    """Simulate a full drive with multiple plays until TD, turnover, or punt; returns plays run"""
+    if box is None:
+        box = GameStats(rng=rng)
+        try:
+            return simulate_drive(offense, defense, box, stats=stats)
+        finally:
+            box.fold()
+    
+    rng = box.rng
+    play = simulate_play if stats else score_play
     qb = offense.qb_starters[0]
     rb = offense.rb_starters[0]
     
     # Random starting field position (20-40 yard line typically)
-    starting_position = random.randint(20, 40)
+    starting_position = rng.randint(20, 40)
     yards_to_go = 100 - starting_position  # Distance to end zone
     
     down = 1
     distance = 10
+    plays = 0
     
     while yards_to_go > 0:
         # Handle 4th down BEFORE simulating play
         if down == 4:
             # Field goal attempt
-            if yards_to_go <= 40 and random.random() < 0.75:
+            if yards_to_go <= 40 and rng.random() < 0.75:
                 fg_distance = yards_to_go + 17
-                if random.random() < 0.80:
+                good = rng.random() < 0.80
+                if good:
                     offense.score += 3
-                return
+                if box.events is not None:
+                    _emit_play(box, offense, down, distance, yards_to_go, PLAY_FIELD_GOAL, None, None, None,
+                               fg_distance, 5, FLAG_FG_GOOD if good else 0)
+                return plays
             
             # Go for it on short yardage
-            elif distance <= 2 and random.random() < 0.30:
+            elif distance <= 2 and rng.random() < 0.30:
                 pass  # Continue to simulate play
             else:
                 # Punt
-                return
+                if box.events is not None:
+                    _emit_play(box, offense, down, distance, yards_to_go, PLAY_PUNT, None, None, None, 0, 8, 0)
+                return plays
         
         # Simulate the play
-        yards_gained, time_elapsed, clock_stops, is_turnover = simulate_play(
-            offense, defense, down, distance, yards_to_go
+        yards_gained, time_elapsed, clock_stops, is_turnover = play(
+            offense, defense, down, distance, yards_to_go, box
         )
         
+        plays += 1
+        
         # Handle turnovers
         if is_turnover:
-            return
+            return plays
         
         # Update field position
         yards_to_go -= yards_gained
@@ -432,7 +1016,7 @@ def simulate_drive(offense, defense):
         
         # Check for touchdown
         if yards_to_go <= 0:
-            return
+            return plays
         
         # Update downs
         if distance <= 0:
@@ -443,55 +1027,56 @@ def simulate_drive(offense, defense):
         
         # Safety check
         if down > 4:
-            return
+            return plays
+    
+    return plays
 
 # ============================
 # --- SIMULATE GAME ---
 # ============================
-STAT_ATTRS = [
-    # Passing
-    "pass_attempts","pass_completions","pass_yards","pass_td","interceptions","longest_pass","sacks_taken",
-    # Rushing
-    "rush_attempts","rush_yards","rush_td","longest_rush","fumbles",
-    # Receiving
-    "rec_targets","rec_catches","rec_yards","rec_td","drops","longest_rec",
-    # Defense
-    "tackles","sacks","qb_pressure","interceptions_def","forced_fumbles","fumble_recoveries","pass_deflections"
-]
-
-def _snapshot_player_stats(players):
-    snap = {}
-    for p in players:
-        snap[p.name] = {attr: getattr(p, attr, 0) for attr in STAT_ATTRS}
-    return snap
-
-def _compute_delta_and_store(team, before_snap, after_players):
-    deltas = {}
-    for p in after_players:
-        name = p.name
-        before = before_snap.get(name, {attr:0 for attr in STAT_ATTRS})
-        delta = {}
-        for attr in STAT_ATTRS:
-            after_val = getattr(p, attr, 0)
-            delta[attr] = after_val - before.get(attr, 0)
-        deltas[name] = delta
-    team.last_game_stats = deltas
-
-def simulate_game(team1, team2, user_team=None):
-    # Take snapshots BEFORE the game (season totals before)
-    before_team1 = _snapshot_player_stats(team1.players)
-    before_team2 = _snapshot_player_stats(team2.players)
-
-    # Do NOT reset player season stats here — we want them to accumulate.
+def game_seed(base_seed, season, week, game_index):
+    """Stable 64-bit seed for one game (or a week's pairing), independent of play order and workers"""
+    key = f"{base_seed}:{season}:{week}:{game_index}".encode()
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], "little")
+
+def game_rng(seed):
+    """The random stream a seeded game draws from (block_rng.BlockRNG; numpy loads on first use)"""
+    from block_rng import BlockRNG
+    return BlockRNG(seed)
+
+# Running totals for throughput reporting (headless runs, benchmarks)
+SIM_COUNTERS = {"games": 0, "plays": 0}
+
+def simulate_game(team1, team2, user_team=None, out=None, events=None, seed=None, rng=None, stats=True,
+                  drives=None):
+    """Play one game; with seed (or an explicit rng) every draw comes from that stream, so it can be replayed.
+
+    stats=False plays for the score only: records and standings update as usual, but no player
+    stats are kept (last game lines are left as they were) and no events are recorded.
+    With stats=False, a drive_engine.DriveModel as drives draws each drive's points whole
+    instead of playing it down by down.
+    """
+    if not stats and events is not None:
+        raise ValueError("events need player attribution; record them with stats=True")
+    if rng is None:
+        rng = game_rng(seed) if seed is not None else random
+    # Plays write into a per-game accumulator that is folded into season totals at the end
+    box = GameStats(events, events.begin_game(team1, team2, seed) if events is not None else 0, rng)
     team1.score = 0
     team2.score = 0
 
     # Number of drives per team (simulates possessions)
-    drives_per_team = random.randint(11, 13)
+    drives_per_team = rng.randint(11, 13)
 
-    for _ in range(drives_per_team):
-        simulate_drive(team1, team2)
-        simulate_drive(team2, team1)
+    plays = 0
+    if drives is not None and not stats:
+        plays = drives.play_drives(team1, team2, drives_per_team, rng)
+    else:
+        for _ in range(drives_per_team):
+            plays += simulate_drive(team1, team2, box, stats=stats)
+            plays += simulate_drive(team2, team1, box, stats=stats)
+    SIM_COUNTERS["games"] += 1
+    SIM_COUNTERS["plays"] += plays
 
     # Determine winner
     if team1.score > team2.score:
@@ -500,29 +1085,26 @@ def simulate_game(team1, team2, user_team=None):
         winner = team2
     else:
         # Overtime / tie-breaker
-        winner = random.choice([team1, team2])
+        winner = rng.choice([team1, team2])
         winner.score += 3
 
+    if events is not None:
+        events.end_game(box.game_id, team1.score, team2.score)
+
     # Update team season aggregates
-    team1.points_for += team1.score
-    team1.points_against += team2.score
-    team2.points_for += team2.score
-    team2.points_against += team1.score
-
-    if winner == team1:
-        team1.wins += 1
-        team2.losses += 1
-    else:
-        team2.wins += 1
-        team1.losses += 1
+    team1.record_game(team1.score, team2.score, winner == team1)
+    team2.record_game(team2.score, team1.score, winner == team2)
 
-    # Compute per-player deltas (last game's stats) and store on the team
-    _compute_delta_and_store(team1, before_team1, team1.players)
-    _compute_delta_and_store(team2, before_team2, team2.players)
+    # Add the game into season totals and keep it as each team's last game
+    if stats:
+        box.fold()
+        team1.last_game_stats = box.team_lines(team1)
+        team2.last_game_stats = box.team_lines(team2)
 
-    # Print result only if user team involved (or no user specified)
-    if user_team is None or user_team in [team1.name, team2.name]:
-        print(f"{team1.name} {team1.score} - {team2.name} {team2.score}")
+    # Report result only if user team involved (or no user specified)
+    out = out or OUTPUT
+    if out.enabled(SUMMARY) and (user_team is None or user_team in [team1.name, team2.name]):
+        out.write(f"{team1.name} {team1.score} - {team2.name} {team2.score}", SUMMARY)
 
     return winner
 
@@ -532,6 +1114,10 @@ def simulate_game(team1, team2, user_team=None):
 # ============================
 def get_team_summary(team, all_teams):
     """Get team record, division standing, and league ranks"""
+    index = team.standings
+    if index is not None and index.covers(all_teams):
+        return index.division_rank(team), index.offense_rank(team), index.defense_rank(team)
+    
     # Get division teams
     div_teams = [t for t in all_teams if t.league == team.league and t.division == team.division]
     div_teams_sorted = sorted(div_teams, key=lambda t: (t.wins, t.points_for - t.points_against), reverse=True)
@@ -547,18 +1133,21 @@ def get_team_summary(team, all_teams):
     
     return div_rank, offense_rank, defense_rank
 
-def print_team_summary(team, all_teams):
+def print_team_summary(team, all_teams, out=None):
     """Print summary of team's current season"""
+    out = out or OUTPUT
+    if not out.enabled(SUMMARY):
+        return
     div_rank, offense_rank, defense_rank = get_team_summary(team, all_teams)
     
-    print(f"\n{'='*70}")
-    print(f"{'YOUR TEAM: ' + team.name:^70}")
-    print(f"{'='*70}")
-    print(f"Record: {team.wins}-{team.losses} | {team.league} {team.division} | {div_rank}{get_ordinal(div_rank)} in Division")
-    print(f"Points For: {team.points_for} (Rank: {offense_rank}{get_ordinal(offense_rank)})")
-    print(f"Points Against: {team.points_against} (Rank: {defense_rank}{get_ordinal(defense_rank)})")
-    print(f"Point Differential: {team.points_for - team.points_against:+d}")
-    print(f"{'='*70}\n")
+    out.write(f"\n{'='*70}", SUMMARY)
+    out.write(f"{'YOUR TEAM: ' + team.name:^70}", SUMMARY)
+    out.write(f"{'='*70}", SUMMARY)
+    out.write(f"Record: {team.wins}-{team.losses} | {team.league} {team.division} | {div_rank}{get_ordinal(div_rank)} in Division", SUMMARY)
+    out.write(f"Points For: {team.points_for} (Rank: {offense_rank}{get_ordinal(offense_rank)})", SUMMARY)
+    out.write(f"Points Against: {team.points_against} (Rank: {defense_rank}{get_ordinal(defense_rank)})", SUMMARY)
+    out.write(f"Point Differential: {team.points_for - team.points_against:+d}", SUMMARY)
+    out.write(f"{'='*70}\n", SUMMARY)
 
 def get_ordinal(n):
     """Return ordinal suffix for a number (1st, 2nd, 3rd, etc.)"""
@@ -569,10 +1158,13 @@ def get_ordinal(n):
 # ============================
 # --- VIEW TEAM STATS ---
 # ============================
-def print_team_stats(team, games_played):
-    print(f"\n=== SEASON STATS (Through {games_played} Games) ===")
+def print_team_stats(team, games_played, out=None):
+    out = out or OUTPUT
+    if not out.enabled(FULL):
+        return
+    out.write(f"\n=== SEASON STATS (Through {games_played} Games) ===")
     
-    print("\n=== Passing Leaders ===")
+    out.write("\n=== Passing Leaders ===")
     table = PrettyTable()
     table.field_names = ["Name","Comp","Att","Comp%","Yards","TD","INT","Y/A","YPG","Long","Sacks"]
     qbs = sorted(team.qb_starters,key=lambda x:x.pass_yards,reverse=True)
@@ -582,9 +1174,9 @@ def print_team_stats(team, games_played):
         ypg = qb.pass_yards/games_played if games_played > 0 else 0
         table.add_row([qb.name,qb.pass_completions,qb.pass_attempts,round(comp_pct,1),qb.pass_yards,
                        qb.pass_td,qb.interceptions,round(ypa,1),round(ypg,1),qb.longest_pass,qb.sacks_taken])
-    print(table)
+    out.write(table)
 
-    print("\n=== Rushing Leaders ===")
+    out.write("\n=== Rushing Leaders ===")
     table = PrettyTable()
     table.field_names = ["Name","Att","Yards","TD","Y/A","YPG","Long","Fum"]
     # Include QBs and RBs
@@ -597,9 +1189,9 @@ def print_team_stats(team, games_played):
         ya = rusher.rush_yards/rusher.rush_attempts if rusher.rush_attempts else 0
         ypg = rusher.rush_yards/games_played if games_played > 0 else 0
         table.add_row([rusher.name,rusher.rush_attempts,rusher.rush_yards,rusher.rush_td,round(ya,1),round(ypg,1),rusher.longest_rush,rusher.fumbles])
-    print(table)
+    out.write(table)
 
-    print("\n=== Receiving Leaders ===")
+    out.write("\n=== Receiving Leaders ===")
     table = PrettyTable()
     table.field_names = ["Name","Rec","Targets","Yards","TD","Y/R","YPG","Long","Drops"]
     # Include RBs in receiving stats
@@ -612,29 +1204,34 @@ def print_team_stats(team, games_played):
         ypr = r.rec_yards/r.rec_catches if r.rec_catches else 0
         ypg = r.rec_yards/games_played if games_played > 0 else 0
         table.add_row([r.name,r.rec_catches,r.rec_targets,r.rec_yards,r.rec_td,round(ypr,1),round(ypg,1),r.longest_rec,r.drops])
-    print(table)
+    out.write(table)
 
-    print("\n=== Defensive Leaders ===")
+    out.write("\n=== Defensive Leaders ===")
     table = PrettyTable()
     table.field_names = ["Name","Tackles","Sacks","QB Pressure","INT","FF","FR","PD"]
     defenders = sorted(team.defense_starters,key=lambda x:(x.tackles+x.sacks),reverse=True)[:5]
     for d in defenders:
         table.add_row([d.name,d.tackles,d.sacks,d.qb_pressure,d.interceptions_def,d.forced_fumbles,d.fumble_recoveries,d.pass_deflections])
-    print(table)
+    out.write(table)
 
 # ============================
 # --- PRINT LAST GAME STATS ---
 # ============================
-def print_last_game_stats(team):
+def print_last_game_stats(team, out=None):
     """Print leaders/tables for the last game using team.last_game_stats (deltas)."""
+    out = out or OUTPUT
+    if not out.enabled(FULL):
+        return
     if not getattr(team, "last_game_stats", None):
-        print("\nNo last game stats available for this team yet.")
+        out.write("\nNo last game stats available for this team yet.")
         return
 
-    lg = team.last_game_stats
+    # Game lines are stat vectors (older saves stored per-player dicts)
+    lg = {name: line if isinstance(line, dict) else dict(zip(STAT_ATTRS, line))
+          for name, line in team.last_game_stats.items()}
 
     # Passing leaders (last game)
-    print("\n=== LAST GAME: Passing Leaders ===")
+    out.write("\n=== LAST GAME: Passing Leaders ===")
     table = PrettyTable()
     table.field_names = ["Player","Comp","Att","Yds","TD","INT","Comp%","Y/A","Long"]
     # find QBs present in last_game_stats
@@ -649,10 +1246,10 @@ def print_last_game_stats(team):
         comp_pct = round(100 * comp / att, 1) if att else 0
         ypa = round(yds / att, 1) if att else 0
         table.add_row([qb.name, comp, att, yds, td, itc, comp_pct, ypa, d.get("longest_pass", 0)])
-    print(table)
+    out.write(table)
 
     # Rushing leaders (last game)
-    print("\n=== LAST GAME: Rushing Leaders ===")
+    out.write("\n=== LAST GAME: Rushing Leaders ===")
     table = PrettyTable()
     table.field_names = ["Player","Att","Yds","TD","Y/A","Long"]
     rbs = [p for p in team.players if p.position=="RB"] + [p for p in team.players if p.position=="QB"]
@@ -664,10 +1261,10 @@ def print_last_game_stats(team):
         td = d.get("rush_td", 0)
         ya = round(yds/att,1) if att else 0
         table.add_row([r.name, att, yds, td, ya, d.get("longest_rush", 0)])
-    print(table)
+    out.write(table)
 
     # Receiving leaders (last game)
-    print("\n=== LAST GAME: Receiving Leaders ===")
+    out.write("\n=== LAST GAME: Receiving Leaders ===")
     table = PrettyTable()
     table.field_names = ["Player","Catches","Targets","Yds","TD","Y/R","Drops","Long"]
     recs = [p for p in team.players if p.position in ["WR","TE","RB"]]
@@ -680,10 +1277,10 @@ def print_last_game_stats(team):
         td = d.get("rec_td", 0)
         ypr = round(yds / catches, 1) if catches else 0
         table.add_row([r.name, catches, targets, yds, td, ypr, d.get("drops", 0), d.get("longest_rec", 0)])
-    print(table)
+    out.write(table)
 
     # Defensive leaders (last game)
-    print("\n=== LAST GAME: Defensive Leaders ===")
+    out.write("\n=== LAST GAME: Defensive Leaders ===")
     table = PrettyTable()
     table.field_names = ["Player","Tkl","Sacks","QB Press","INT","FF","FR","PD"]
     defs = team.defense_starters
@@ -700,30 +1297,36 @@ def print_last_game_stats(team):
             sd.get("fumble_recoveries", 0),
             sd.get("pass_deflections", 0)
         ])
-    print(table)
+    out.write(table)
 
 
 
 # ============================
 # --- VIEW STANDINGS ---
 # ============================
-def view_standings(teams, user_team_name=None):
+def view_standings(teams, user_team_name=None, out=None):
     """Display league standings by division"""
-    leagues = {"AFC": {"East": [], "North": [], "South": [], "West": []},
-               "NFC": {"East": [], "North": [], "South": [], "West": []}}
-    
-    for team in teams:
-        leagues[team.league][team.division].append(team)
+    out = out or OUTPUT
+    if not out.enabled(SUMMARY):
+        return
+    index = teams[0].standings if teams else None
+    if index is not None and index.covers(teams):
+        divisions = {key: list(ranked) for key, ranked in index.divisions.items()}
+    else:
+        divisions = {}
+        for team in teams:
+            divisions.setdefault((team.league, team.division), []).append(team)
+        divisions = {key: sorted(div, key=standings_key, reverse=True) for key, div in divisions.items()}
     
-    for league_name, divisions in leagues.items():
-        print(f"\n{'='*60}")
-        print(f"{league_name} STANDINGS")
-        print(f"{'='*60}")
+    for league_name in sorted({league for league, _ in divisions}):
+        out.write(f"\n{'='*60}", SUMMARY)
+        out.write(f"{league_name} STANDINGS", SUMMARY)
+        out.write(f"{'='*60}", SUMMARY)
         
-        for div_name, div_teams in divisions.items():
-            sorted_teams = sorted(div_teams, key=lambda t: (t.wins, t.points_for - t.points_against), reverse=True)
-            print(f"\n{league_name} {div_name}")
-            print(f"{'-'*60}")
+        for div_name in sorted(division for league, division in divisions if league == league_name):
+            sorted_teams = divisions[(league_name, div_name)]
+            out.write(f"\n{league_name} {div_name}", SUMMARY)
+            out.write(f"{'-'*60}", SUMMARY)
             
             table = PrettyTable()
             table.field_names = ["Team", "W", "L", "PF", "PA", "Diff"]
@@ -739,55 +1342,73 @@ def view_standings(teams, user_team_name=None):
                     team.points_for - team.points_against
                 ])
             
-            print(table)
+            out.write(table, SUMMARY)
 
 # ============================
 # --- PLAYOFFS ---
 # ============================
-def run_playoffs(franchise):
+def run_playoffs(franchise, interactive=True, out=None, stats=True, drives=None):
     """Run playoff bracket with division winners and wild cards"""
-    print("\n" + "="*70)
-    print("PLAYOFFS".center(70))
-    print("="*70)
+    out = out or OUTPUT
+    def show(text="", level=SUMMARY):
+        out.write(text, level)
+
+    def pause(prompt):
+        if interactive:
+            out.ask(prompt)
+
+    playoff_seeds = []
+    def play(team1, team2):
+        # Seeded franchises give each playoff game its own stream, numbered in bracket order
+        seed = None
+        if franchise.seed is not None:
+            seed = game_seed(franchise.seed, franchise.current_season, "playoffs", len(playoff_seeds))
+        playoff_seeds.append(seed)
+        return simulate_game(team1, team2, franchise.user_team_name, out=out, seed=seed, stats=stats, drives=drives)
+
+    show("\n" + "="*70)
+    show("PLAYOFFS".center(70))
+    show("="*70)
     
     # Get playoff teams for each conference
     afc_teams = get_playoff_teams([t for t in franchise.teams if t.league == "AFC"])
     nfc_teams = get_playoff_teams([t for t in franchise.teams if t.league == "NFC"])
     
-    print("\n=== AFC PLAYOFF TEAMS ===")
-    for i, team in enumerate(afc_teams, 1):
-        print(f"{i}. {team.name} ({team.wins}-{team.losses})")
-    
-    print("\n=== NFC PLAYOFF TEAMS ===")
-    for i, team in enumerate(nfc_teams, 1):
-        print(f"{i}. {team.name} ({team.wins}-{team.losses})")
+    if out.enabled(FULL):
+        show("\n=== AFC PLAYOFF TEAMS ===", FULL)
+        for i, team in enumerate(afc_teams, 1):
+            show(f"{i}. {team.name} ({team.wins}-{team.losses})", FULL)
+        
+        show("\n=== NFC PLAYOFF TEAMS ===", FULL)
+        for i, team in enumerate(nfc_teams, 1):
+            show(f"{i}. {team.name} ({team.wins}-{team.losses})", FULL)
     
-    input("\nPress Enter to start Wild Card Round...")
+    pause("\nPress Enter to start Wild Card Round...")
     
     # Wild Card Round
-    print("\n" + "="*70)
-    print("WILD CARD ROUND".center(70))
-    print("="*70)
+    show("\n" + "="*70)
+    show("WILD CARD ROUND".center(70))
+    show("="*70)
     
     afc_wc_winners = []
     nfc_wc_winners = []
     
     # AFC Wild Card (2 vs 7, 3 vs 6, 4 vs 5)
-    afc_wc_winners.append(simulate_game(afc_teams[1], afc_teams[6], franchise.user_team_name))
-    afc_wc_winners.append(simulate_game(afc_teams[2], afc_teams[5], franchise.user_team_name))
-    afc_wc_winners.append(simulate_game(afc_teams[3], afc_teams[4], franchise.user_team_name))
+    afc_wc_winners.append(play(afc_teams[1], afc_teams[6]))
+    afc_wc_winners.append(play(afc_teams[2], afc_teams[5]))
+    afc_wc_winners.append(play(afc_teams[3], afc_teams[4]))
     
     # NFC Wild Card
-    nfc_wc_winners.append(simulate_game(nfc_teams[1], nfc_teams[6], franchise.user_team_name))
-    nfc_wc_winners.append(simulate_game(nfc_teams[2], nfc_teams[5], franchise.user_team_name))
-    nfc_wc_winners.append(simulate_game(nfc_teams[3], nfc_teams[4], franchise.user_team_name))
+    nfc_wc_winners.append(play(nfc_teams[1], nfc_teams[6]))
+    nfc_wc_winners.append(play(nfc_teams[2], nfc_teams[5]))
+    nfc_wc_winners.append(play(nfc_teams[3], nfc_teams[4]))
     
-    input("\nPress Enter to continue to Divisional Round...")
+    pause("\nPress Enter to continue to Divisional Round...")
     
     # Divisional Round
-    print("\n" + "="*70)
-    print("DIVISIONAL ROUND".center(70))
-    print("="*70)
+    show("\n" + "="*70)
+    show("DIVISIONAL ROUND".center(70))
+    show("="*70)
     
     # Re-seed winners (1 seed plays lowest remaining seed)
     afc_remaining = [afc_teams[0]] + sorted(afc_wc_winners, key=lambda t: (t.wins, t.points_for - t.points_against), reverse=True)
@@ -796,50 +1417,64 @@ def run_playoffs(franchise):
     afc_div_winners = []
     nfc_div_winners = []
     
-    afc_div_winners.append(simulate_game(afc_remaining[0], afc_remaining[3], franchise.user_team_name))
-    afc_div_winners.append(simulate_game(afc_remaining[1], afc_remaining[2], franchise.user_team_name))
+    afc_div_winners.append(play(afc_remaining[0], afc_remaining[3]))
+    afc_div_winners.append(play(afc_remaining[1], afc_remaining[2]))
     
-    nfc_div_winners.append(simulate_game(nfc_remaining[0], nfc_remaining[3], franchise.user_team_name))
-    nfc_div_winners.append(simulate_game(nfc_remaining[1], nfc_remaining[2], franchise.user_team_name))
+    nfc_div_winners.append(play(nfc_remaining[0], nfc_remaining[3]))
+    nfc_div_winners.append(play(nfc_remaining[1], nfc_remaining[2]))
     
-    input("\nPress Enter to continue to Conference Championships...")
+    pause("\nPress Enter to continue to Conference Championships...")
     
     # Conference Championships
-    print("\n" + "="*70)
-    print("CONFERENCE CHAMPIONSHIPS".center(70))
-    print("="*70)
+    show("\n" + "="*70)
+    show("CONFERENCE CHAMPIONSHIPS".center(70))
+    show("="*70)
     
-    afc_champ = simulate_game(afc_div_winners[0], afc_div_winners[1], franchise.user_team_name)
-    nfc_champ = simulate_game(nfc_div_winners[0], nfc_div_winners[1], franchise.user_team_name)
+    afc_champ = play(afc_div_winners[0], afc_div_winners[1])
+    nfc_champ = play(nfc_div_winners[0], nfc_div_winners[1])
     
-    input("\nPress Enter to continue to the SUPER BOWL...")
+    pause("\nPress Enter to continue to the SUPER BOWL...")
     
     # Super Bowl
-    print("\n" + "="*70)
-    print("SUPER BOWL".center(70))
-    print("="*70)
+    show("\n" + "="*70)
+    show("SUPER BOWL".center(70))
+    show("="*70)
     
-    champion = simulate_game(afc_champ, nfc_champ, franchise.user_team_name)
+    champion = play(afc_champ, nfc_champ)
     
-    print("\n" + "="*70)
-    print(f"🏆 {champion.name} WIN THE SUPER BOWL! 🏆".center(70))
-    print("="*70)
+    if out.enabled(SUMMARY):
+        show("\n" + "="*70)
+        show(f"🏆 {champion.name} WIN THE SUPER BOWL! 🏆".center(70))
+        show("="*70)
     
     return champion
 
-def get_playoff_teams(conference_teams):
-    """Get 7 playoff teams from a conference (4 division winners + 3 wild cards)"""
+def get_division_winners(conference_teams):
+    """Get the best team (wins, point diff) from each division of a conference"""
+    index = conference_teams[0].standings if conference_teams else None
+    if index is not None and index.is_conference(conference_teams):
+        return index.division_winners(conference_teams[0].league)
+    
     divisions = {}
     for team in conference_teams:
         if team.division not in divisions:
             divisions[team.division] = []
         divisions[team.division].append(team)
     
-    # Get division winners
     div_winners = []
     for div_teams in divisions.values():
         winner = max(div_teams, key=lambda t: (t.wins, t.points_for - t.points_against))
         div_winners.append(winner)
+    return div_winners
+
+def get_playoff_teams(conference_teams):
+    """Get 7 playoff teams from a conference (4 division winners + 3 wild cards)"""
+    index = conference_teams[0].standings if conference_teams else None
+    if index is not None and index.is_conference(conference_teams):
+        return index.conference_seeds(conference_teams[0].league)
+    
+    # Get division winners
+    div_winners = get_division_winners(conference_teams)
     
     # Sort division winners by record
     div_winners.sort(key=lambda t: (t.wins, t.points_for - t.points_against), reverse=True)
@@ -858,24 +1493,45 @@ def get_playoff_teams(conference_teams):
 # ============================
 # --- SAVE / LOAD ---
 # ============================
-def save_franchise(franchise, filename="franchise_save.pkl"):
-    with open(filename,"wb") as f:
-        pickle.dump(franchise,f)
-    print(f"Saved franchise to {filename}")
-
-def load_franchise(filename="franchise_save.pkl"):
+def save_franchise(franchise, filename="franchise_save.pkl", out=None):
+    import codec  # versioned binary format; load_franchise still reads older pickle saves
+    codec.save(franchise, filename)
+    (out or OUTPUT).write(f"Saved franchise to {filename}", SUMMARY)
+
+def load_franchise(filename="franchise_save.pkl", out=None):
+    """The saved franchise, or None if there is no save; a save that can't be decoded raises"""
+    import codec
     try:
-        with open(filename,"rb") as f:
-            franchise = pickle.load(f)
-        print(f"Loaded franchise from {filename}")
-        return franchise
-    except:
+        franchise = codec.load(filename)
+    except FileNotFoundError:
         return None
+    (out or OUTPUT).write(f"Loaded franchise from {filename}", SUMMARY)
+    return franchise
+
+# ============================
+# --- CREATE FULL ROSTER ---
+# ============================
+def create_full_roster(team_name):
+    positions = {
+        "QB":3, "RB":5, "FB":1, "WR":6, "TE":3,
+        "OL":10, "DL":8, "LB":7, "CB":5, "S":4,
+        "K":1, "P":1
+    }
+    players=[]
+    for pos,count in positions.items():
+        for i in range(count):
+            age=random.randint(21,30)
+            skill=random.randint(60,85)
+            name=f"{team_name} {pos}{i+1}"
+            p=Player(name,pos,skill,age)
+            players.append(p)
+    return players
 
 # ============================
 # --- CREATE NEW LEAGUE ---
 # ============================
-def create_new_league():
+def create_new_league(generated=False):
+    """Build the 32-team league from the Excel rosters (or random rosters if generated=True)"""
     team_names = [
     "Buffalo Bills", "Miami Dolphins", "New England Patriots", "New York Jets",
     "Baltimore Ravens", "Cincinnati Bengals", "Cleveland Browns", "Pittsburgh Steelers",
@@ -887,13 +1543,14 @@ def create_new_league():
     "Arizona Cardinals", "Los Angeles Rams", "San Francisco 49ers", "Seattle Seahawks"
 ]
 
+    rosters = None if generated else load_rosters_from_excel("fake_nfl_rosters.xlsx")
     leagues={"AFC":{"East":[],"North":[],"South":[],"West":[]},"NFC":{"East":[],"North":[],"South":[],"West":[]}}
     idx=0
     for league_name,divs in leagues.items():
         for div_name in divs:
             for _ in range(4):
                 team = Team(team_names[idx])
-                team.players = load_rosters_from_excel("fake_nfl_rosters.xlsx")
+                team.players = create_full_roster(team.name) if generated else rosters[team.name]
                 team.qb_starters = [p for p in team.players if p.position=="QB"][:1]
                 team.rb_starters = [p for p in team.players if p.position=="RB"][:2]
                 team.wr_starters = [p for p in team.players if p.position=="WR"][:2]
@@ -906,53 +1563,191 @@ def create_new_league():
     teams = [t for l in leagues.values() for d in l.values() for t in d]
     return teams
 
+# ============================
+# --- SEASON PHASES ---
+# ============================
+def reset_season(franchise):
+    """Reset team records and player stats at the start of a season"""
+    for t in franchise.teams:
+        t.wins = 0
+        t.losses = 0
+        t.points_for = 0
+        t.points_against = 0
+        t.score = 0
+    standings = getattr(franchise, "standings", None)
+    if standings is not None:
+        standings.rebuild()
+    # Reset all player stats at start of season
+    store = getattr(franchise, "store", None)
+    if store is not None:
+        store.reset_season()
+        return
+    for t in franchise.teams:
+        for p in t.players:
+            p.reset_stats()
+
+def pair_week(franchise, base_seed=None):
+    """Shuffle and pair the teams for the current week; returns [(team1, team2, game seed or None)]
+
+    Seeded franchises (franchise.seed, or base_seed) draw the pairing and every game from
+    streams derived from (seed, season, week), so any week can be re-simulated exactly.
+    """
+    seed = franchise.seed if base_seed is None else base_seed
+    season, week = franchise.current_season, franchise.current_week
+    if seed is None:
+        random.shuffle(franchise.teams)
+    else:
+        random.Random(game_seed(seed, season, week, "pairing")).shuffle(franchise.teams)
+    teams = franchise.teams
+    return [(teams[i], teams[i+1], None if seed is None else game_seed(seed, season, week, i // 2))
+            for i in range(0, len(teams), 2)]
+
+def simulate_week(franchise, out=None, events=None, stats=True, drives=None):
+    """Simulate all games for the week; returns [(team1, team2, score1, score2, seed)] by name
+    (stats=False: score-only games, drives: whole-drive draws, see simulate_game)"""
+    results = []
+    for team1, team2, seed in pair_week(franchise):
+        simulate_game(team1, team2, user_team=franchise.user_team_name, out=out, events=events, seed=seed,
+                      stats=stats, drives=drives)
+        results.append((team1.name, team2.name, team1.score, team2.score, seed))
+    return results
+
+def run_offseason(franchise, retired_players, out=None):
+    """Progress players (aging, skill changes, retirements)"""
+    out = out or OUTPUT
+    OUTCOME_TABLES.clear()  # skills move; drop tables for matchups that no longer occur
+    for team in franchise.teams:
+        for player in team.players:
+            player.progress()
+            if player.should_retire() and not player.retired:
+                player.retired = True
+                retired_players.append(player)
+                if out.enabled(FULL):
+                    out.write(f"{player.name} ({team.name}) has retired at age {player.age}")
+
+# ============================
+# --- ROSTER COMPACTION ---
+# ============================
+STARTER_SLOTS = (
+    ("qb_starters", ("QB",), 1),
+    ("rb_starters", ("RB",), 2),
+    ("wr_starters", ("WR",), 2),
+    ("te_starters", ("TE",), 2),
+    ("defense_starters", ("DL", "LB", "CB", "S"), None),
+)
+
+def set_starters(team):
+    """Rebuild the starter lists from active players, best skill first"""
+    active = sorted((p for p in team.players if not p.retired), key=lambda p: p.skill, reverse=True)
+    for attr, positions, count in STARTER_SLOTS:
+        starters = [p for p in active if p.position in positions]
+        setattr(team, attr, starters[:count] if count else starters)
+
+def draft_rookie(team_name, position, season, slot):
+    """A new player to fill a retired player's roster spot"""
+    return Player(f"{team_name} {position} R{season}-{slot}", position, random.randint(60, 85), random.randint(21, 23))
+
+def compact_rosters(franchise):
+    """Archive retired players, draft a rookie into each freed spot and rebuild starters.
+
+    Keeps every roster at its original size and position mix, so per-season work stays
+    bounded however long the franchise runs. Returns the number of players archived.
+    """
+    if franchise.archive is None:
+        from archive import CareerArchive
+        franchise.archive = CareerArchive()
+    archived = 0
+    for team in franchise.teams:
+        if not any(p.retired for p in team.players):
+            continue
+        roster = []
+        for slot, p in enumerate(team.players):
+            if p.retired:
+                franchise.archive.add(p, team.name, franchise.current_season)
+                p = draft_rookie(team.name, p.position, franchise.current_season, slot)
+                archived += 1
+            roster.append(p)
+        team.players = roster
+        set_starters(team)
+    store = getattr(franchise, "store", None)
+    if archived and store is not None:
+        franchise.store = type(store).from_teams(franchise.teams)  # drop archived rows
+    return archived
+
+def live_object_counts(franchise):
+    """Rostered players, archived rows and live Player objects (for per-season reports).
+    Walks the whole gc heap once, so it costs time proportional to every live object"""
+    import gc
+    objects = gc.get_objects()
+    return {
+        "season": franchise.current_season,
+        "roster_players": sum(len(t.players) for t in franchise.teams),
+        "archived_players": len(franchise.archive) if franchise.archive is not None else 0,
+        "player_objects": sum(1 for o in objects if isinstance(o, Player)),
+        "gc_objects": len(objects),
+    }
+
 # ============================
 # --- RUN FRANCHISE MENU ---
 # ============================
-def run_franchise(franchise):
+def run_franchise(franchise, journal=None, history=None):
+    """Interactive franchise loop; with a journal (journal.FranchiseJournal) each week is appended as it's played,
+    otherwise each week is autosaved in the background (autosave.Autosaver). With a history
+    (history.CareerHistory) each season's player lines are kept before the next reset"""
+    out = OUTPUT
+    autosaver = None
+    if journal is None:
+        import autosave
+        autosaver = autosave.Autosaver()
+
+    def save():
+        if journal is not None:
+            journal.save(franchise)
+        else:
+            autosaver.save(franchise)
+
+    def finish():
+        if autosaver is not None:
+            autosaver.close()
+            out.write(f"Saved franchise to {autosaver.filename}")
+        out.flush()
+
     retired_players = []
     while franchise.current_season <= FRANCHISE_LENGTH:
-        print(f"\n{'='*70}")
-        print(f"SEASON {franchise.current_season}".center(70))
-        print(f"{'='*70}")
+        out.write(f"\n{'='*70}")
+        out.write(f"SEASON {franchise.current_season}".center(70))
+        out.write(f"{'='*70}")
         
         # Reset season records
-        for t in franchise.teams:
-            t.wins = 0
-            t.losses = 0
-            t.points_for = 0
-            t.points_against = 0
-            t.score = 0
-            # Reset all player stats at start of season
-            for p in t.players:
-                p.reset_stats()
+        reset_season(franchise)
+        if journal is not None:
+            journal.save(franchise)  # base snapshot for the season
         
         # Regular season
         while franchise.current_week <= SEASON_GAMES:
-            print(f"\n{'='*70}")
-            print(f"WEEK {franchise.current_week}".center(70))
-            print(f"{'='*70}")
+            out.write(f"\n{'='*70}")
+            out.write(f"WEEK {franchise.current_week}".center(70))
+            out.write(f"{'='*70}")
             
             user_team = next(t for t in franchise.teams if t.name == franchise.user_team_name)
             
-            print("1. Simulate Week")
-            print("2. View Last Game's Stats")        # renamed
-            print("3. View Your Team Season Stats")   # new accumulated season view
-            print("4. View Other Team Stats")
-            print("5. View Standings")
-            print("6. Save Franchise")
-            print("7. Quit")
-            choice = input("> ").strip()
+            out.write("1. Simulate Week")
+            out.write("2. View Last Game's Stats")        # renamed
+            out.write("3. View Your Team Season Stats")   # new accumulated season view
+            out.write("4. View Other Team Stats")
+            out.write("5. View Standings")
+            out.write("6. Save Franchise")
+            out.write("7. Quit")
+            choice = out.ask("> ").strip()
 
             if choice == "1":
-                # Simulate all games for the week (shuffle / pairing)
-                random.shuffle(franchise.teams)
-                for i in range(0, len(franchise.teams), 2):
-                    simulate_game(franchise.teams[i], franchise.teams[i+1], user_team=franchise.user_team_name)
+                simulate_week(franchise)
 
                 # Show user team summary after each week
                 print_team_summary(user_team, franchise.teams)
                 franchise.current_week += 1
+                save()
+                out.flush()  # the week's results go out in one write
 
             elif choice == "2":
                 # Last game's stats (per-player deltas)
@@ -966,82 +1761,93 @@ def run_franchise(franchise):
             elif choice == "4":
                 games_played = franchise.current_week - 1
                 for idx, t in enumerate(franchise.teams):
-                    print(f"{idx+1}. {t.name}")
+                    out.write(f"{idx+1}. {t.name}")
                 try:
-                    sel = int(input("Select team: ")) - 1
+                    sel = int(out.ask("Select team: ")) - 1
                     if 0 <= sel < len(franchise.teams):
                         print_team_stats(franchise.teams[sel], games_played)
                 except:
-                    print("Invalid selection.")
+                    out.write("Invalid selection.")
 
             elif choice == "5":
                 view_standings(franchise.teams, user_team_name=franchise.user_team_name)
 
             elif choice == "6":
-                save_franchise(franchise)
+                save()
 
             elif choice == "7":
-                save_franchise(franchise)
+                save()
+                finish()
                 return
 
             else:
-                print("Invalid choice.")
+                out.write("Invalid choice.")
 
         
         # Season complete - run playoffs
-        print(f"\n{'='*70}")
-        print("REGULAR SEASON COMPLETE".center(70))
-        print(f"{'='*70}")
+        out.write(f"\n{'='*70}")
+        out.write("REGULAR SEASON COMPLETE".center(70))
+        out.write(f"{'='*70}")
         view_standings(franchise.teams, user_team_name=franchise.user_team_name)
         
-        input("\nPress Enter to start the playoffs...")
+        out.ask("\nPress Enter to start the playoffs...")
         champion = run_playoffs(franchise)
+        if history is not None:
+            history.record_season(franchise)
         
         # Progress players (aging, skill changes, retirements)
-        print("\n=== OFF-SEASON ===")
-        for team in franchise.teams:
-            for player in team.players:
-                player.progress()
-                if player.should_retire() and not player.retired:
-                    player.retired = True
-                    retired_players.append(player)
-                    print(f"{player.name} ({team.name}) has retired at age {player.age}")
+        out.write("\n=== OFF-SEASON ===")
+        run_offseason(franchise, retired_players)
+        compact_rosters(franchise)
+        retired_players.clear()
         
         franchise.current_season += 1
         franchise.current_week = 1
         
-        input("\nPress Enter to continue to next season...")
+        out.ask("\nPress Enter to continue to next season...")
     
-    print("\n" + "="*70)
-    print("FRANCHISE COMPLETE!".center(70))
-    print("="*70)
+    save()
+    finish()
+    out.write("\n" + "="*70)
+    out.write("FRANCHISE COMPLETE!".center(70))
+    out.write("="*70)
+    out.flush()
 
 # ============================
 # --- MAIN LOOP ---
 # ============================
 def main():
-    print("=== NFL Franchise Simulator ===")
-    print("1. New Game\n2. Load Game")
-    choice = input("> ").strip()
+    out = OUTPUT
+    out.write("=== NFL Franchise Simulator ===")
+    out.write("1. New Game\n2. Load Game")
+    choice = out.ask("> ").strip()
     if choice == "2":
-        franchise = load_franchise()
+        try:
+            franchise = load_franchise()
+        except Exception as e:
+            # Never fall through to a new game here: its first autosave would overwrite the save
+            out.write(f"Could not load franchise_save.pkl ({e}); leaving it untouched.")
+            out.flush()
+            return
         if franchise is None:
-            print("No save file found. Starting new game...")
+            out.write("No save file found. Starting new game...")
             teams = create_new_league()
-            for i, t in enumerate(teams): print(f"{i+1}. {t.name}")
-            sel = int(input("Select your team: ")) - 1
-            franchise = Franchise(teams, teams[sel].name)
+            for i, t in enumerate(teams): out.write(f"{i+1}. {t.name}")
+            sel = int(out.ask("Select your team: ")) - 1
+            franchise = Franchise(teams, teams[sel].name, seed=random.getrandbits(64))
     else:
         teams = create_new_league()
-        for i, t in enumerate(teams): print(f"{i+1}. {t.name}")
-        sel = int(input("Select your team: ")) - 1
-        franchise = Franchise(teams, teams[sel].name)
+        for i, t in enumerate(teams): out.write(f"{i+1}. {t.name}")
+        sel = int(out.ask("Select your team: ")) - 1
+        franchise = Franchise(teams, teams[sel].name, seed=random.getrandbits(64))
 
     # Run your franchise menu here
     # run_franchise(franchise)  # existing function
 
     save_franchise(franchise)
-    print("Franchise complete!")
+    out.write("Franchise complete!")
+    out.flush()
 
 if __name__=="__main__":
+    sys.modules.setdefault("football_sim", sys.modules[__name__])  # so codec.py decodes into these classes
     main()
\ No newline at end of file
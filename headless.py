@@ -0,0 +1,174 @@
+import argparse
+import json
+import random
+import time
+
+import football_sim as fs
+from history import CareerHistory
+from journal import FranchiseJournal
+from parallel_week import ParallelWeek
+from replay import season_digest
+
+# ============================
+# --- HEADLESS FRANCHISE RUN ---
+# ============================
+def run_headless(seed=0, seasons=fs.FRANCHISE_LENGTH, output="headless_save.pkl", user_team_name=None, workers=None,
+                 journal=None, history=None, level=fs.SILENT, store=False, count_objects=False):
+    """Run a whole franchise with no prompts or output; returns (franchise, report)
+
+    With workers set, weeks run on a ParallelWeek pool with per-game seeds, so results
+    are identical for any worker count. With journal set to a path, a FranchiseJournal there
+    gets a snapshot at each season start and a record after every week, so it holds the last
+    season played for replay.py (the state after the final off-season is in the output save).
+    With history set to a path, every player's season line is appended to a CareerHistory
+    there after the playoffs.
+    The franchise is seeded with seed, so every game can be re-played (replay.py); the report
+    carries a results digest per season to check replays against. Simulator output goes to an
+    OutputSink at level (silent by default) that is flushed once per season. store=True
+    backs the franchise with a LeagueStore (Franchise.attach_store). count_objects=True adds
+    live_object_counts after each off-season to the report (a heap walk, timed as "objects").
+    """
+    random.seed(seed)
+    phases = {"setup": 0.0, "regular_season": 0.0, "playoffs": 0.0, "offseason": 0.0, "save": 0.0, "objects": 0.0}
+    games_before = fs.SIM_COUNTERS["games"]
+    plays_before = fs.SIM_COUNTERS["plays"]
+    start = time.perf_counter()
+
+    t = time.perf_counter()
+    teams = fs.create_new_league()
+    franchise = fs.Franchise(teams, user_team_name or teams[0].name, seed=seed, store=store)
+    phases["setup"] += time.perf_counter() - t
+
+    out = fs.OutputSink(level)
+    week_runner = ParallelWeek(workers, base_seed=seed) if workers else None
+    journal = FranchiseJournal(journal) if journal else None
+    history = CareerHistory(history) if history else None
+    champions = []
+    digests = []
+    live_objects = []
+    for _ in range(seasons):
+        t = time.perf_counter()
+        fs.reset_season(franchise)
+        phases["regular_season"] += time.perf_counter() - t
+        if journal:
+            t = time.perf_counter()
+            journal.save(franchise)
+            phases["save"] += time.perf_counter() - t
+
+        weeks = []
+        while franchise.current_week <= fs.SEASON_GAMES:
+            t = time.perf_counter()
+            if week_runner:
+                weeks.append(week_runner.simulate_week(franchise, out=out))
+            else:
+                weeks.append(fs.simulate_week(franchise, out=out))
+            franchise.current_week += 1
+            phases["regular_season"] += time.perf_counter() - t
+            if journal:
+                t = time.perf_counter()
+                journal.save(franchise)
+                phases["save"] += time.perf_counter() - t
+
+        t = time.perf_counter()
+        champion = fs.run_playoffs(franchise, interactive=False, out=out)
+        champions.append(champion.name)
+        digests.append(season_digest(weeks, champion.name))
+        phases["playoffs"] += time.perf_counter() - t
+        if history:
+            t = time.perf_counter()
+            history.record_season(franchise)
+            phases["save"] += time.perf_counter() - t
+
+        t = time.perf_counter()
+        fs.run_offseason(franchise, [], out=out)
+        fs.compact_rosters(franchise)
+        out.flush()
+        phases["offseason"] += time.perf_counter() - t
+        if count_objects:
+            t = time.perf_counter()
+            live_objects.append(fs.live_object_counts(franchise))
+            phases["objects"] += time.perf_counter() - t
+        franchise.current_season += 1
+        franchise.current_week = 1
+
+    if week_runner:
+        week_runner.close()
+
+    t = time.perf_counter()
+    if output:
+        fs.save_franchise(franchise, output, out)
+        out.flush()
+    phases["save"] += time.perf_counter() - t
+
+    wall = time.perf_counter() - start
+    games = fs.SIM_COUNTERS["games"] - games_before
+    plays = fs.SIM_COUNTERS["plays"] - plays_before
+    report = {
+        "seed": seed,
+        "seasons": seasons,
+        "workers": workers,
+        "games": games,
+        "plays": plays,
+        "wall_time": wall,
+        "seasons_per_sec": seasons / wall if wall else 0,
+        "games_per_sec": games / wall if wall else 0,
+        "plays_per_sec": plays / wall if wall else 0,
+        "phases": phases,
+        "champions": champions,
+        "digests": digests,
+        "retired_players": len(franchise.archive) if franchise.archive is not None else 0,
+        "live_objects": live_objects,
+    }
+    return franchise, report
+
+def print_report(report):
+    """Print a throughput summary for a headless run"""
+    print(f"\n{'='*60}")
+    print(f"HEADLESS RUN: {report['seasons']} seasons (seed {report['seed']})".center(60))
+    print(f"{'='*60}")
+    print(f"Wall time:   {report['wall_time']:.2f}s")
+    print(f"Seasons/sec: {report['seasons_per_sec']:.3f}")
+    print(f"Games/sec:   {report['games_per_sec']:.1f}")
+    print(f"Plays/sec:   {report['plays_per_sec']:.0f}")
+    print("\nPhase wall time:")
+    for phase, seconds in report["phases"].items():
+        print(f"  {phase:<15} {seconds:8.2f}s")
+    if report["live_objects"]:
+        print("\nLive objects after each off-season:")
+        print(f"  {'season':>6} {'rostered':>9} {'archived':>9} {'Players':>8} {'gc objs':>9}")
+        for c in report["live_objects"]:
+            print(f"  {c['season']:>6} {c['roster_players']:>9} {c['archived_players']:>9} "
+                  f"{c['player_objects']:>8} {c['gc_objects']:>9}")
+
+# ============================
+# --- CLI ---
+# ============================
+LEVELS = {"silent": fs.SILENT, "summary": fs.SUMMARY, "full": fs.FULL}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run an NFL franchise simulation with no prompts")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--seasons", type=int, default=fs.FRANCHISE_LENGTH)
+    parser.add_argument("--output", default="headless_save.pkl", help="franchise save path ('' to skip saving)")
+    parser.add_argument("--team", default=None, help="user team name (defaults to the first team)")
+    parser.add_argument("--workers", type=int, default=None, help="play each week's games on a process pool")
+    parser.add_argument("--journal", default=None, help="also keep an append-only journal save at this path")
+    parser.add_argument("--history", default=None, help="append each season's player lines to a career history file")
+    parser.add_argument("--level", choices=LEVELS, default="silent",
+                        help="simulator output: silent, summary (user team results, standings) or full")
+    parser.add_argument("--report", default=None, help="write the throughput report as JSON to this path")
+    parser.add_argument("--store", action="store_true", help="back player stats and team records with a LeagueStore")
+    parser.add_argument("--count-objects", action="store_true",
+                        help="report live Player/gc object counts after each off-season (walks the heap)")
+    args = parser.parse_args(argv)
+
+    _, report = run_headless(args.seed, args.seasons, args.output, args.team, args.workers, args.journal, args.history,
+                             LEVELS[args.level], args.store, args.count_objects)
+    print_report(report)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+import os
+import struct
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+import football_sim as fs
+from codec import _Reader, _Strings, _i32_array, _i32_bytes
+
+# ============================
+# --- FILE LAYOUT ---
+# ============================
+# MAGIC, then one segment per recorded season: RECORD header (season, payload length, crc32)
+# + zlib'd columnar payload:
+#   string tables  stat field names, then every team/player/position string in the segment
+#   columns        u32 row count, then name, team, position (string ids) and years played,
+#                  ratings (rows x RATING_ATTRS) and season stats (rows x stat fields), all i32
+# Rows are sorted by (team, name), so one team's players are contiguous and a player's row is
+# found by bisection. Players never change teams, so (team, name) is a player's key for a whole
+# career, and a career is a run of consecutive seasons. Only the segment directory
+# (season -> offset) is kept in memory; segments are decoded on demand through a small LRU
+# cache, so memory stays bounded however many seasons are recorded.
+MAGIC = b"FSH1"
+RECORD = struct.Struct("<HII")
+
+class CareerHistory:
+    """Append-only season-by-season stat lines for every rostered player"""
+    def __init__(self, path, cache_size=4):
+        self.path = path
+        self.cache_size = cache_size
+        self._segments = OrderedDict()  # season -> (payload offset, length); re-recorded seasons point at the newest
+        self._cache = OrderedDict()
+        if os.path.exists(path):
+            self._scan()
+        else:
+            with open(path, "wb") as f:
+                f.write(MAGIC)
+
+    def _scan(self):
+        """Build the segment directory, cutting off a torn tail segment"""
+        with open(self.path, "r+b") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{self.path} is not a career history file")
+            end = len(MAGIC)
+            while True:
+                header = f.read(RECORD.size)
+                if len(header) < RECORD.size:
+                    break
+                season, length, crc = RECORD.unpack(header)
+                data = f.read(length)
+                if len(data) < length or zlib.crc32(data) != crc:
+                    break
+                self._segments[season] = (end + RECORD.size, length)
+                self._segments.move_to_end(season)
+                end += RECORD.size + length
+            f.truncate(end)
+
+    # --- Writing ---
+    def record_season(self, franchise):
+        """Append every rostered player's season line; call at season end, before reset_season"""
+        season = franchise.current_season
+        rows = sorted(((t.name, p) for t in franchise.teams for p in t.players), key=lambda r: (r[0], r[1].name))
+        s = _Strings()
+        for attr in fs.STAT_ATTRS:
+            s(attr)
+        columns = [[s(p.name) for _, p in rows], [s(team) for team, _ in rows],
+                   [s(p.position) for _, p in rows], [p.years_played for _, p in rows]]
+        body = [struct.pack("<B", len(fs.STAT_ATTRS))]
+        body += [s.encode(), struct.pack("<I", len(rows))]
+        body += [_i32_bytes(col) for col in columns]
+        body.append(b"".join(_i32_bytes(p.ratings) for _, p in rows))
+        body.append(b"".join(_i32_bytes(p.stats) for _, p in rows))
+        payload = zlib.compress(b"".join(body))
+
+        with open(self.path, "ab") as f:
+            offset = f.tell()
+            f.write(RECORD.pack(season, len(payload), zlib.crc32(payload)))
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        self._segments[season] = (offset + RECORD.size, len(payload))
+        self._segments.move_to_end(season)
+        self._cache.pop(season, None)
+        return len(rows)
+
+    # --- Reading ---
+    def _segment(self, season):
+        if season in self._cache:
+            self._cache.move_to_end(season)
+            return self._cache[season]
+        offset, length = self._segments[season]
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            r = _Reader(zlib.decompress(f.read(length)))
+        n_stats = r.u8()
+        strings = r.strings()
+        (n,) = r.unpack(struct.Struct("<I"))
+        names, teams, positions, years = (_i32_array(r.take(4 * n)) for _ in range(4))
+        n_ratings = len(fs.RATING_ATTRS)
+        segment = {
+            "stat_fields": strings[:n_stats],
+            "strings": strings,
+            "name": names, "team": teams, "position": positions, "years_played": years,
+            "ratings": _i32_array(r.take(4 * n * n_ratings)),
+            "stats": _i32_array(r.take(4 * n * n_stats)),
+        }
+        self._cache[season] = segment
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return segment
+
+    def _row(self, season, seg, i):
+        strings = seg["strings"]
+        n_stats, n_ratings = len(seg["stat_fields"]), len(fs.RATING_ATTRS)
+        row = {
+            "season": season,
+            "name": strings[seg["name"][i]],
+            "team": strings[seg["team"][i]],
+            "position": strings[seg["position"][i]],
+            "years_played": seg["years_played"][i],
+        }
+        row.update(zip(fs.RATING_ATTRS, seg["ratings"][i * n_ratings:(i + 1) * n_ratings]))
+        row.update(zip(seg["stat_fields"], seg["stats"][i * n_stats:(i + 1) * n_stats]))
+        return row
+
+    def seasons(self):
+        return sorted(self._segments)
+
+    def season(self, season):
+        """Every player's line for one season"""
+        seg = self._segment(season)
+        return [self._row(season, seg, i) for i in range(len(seg["name"]))]
+
+    def team(self, team_name, season=None):
+        """A team's player lines for one season (or every recorded season)"""
+        rows = []
+        seasons = [season] if season is not None else self.seasons()
+        for s in seasons:
+            seg = self._segment(s)
+            # Rows are sorted by team name: bisect the team column through the string table
+            team_of = lambda i, strings=seg["strings"], teams=seg["team"]: strings[teams[i]]
+            n = len(seg["team"])
+            lo = bisect_left(range(n), team_name, key=team_of)
+            hi = bisect_right(range(n), team_name, lo=lo, key=team_of)
+            rows += [self._row(s, seg, i) for i in range(lo, hi)]
+        return rows
+
+    def _find(self, seg, team_name, name):
+        """Row number of (team_name, name) in a segment, or None"""
+        strings, teams, names = seg["strings"], seg["team"], seg["name"]
+        key = lambda i: (strings[teams[i]], strings[names[i]])
+        n = len(names)
+        i = bisect_left(range(n), (team_name, name), key=key)
+        return i if i < n and key(i) == (team_name, name) else None
+
+    def player(self, team_name, name):
+        """One player's line for every recorded season the player was on a roster.
+
+        Players are keyed by (team, name): names repeat across teams. Seasons are searched
+        newest first and the search stops at the season before the player's first one.
+        """
+        rows = []
+        for s in reversed(self.seasons()):
+            seg = self._segment(s)
+            i = self._find(seg, team_name, name)
+            if i is None:
+                if rows:
+                    break
+                continue
+            rows.append(self._row(s, seg, i))
+        rows.reverse()
+        return rows
+
+    def career_totals(self, team_name, name):
+        """Stats summed over a player's seasons (longest_* as the career best)"""
+        totals = fs.ZERO_STATS[:]
+        for row in self.player(team_name, name):
+            fs.add_game_stats(totals, [row.get(attr, 0) for attr in fs.STAT_ATTRS])
+        return dict(zip(fs.STAT_ATTRS, totals))
@@ -0,0 +1,187 @@
+import os
+import pickle
+import struct
+import zlib
+
+import codec
+
+# ============================
+# --- FILE LAYOUT ---
+# ============================
+# MAGIC, then records of: RECORD header (kind, payload length, crc32 of payload) + zlib'd pickle.
+# A SNAPSHOT record holds the whole Franchise (codec.py bytes); each WEEK_ROWS record holds what changed since
+# the previous record: team fields, and the season stat rows of the players in each team's new game.
+# WEEK records (per-player stat differences) are from older journals and are still replayed.
+# A torn or corrupt tail record is ignored on load and cut off before appending.
+MAGIC = b"FSJ1"
+SNAPSHOT, WEEK, WEEK_ROWS = 1, 2, 3
+KINDS = (SNAPSHOT, WEEK, WEEK_ROWS)
+RECORD = struct.Struct("<BII")
+
+TEAM_FIELDS = ("score", "wins", "losses", "points_for", "points_against", "last_game_stats")
+
+def _frame(kind, payload):
+    data = zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+    return RECORD.pack(kind, len(data), zlib.crc32(data)) + data
+
+def read_records(path):
+    """Yield (kind, payload, end_offset) for every intact record, stopping at the first bad one"""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a franchise journal")
+        offset = len(MAGIC)
+        while True:
+            header = f.read(RECORD.size)
+            if len(header) < RECORD.size:
+                return
+            kind, length, crc = RECORD.unpack(header)
+            data = f.read(length)
+            if len(data) < length or zlib.crc32(data) != crc or kind not in KINDS:
+                return
+            offset += RECORD.size + length
+            yield kind, pickle.loads(zlib.decompress(data)), offset
+
+# ============================
+# --- WEEK DELTAS ---
+# ============================
+def _team_values(team):
+    # int(): record fields are NumPy scalars when a LeagueStore backs the team
+    return (int(team.score), int(team.wins), int(team.losses), int(team.points_for), int(team.points_against),
+            team.last_game_stats)
+
+def _baseline(franchise):
+    """What the next WEEK_ROWS record is diffed against: team fields and games played, O(teams),
+    plus each roster's player positions (rosters only change between seasons)"""
+    return {
+        "season": franchise.current_season,
+        "week": franchise.current_week,
+        "order": [t.name for t in franchise.teams],
+        "teams": {t.name: _team_values(t) for t in franchise.teams},
+        "games": {t.name: t.wins + t.losses for t in franchise.teams},
+        "roster": {t.name: {p.name: i for i, p in enumerate(t.players)} for t in franchise.teams},
+    }
+
+def week_delta(franchise, baseline):
+    """Changed team fields plus the season rows of the players in each team's new game (None if
+    nothing changed). Costs O(teams + players who played): last_game_stats names who played,
+    so it only covers every change while no team has played more than one game since baseline.
+    """
+    order = [t.name for t in franchise.teams]
+    teams = {}
+    players = []
+    for t in franchise.teams:
+        values = _team_values(t)
+        old = baseline["teams"][t.name]
+        if any(a is not b and a != b for a, b in zip(values, old)):
+            teams[t.name] = values
+            if t.last_game_stats is not old[-1]:
+                roster = baseline["roster"][t.name]
+                for name in t.last_game_stats:
+                    i = roster[name]
+                    players.append((t.name, i, t.players[i].stats.tolist()))
+
+    if (not teams and order == baseline["order"]
+            and franchise.current_week == baseline["week"]):
+        return None
+    return {"week": franchise.current_week, "order": order, "teams": teams, "players": players}
+
+def apply_delta(franchise, delta):
+    """Replay one WEEK_ROWS (or older WEEK) record onto a franchise"""
+    by_name = {t.name: t for t in franchise.teams}
+    franchise.teams[:] = [by_name[name] for name in delta["order"]]
+    for name, values in delta["teams"].items():
+        for field, value in zip(TEAM_FIELDS, values):
+            setattr(by_name[name], field, value)
+    for name, i, row in delta.get("players", ()):
+        stats = by_name[name].players[i].stats
+        for j, value in enumerate(row):
+            stats[j] = value
+    for name, i, row in delta.get("stats", ()):
+        stats = by_name[name].players[i].stats
+        for j, d in enumerate(row):
+            if d:
+                stats[j] += d
+    franchise.current_week = delta["week"]
+    franchise.standings.rebuild()
+
+# ============================
+# --- JOURNAL WRITER ---
+# ============================
+class FranchiseJournal:
+    """Append-only franchise save: one base snapshot per season plus one small record per save after it"""
+    def __init__(self, path):
+        self.path = path
+        self._baseline = None
+
+    @classmethod
+    def open(cls, path):
+        """Load an existing journal; returns (journal ready to append, franchise)"""
+        journal = cls(path)
+        franchise = None
+        end = None
+        for kind, payload, offset in read_records(path):
+            if kind == SNAPSHOT:
+                franchise = codec.loads(payload)
+            elif franchise is not None:
+                apply_delta(franchise, payload)
+            end = offset
+        if franchise is None:
+            raise ValueError(f"{path} has no intact snapshot")
+        with open(path, "r+b") as f:
+            f.truncate(end)  # drop a torn tail so new records follow intact ones
+        journal._baseline = _baseline(franchise)
+        return journal, franchise
+
+    def save(self, franchise):
+        """Snapshot on the first save of a season (or after a team played several games since the
+        last save, e.g. the playoffs), otherwise append what changed since the last save"""
+        baseline = self._baseline
+        if (baseline is None or baseline["season"] != franchise.current_season
+                or any(t.wins + t.losses - baseline["games"][t.name] > 1 for t in franchise.teams)):
+            self.snapshot(franchise)
+        else:
+            self.append_week(franchise)
+
+    def snapshot(self, franchise):
+        """Start a fresh journal from a full snapshot (written aside, then swapped in)"""
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(MAGIC)
+            f.write(_frame(SNAPSHOT, codec.dumps(franchise)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self._baseline = _baseline(franchise)
+
+    def append_week(self, franchise):
+        delta = week_delta(franchise, self._baseline)
+        if delta is None:
+            return False
+        with open(self.path, "ab") as f:
+            f.write(_frame(WEEK_ROWS, delta))
+            f.flush()
+            os.fsync(f.fileno())
+        # Advance the baseline by the delta itself so a save stays O(changes)
+        baseline = self._baseline
+        baseline["week"] = delta["week"]
+        baseline["order"] = delta["order"]
+        baseline["teams"].update(delta["teams"])
+        for name, values in delta["teams"].items():
+            baseline["games"][name] = values[1] + values[2]
+        return True
+
+def load_journal(path, week=None):
+    """Franchise state at the last intact record of a journal, or at the start of `week` of the journaled season"""
+    if week is None:
+        return FranchiseJournal.open(path)[1]
+    franchise = None
+    for kind, payload, _ in read_records(path):
+        if kind == SNAPSHOT:
+            franchise = codec.loads(payload)
+        elif franchise is not None:
+            if payload["week"] > week:
+                break
+            apply_delta(franchise, payload)
+    if franchise is None or franchise.current_week != week:
+        raise ValueError(f"{path} has no record of the start of week {week}")
+    return franchise
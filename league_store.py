@@ -0,0 +1,186 @@
+import json
+import os
+
+import numpy as np
+
+from football_sim import RATING_ATTRS, RECORD_ATTRS, STAT_ATTRS, STAT_INDEX
+
+POSITIONS = ["QB", "RB", "FB", "WR", "TE", "OL", "DL", "LB", "CB", "S", "K", "P"]
+POSITION_CODE = {pos: i for i, pos in enumerate(POSITIONS)}
+
+# ============================
+# --- LEAGUE STORE ---
+# ============================
+class LeagueStore:
+    """Struct-of-arrays store for every player in the league, indexed by player ID.
+
+    stats is (players x STAT_ATTRS) and ratings is (players x RATING_ATTRS); each
+    attached Player's .stats/.ratings are row views into them, so the simulator keeps
+    using the Player attributes while league-wide queries run as column operations.
+    team and position are parallel per-player code arrays. records is (teams x
+    RECORD_ATTRS), indexed by team ID; each attached Team's .record is a row view of it.
+    """
+    COLUMNS = ("stats", "ratings", "team", "position")
+
+    def __init__(self, capacity=64):
+        self.players = []
+        self.team_names = []
+        self.teams = {}  # team ID -> attached Team
+        self._team_ids = {}
+        self.records = np.zeros((0, len(RECORD_ATTRS)), dtype=np.int32)
+        self._allocate(capacity)
+
+    @classmethod
+    def from_teams(cls, teams):
+        store = cls(capacity=sum(len(t.players) for t in teams))
+        for team in teams:
+            store.add_team(team)
+        return store
+
+    def _allocate(self, capacity, columns=None):
+        old = columns or {}
+        self.stats = np.zeros((capacity, len(STAT_ATTRS)), dtype=np.int32)
+        self.ratings = np.zeros((capacity, len(RATING_ATTRS)), dtype=np.int32)
+        self.team = np.full(capacity, -1, dtype=np.int16)
+        self.position = np.full(capacity, -1, dtype=np.int8)
+        for name, values in old.items():
+            getattr(self, name)[:len(values)] = values
+
+    def _grow(self):
+        n = len(self.players)
+        self._allocate(max(64, 2 * len(self.team)), {name: getattr(self, name)[:n] for name in self.COLUMNS})
+        self._rebind()
+
+    def _rebind(self):
+        """Point every attached Player and Team at its (possibly reallocated) rows"""
+        for pid, p in enumerate(self.players):
+            p.stats = self.stats[pid]
+            p.ratings = self.ratings[pid]
+        for tid, t in self.teams.items():
+            t.record = self.records[tid]
+
+    def __len__(self):
+        return len(self.players)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        n = len(self.players)
+        for name in self.COLUMNS:
+            state[name] = np.array(state[name][:n])  # plain in-memory copy, even when memory-mapped
+        state["records"] = np.array(self.records)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._rebind()
+
+    # --- Views ---
+    @property
+    def skill(self):
+        return self.ratings[:len(self.players), RATING_ATTRS.index("skill")]
+
+    @property
+    def age(self):
+        return self.ratings[:len(self.players), RATING_ATTRS.index("age")]
+
+    @property
+    def durability(self):
+        return self.ratings[:len(self.players), RATING_ATTRS.index("durability")]
+
+    def column(self, attr):
+        """Season totals of one stat for every player"""
+        return self.stats[:len(self.players), STAT_INDEX[attr]]
+
+    def record(self, attr):
+        """One record field (wins, losses, points_for, points_against) for every team ID"""
+        return self.records[:len(self.team_names), RECORD_ATTRS.index(attr)]
+
+    # --- Membership ---
+    def team_id(self, team_name):
+        if team_name not in self._team_ids:
+            self._team_ids[team_name] = len(self.team_names)
+            self.team_names.append(team_name)
+            if len(self.team_names) > len(self.records):
+                records = np.zeros((max(32, 2 * len(self.records)), len(RECORD_ATTRS)), dtype=np.int32)
+                records[:len(self.records)] = self.records
+                self.records = records
+                self._rebind()
+        return self._team_ids[team_name]
+
+    def add_player(self, player, team_name):
+        """Copy a Player's values into a new row and turn the Player into a view of it"""
+        if player.pid is not None and player.pid < len(self.players) and self.players[player.pid] is player:
+            self.team[player.pid] = self.team_id(team_name)
+            return player.pid
+        if len(self.players) == len(self.team):
+            self._grow()
+        pid = len(self.players)
+        self.stats[pid] = player.stats
+        self.ratings[pid] = player.ratings
+        self.team[pid] = self.team_id(team_name)
+        self.position[pid] = POSITION_CODE.get(player.position, -1)
+        self.players.append(player)
+        player.pid = pid
+        player.stats = self.stats[pid]
+        player.ratings = self.ratings[pid]
+        return pid
+
+    def add_team(self, team):
+        """Attach a team's record and players"""
+        tid = self.team_id(team.name)
+        self.records[tid] = team.record
+        team.record = self.records[tid]
+        self.teams[tid] = team
+        for p in team.players:
+            self.add_player(p, team.name)
+
+    # --- Vectorized queries ---
+    def reset_season(self):
+        self.stats[:] = 0
+
+    def leaders(self, attr, n=10, position=None, team_name=None):
+        """Top n (Player, value) pairs for a stat, optionally filtered by position/team"""
+        values = self.column(attr)
+        mask = np.ones(len(self.players), dtype=bool)
+        if position is not None:
+            mask &= self.position[:len(self.players)] == POSITION_CODE[position]
+        if team_name is not None:
+            mask &= self.team[:len(self.players)] == self._team_ids[team_name]
+        idx = np.flatnonzero(mask)
+        top = idx[np.argsort(-values[idx], kind="stable")[:n]]
+        return [(self.players[i], int(values[i])) for i in top]
+
+    def team_totals(self, attr=None):
+        """Per-team sums of one stat (or of every stat, as a teams x STAT_ATTRS array)"""
+        team = self.team[:len(self.players)].astype(np.int64)
+        n_teams = len(self.team_names)
+        if attr is not None:
+            return dict(zip(self.team_names, np.bincount(team, weights=self.column(attr), minlength=n_teams).astype(np.int64)))
+        totals = np.zeros((n_teams, len(STAT_ATTRS)), dtype=np.int64)
+        np.add.at(totals, team, self.stats[:len(self.players)])
+        return totals
+
+    # --- Memory mapping / sharing ---
+    def to_memmap(self, directory):
+        """Move the columns into .npy files under directory (memory-mapped, shareable across processes)"""
+        os.makedirs(directory, exist_ok=True)
+        sizes = dict.fromkeys(self.COLUMNS, len(self.players))
+        sizes["records"] = len(self.team_names)
+        for name, n in sizes.items():
+            values = getattr(self, name)[:n]
+            mm = np.lib.format.open_memmap(os.path.join(directory, f"{name}.npy"), mode="w+",
+                                           dtype=values.dtype, shape=values.shape)
+            mm[:] = values
+            setattr(self, name, mm)
+        with open(os.path.join(directory, "index.json"), "w") as f:
+            json.dump({"teams": self.team_names, "players": [p.name for p in self.players]}, f)
+        self._rebind()
+
+    @staticmethod
+    def open_columns(directory, mode="r"):
+        """Map a to_memmap() directory in another process; returns {column: array, 'index': {...}}"""
+        columns = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mode)
+                   for name in LeagueStore.COLUMNS + ("records",)}
+        with open(os.path.join(directory, "index.json")) as f:
+            columns["index"] = json.load(f)
+        return columns
@@ -0,0 +1,117 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import football_sim as fs
+
+# ============================
+# --- ROSTER PAYLOADS ---
+# ============================
+def roster_payload(team):
+    """What a worker needs to play a team's game: its name and every starter list as
+    (name, position, skill) tuples, instead of the pickled Team with its whole roster"""
+    return (team.name, [[(p.name, p.position, int(p.skill)) for p in getattr(team, attr)]
+                        for attr, _, _ in fs.STARTER_SLOTS])
+
+def payload_team(payload):
+    """A throwaway Team holding just the payload's starters"""
+    name, slots = payload
+    team = fs.Team(name)
+    for (attr, _, _), starters in zip(fs.STARTER_SLOTS, slots):
+        players = [fs.Player(player, position, skill, 0) for player, position, skill in starters]
+        setattr(team, attr, players)
+        team.players += players
+    return team
+
+# ============================
+# --- PER-GAME SEEDS ---
+# ============================
+def play_seeded_game(job):
+    """Worker entry point: play one game on its own seed and return what the parent needs to merge"""
+    index, payload1, payload2, seed = job
+    team1, team2 = payload_team(payload1), payload_team(payload2)
+    # The parent merges the counters (the in-process path shares them)
+    counters = dict(fs.SIM_COUNTERS)
+    winner = fs.simulate_game(team1, team2, out=fs.SILENT_OUTPUT, seed=seed)
+    plays = fs.SIM_COUNTERS["plays"] - counters["plays"]
+    fs.SIM_COUNTERS.update(counters)
+    return {
+        "index": index,
+        "scores": (team1.score, team2.score),
+        "team1_won": winner is team1,
+        "plays": plays,
+        "last_game_stats": (team1.last_game_stats, team2.last_game_stats),
+    }
+
+def merge_game_result(team1, team2, result):
+    """Apply a worker's game result to the parent's Team/Player objects"""
+    team1.score, team2.score = result["scores"]
+    team1.record_game(team1.score, team2.score, result["team1_won"])
+    team2.record_game(team2.score, team1.score, not result["team1_won"])
+    winner = team1 if result["team1_won"] else team2
+
+    # The game lines are keyed by player name: fold them into season totals as GameStats.fold
+    # does and keep them in roster order, as GameStats.team_lines does
+    for team, last_game in zip((team1, team2), result["last_game_stats"]):
+        lines = {}
+        for p in team.players:
+            line = last_game.get(p.name)
+            if line is not None:
+                fs.add_game_stats(p.stats, line)
+                lines[p.name] = line
+        team.last_game_stats = lines
+
+    fs.SIM_COUNTERS["games"] += 1
+    fs.SIM_COUNTERS["plays"] += result["plays"]
+    return winner
+
+# ============================
+# --- PARALLEL WEEK EXECUTOR ---
+# ============================
+class ParallelWeek:
+    """Play a league week's games on a process pool with deterministic per-game seeds"""
+    def __init__(self, workers=None, base_seed=0):
+        self.workers = workers or os.cpu_count() or 1
+        self.base_seed = base_seed
+        self.pool = ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def simulate_week(self, franchise, out=None):
+        """Drop-in for fs.simulate_week: same pairing and per-game seeds, games played in parallel.
+
+        Uses franchise.seed when the franchise has one (then results match fs.simulate_week
+        exactly), otherwise this executor's base_seed.
+        """
+        pairs = fs.pair_week(franchise, self.base_seed if franchise.seed is None else None)
+        jobs = [(i, roster_payload(t1), roster_payload(t2), seed) for i, (t1, t2, seed) in enumerate(pairs)]
+
+        if self.pool is None:
+            results = [play_seeded_game(job) for job in jobs]
+        else:
+            # One task per worker rather than per game keeps the round trips down
+            chunk = math.ceil(len(jobs) / self.workers)
+            results = list(self.pool.map(play_seeded_game, jobs, chunksize=chunk))
+
+        out = out or fs.OUTPUT
+        week = []
+        for (team1, team2, seed), result in zip(pairs, results):
+            merge_game_result(team1, team2, result)
+            week.append((team1.name, team2.name, team1.score, team2.score, seed))
+            if out.enabled(fs.SUMMARY) and franchise.user_team_name in [team1.name, team2.name]:
+                out.write(f"{team1.name} {team1.score} - {team2.name} {team2.score}", fs.SUMMARY)
+        return week
+
+def simulate_week_parallel(franchise, workers=None, base_seed=0, out=None):
+    """One-off parallel week; reuse a ParallelWeek to keep the pool warm across weeks"""
+    with ParallelWeek(workers, base_seed) as executor:
+        return executor.simulate_week(franchise, out=out)
@@ -0,0 +1,207 @@
+import math
+import os
+import pickle
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import football_sim as fs
+from drive_engine import DriveModel
+
+# ============================
+# --- COUNTER LAYOUT ---
+# ============================
+# Per team: [playoffs, division, title, seed 1 .. seed 7]
+PLAYOFFS, DIVISION, TITLE, SEED_1 = 0, 1, 2, 3
+N_SEEDS = 7
+N_COUNTS = SEED_1 + N_SEEDS
+
+Z_SCORES = {0.90: 1.645, 0.95: 1.960, 0.99: 2.576}
+
+# ============================
+# --- ONE SAMPLE ---
+# ============================
+def _records(franchise):
+    return {t.name: (t.wins, t.losses, t.points_for, t.points_against) for t in franchise.teams}
+
+def _restore(franchise, records):
+    for t in franchise.teams:
+        t.wins, t.losses, t.points_for, t.points_against = records[t.name]
+        t.score = 0
+    franchise.standings.rebuild()
+
+def simulate_rest_of_season(franchise, records, counts, drives=None, games=None):
+    """Play out the remaining weeks and playoffs once and add the outcome to counts.
+    games: the remaining weeks already played, as [(team1, team2, score1, score2)]"""
+    _restore(franchise, records)
+    if games is None:
+        for _ in range(franchise.current_week, fs.SEASON_GAMES + 1):
+            fs.simulate_week(franchise, out=fs.SILENT_OUTPUT, stats=False, drives=drives)
+    else:
+        for team1, team2, score1, score2 in games:
+            team1.record_game(score1, score2, score1 > score2)
+            team2.record_game(score2, score1, score2 > score1)
+
+    for conference in ("AFC", "NFC"):
+        conf_teams = [t for t in franchise.teams if t.league == conference]
+        for team in fs.get_division_winners(conf_teams):
+            counts[team.name][DIVISION] += 1
+        for seed, team in enumerate(fs.get_playoff_teams(conf_teams)):
+            counts[team.name][PLAYOFFS] += 1
+            counts[team.name][SEED_1 + seed] += 1
+
+    champion = fs.run_playoffs(franchise, interactive=False, out=fs.SILENT_OUTPUT, stats=False, drives=drives)
+    counts[champion.name][TITLE] += 1
+
+def batch_games(franchise, n):
+    """Every remaining regular-season game of n samples, played in one BatchGames (score only).
+
+    Pairings don't depend on results, so each sample's weeks are paired up front; returns
+    one [(team1, team2, score1, score2)] list per sample.
+    """
+    from batch_engine import BatchGames
+    weeks = fs.SEASON_GAMES + 1 - franchise.current_week
+    pairs = [(team1, team2) for _ in range(n * weeks) for team1, team2, _ in fs.pair_week(franchise)]
+    batch = BatchGames(pairs, seed=random.getrandbits(64), stats=False)
+    batch.run()
+    games = batch.results()
+    per_sample = len(games) // n if n else 0
+    return [games[i * per_sample:(i + 1) * per_sample] for i in range(n)]
+
+def run_chunk(franchise, seed, n, drives=None, batched=False):
+    """Simulate n samples on a private RNG stream; returns per-team counters.
+    batched plays the regular season of all n samples in lockstep (batch_games)"""
+    records = _records(franchise)
+    counts = {name: [0] * N_COUNTS for name in records}
+    state = random.getstate()
+    random.seed(seed)
+    # A seeded franchise would replay the same season every sample; draw from the chunk's stream instead
+    franchise_seed, franchise.seed = franchise.seed, None
+    try:
+        seasons = batch_games(franchise, n) if batched else [None] * n
+        for games in seasons:
+            simulate_rest_of_season(franchise, records, counts, drives, games)
+    finally:
+        random.setstate(state)
+        franchise.seed = franchise_seed
+        _restore(franchise, records)
+    return counts
+
+# ============================
+# --- WORKER PROCESS ---
+# ============================
+_WORKER_FRANCHISE = None
+_WORKER_DRIVES = None
+_WORKER_BATCHED = False
+
+def _init_worker(payload):
+    global _WORKER_FRANCHISE, _WORKER_DRIVES, _WORKER_BATCHED
+    _WORKER_FRANCHISE, _WORKER_DRIVES, _WORKER_BATCHED = pickle.loads(payload)
+
+def _worker_chunk(job):
+    seed, n = job
+    return run_chunk(_WORKER_FRANCHISE, seed, n, _WORKER_DRIVES, _WORKER_BATCHED)
+
+# ============================
+# --- PROJECTION ENGINE ---
+# ============================
+def max_half_width(totals, samples, confidence=0.95):
+    """Largest normal-approximation CI half-width over every team/outcome probability"""
+    z = Z_SCORES[confidence]
+    worst = 0.0
+    for row in totals.values():
+        for c in row:
+            p = c / samples
+            worst = max(worst, z * math.sqrt(p * (1 - p) / samples))
+    return worst
+
+def score_engine(engine, teams):
+    """The drives= model project_season ships to the workers: "drive" (exact drive outcomes,
+    drive_engine), "kernel" (compiled score-only games, sim_kernel) or "play" (every down, None).
+    "batch" also plays every down, the regular season in lockstep (batch_engine)"""
+    if engine == "drive":
+        return DriveModel().prepare(teams)
+    if engine == "kernel":
+        from sim_kernel import KernelScores  # imports numba when installed
+        return KernelScores()
+    if engine in ("play", "batch"):
+        return None
+    raise ValueError(f"unknown projection engine {engine!r}")
+
+def project_season(franchise, max_samples=20000, ci_width=0.02, confidence=0.95,
+                   min_samples=1000, chunk_size=250, workers=None, seed=0, engine="drive"):
+    """Monte Carlo playoff odds from the franchise's current (mid-season) state.
+
+    Chunks of samples run on a process pool and are folded into running totals as they
+    arrive, in submission order so results don't depend on scheduling. Stops once every
+    probability's confidence interval is narrower than ci_width (or at max_samples).
+    Games are drawn drive by drive from exact per-matchup drive outcomes (drive_engine),
+    built once here and shipped to the workers; see score_engine for the other engines.
+    Returns {"samples", "half_width", "teams": {name: {...probabilities...}}}.
+    """
+    workers = workers or os.cpu_count() or 1
+    drives = score_engine(engine, franchise.teams)
+    batched = engine == "batch"
+    payload = pickle.dumps((franchise, drives, batched))
+    totals = {t.name: [0] * N_COUNTS for t in franchise.teams}
+    samples = 0
+    half_width = 1.0
+
+    n_chunks = math.ceil(max_samples / chunk_size)
+    jobs = [(seed * 1000003 + i, min(chunk_size, max_samples - i * chunk_size)) for i in range(n_chunks)]
+
+    def fold(counts, n):
+        nonlocal samples, half_width
+        for name, row in counts.items():
+            total = totals[name]
+            for i, c in enumerate(row):
+                total[i] += c
+        samples += n
+        half_width = max_half_width(totals, samples, confidence)
+        return samples >= min_samples and 2 * half_width <= ci_width
+
+    if workers <= 1:
+        local, drives, batched = pickle.loads(payload)
+        for job in jobs:
+            if fold(run_chunk(local, *job, drives, batched), job[1]):
+                break
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(payload,)) as pool:
+            queue = iter(jobs)
+            pending = deque((job[1], pool.submit(_worker_chunk, job)) for job in islice(queue, 2 * workers))
+            done = False
+            while pending and not done:
+                n, future = pending.popleft()
+                done = fold(future.result(), n)
+                job = next(queue, None)
+                if not done and job is not None:
+                    pending.append((job[1], pool.submit(_worker_chunk, job)))
+            for _, future in pending:
+                future.cancel()
+
+    teams = {}
+    for name, row in totals.items():
+        teams[name] = {
+            "playoffs": row[PLAYOFFS] / samples,
+            "division": row[DIVISION] / samples,
+            "title": row[TITLE] / samples,
+            "seeds": [c / samples for c in row[SEED_1:]],
+        }
+    return {"samples": samples, "half_width": half_width, "confidence": confidence, "teams": teams}
+
+def print_projections(projection, teams):
+    """Print playoff odds by conference, best playoff odds first"""
+    odds = projection["teams"]
+    print(f"\n=== PLAYOFF ODDS ({projection['samples']} sims, ±{projection['half_width']*100:.1f}%) ===")
+    for conference in ("AFC", "NFC"):
+        table = fs.PrettyTable()
+        table.field_names = ["Team", "Div", "Playoffs", "Div Win", "#1 Seed", "Title"]
+        conf_teams = sorted((t for t in teams if t.league == conference),
+                            key=lambda t: odds[t.name]["playoffs"], reverse=True)
+        for t in conf_teams:
+            o = odds[t.name]
+            table.add_row([t.name, t.division, f"{o['playoffs']:.1%}", f"{o['division']:.1%}",
+                           f"{o['seeds'][0]:.1%}", f"{o['title']:.1%}"])
+        print(f"\n{conference}")
+        print(table)
@@ -0,0 +1,165 @@
+import argparse
+import hashlib
+import sys
+
+import codec
+import football_sim as fs
+from events import EventLog
+from journal import load_journal
+
+# ============================
+# --- DIGESTS ---
+# ============================
+def results_digest(results):
+    """Short sha256 over game results [(team1, team2, score1, score2, seed)], in play order"""
+    h = hashlib.sha256()
+    for game in results:
+        h.update(repr(tuple(game)).encode())
+    return h.hexdigest()[:16]
+
+def team_records(franchise):
+    return {t.name: (t.score, t.wins, t.losses, t.points_for, t.points_against) for t in franchise.teams}
+
+# ============================
+# --- REPLAY ---
+# ============================
+def _working_copy(franchise):
+    """Replays never touch the caller's franchise"""
+    if franchise.seed is None:
+        raise ValueError("franchise has no seed; only seeded franchises can be replayed")
+    return codec.loads(codec.dumps(franchise), lazy=False)
+
+def replay_game(franchise, game_index, events=None):
+    """Re-play one game of the franchise's current week from its recorded seed"""
+    copy = _working_copy(franchise)
+    pairs = fs.pair_week(copy)
+    if not 0 <= game_index < len(pairs):
+        raise ValueError(f"week {copy.current_week} has games 0-{len(pairs) - 1}")
+    team1, team2, seed = pairs[game_index]
+    fs.simulate_game(team1, team2, out=fs.SILENT_OUTPUT, events=events, seed=seed)
+    return team1.name, team2.name, team1.score, team2.score, seed
+
+def replay_week(franchise, events=None):
+    """Re-play the franchise's current week; returns (franchise after the week, results)"""
+    copy = _working_copy(franchise)
+    results = fs.simulate_week(copy, out=fs.SILENT_OUTPUT, events=events)
+    copy.current_week += 1
+    return copy, results
+
+def replay_season(franchise, events=None):
+    """Re-play from the current week through the playoffs; returns (results by week, champion name)"""
+    copy = _working_copy(franchise)
+    weeks = []
+    while copy.current_week <= fs.SEASON_GAMES:
+        weeks.append(fs.simulate_week(copy, out=fs.SILENT_OUTPUT, events=events))
+        copy.current_week += 1
+    champion = fs.run_playoffs(copy, interactive=False, out=fs.SILENT_OUTPUT)
+    return weeks, champion.name
+
+def season_digest(weeks, champion):
+    return results_digest([game for week in weeks for game in week] + [(champion,)])
+
+# ============================
+# --- VERIFICATION ---
+# ============================
+def compare_events(expected, actual, seed):
+    """Differences between two logs' play-by-play for the game played on seed ([] if identical)"""
+    game_ids = expected.find_game(seed), actual.find_game(seed)
+    if None in game_ids:
+        return [f"game with seed {seed} is missing from the {'stored' if game_ids[0] is None else 'replayed'} log"]
+    want, got = expected.game_plays(game_ids[0]), actual.game_plays(game_ids[1])
+    problems = [f"play {i}: stored {a} != replayed {b}" for i, (a, b) in enumerate(zip(want, got)) if a != b]
+    if len(want) != len(got):
+        problems.append(f"stored log has {len(want)} plays, replay has {len(got)}")
+    return problems
+
+def compare_records(expected, actual):
+    """Team (score, W, L, PF, PA) differences between a journaled state and a replayed one"""
+    want, got = team_records(expected), team_records(actual)
+    return [f"{name}: journal {want[name]} != replay {got.get(name)}" for name in want if want[name] != got.get(name)]
+
+def _journaled(path, week):
+    """The journal's state at the start of week, or None if it doesn't reach that far"""
+    try:
+        return load_journal(path, week)
+    except ValueError:
+        return None
+
+# ============================
+# --- CLI ---
+# ============================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-simulate games from a seeded franchise journal and verify them")
+    parser.add_argument("journal", help="franchise journal (journal.py) of a seeded franchise")
+    parser.add_argument("--week", type=int, default=1, help="week to start from (default 1)")
+    parser.add_argument("--game", type=int, default=None, help="replay only this game (index in the week's pairing)")
+    parser.add_argument("--season", action="store_true", help="replay through the end of the playoffs")
+    parser.add_argument("--digest", default=None, help="expected results digest (headless report) to check against")
+    parser.add_argument("--events", default=None, help="stored EventLog to check the replayed play-by-play against")
+    parser.add_argument("--record-events", default=None, help="save the replay's EventLog to this path")
+    args = parser.parse_args(argv)
+
+    try:
+        franchise = load_journal(args.journal, args.week)
+    except ValueError as e:
+        print(f"Cannot replay: {e}")
+        return 1
+    log = EventLog() if args.events or args.record_events else None
+    problems = []
+    checks = 0  # journaled states, digests and event logs compared against
+
+    if args.game is not None:
+        result = replay_game(franchise, args.game, log)
+        print(f"Week {args.week} game {args.game}: {result[0]} {result[2]} - {result[1]} {result[3]} (seed {result[4]})")
+        digest = results_digest([result])
+        after = _journaled(args.journal, args.week + 1)
+        if after is not None:
+            checks += 1
+            want = team_records(after)
+            for name, score in ((result[0], result[2]), (result[1], result[3])):
+                if want[name][0] != score:
+                    problems.append(f"{name}: journal score {want[name][0]} != replay {score}")
+        seeds = [result[4]]
+    elif args.season:
+        weeks, champion = replay_season(franchise, log)
+        for week, results in enumerate(weeks, args.week):
+            print(f"Week {week}: {results_digest(results)}")
+        print(f"Champion: {champion}")
+        digest = season_digest(weeks, champion)
+        seeds = [game[4] for week in weeks for game in week]
+    else:
+        after, results = replay_week(franchise, log)
+        for team1, team2, score1, score2, seed in results:
+            print(f"{team1} {score1} - {team2} {score2} (seed {seed})")
+        digest = results_digest(results)
+        journaled = _journaled(args.journal, args.week + 1)
+        if journaled is not None:
+            checks += 1
+            problems += compare_records(journaled, after)
+        seeds = [game[4] for game in results]
+
+    print(f"Digest: {digest}")
+    if args.digest:
+        checks += 1
+        if args.digest != digest:
+            problems.append(f"digest {digest} != expected {args.digest}")
+    if args.events:
+        checks += 1
+        stored = EventLog.load(args.events)
+        for seed in seeds:
+            problems += compare_events(stored, log, seed)
+    if args.record_events:
+        log.save(args.record_events)
+
+    for problem in problems:
+        print(f"MISMATCH {problem}")
+    if problems:
+        print(f"Replay differs ({len(problems)} mismatches)")
+    elif not checks:
+        print("Nothing to compare: no journaled state after the replayed week and no --digest or --events given")
+    else:
+        print("Replay matches")
+    return 1 if problems or not checks else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
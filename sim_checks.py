@@ -0,0 +1,304 @@
+import argparse
+import math
+import random
+import sys
+
+import football_sim as fs
+
+# ============================
+# --- STATISTICS ---
+# ============================
+def chi2_sf(x, df):
+    """P(X >= x) for a chi-square with df degrees of freedom (Wilson-Hilferty approximation)"""
+    if df <= 0:
+        return 1.0
+    z = ((x / df) ** (1 / 3) - (1 - 2 / (9 * df))) / math.sqrt(2 / (9 * df))
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def homogeneity(a, b, min_expected=5):
+    """Chi-square test that two samples of integers share one distribution; returns (statistic, df, p)"""
+    counts = {}
+    for sample, col in ((a, 0), (b, 1)):
+        for v in sample:
+            counts.setdefault(v, [0, 0])[col] += 1
+    n_a, n_b = len(a), len(b)
+    n = n_a + n_b
+    # Pool sparse values into neighbours so every cell has enough expected count
+    cells, pending = [], [0, 0]
+    for v in sorted(counts):
+        pending = [pending[0] + counts[v][0], pending[1] + counts[v][1]]
+        if sum(pending) * min(n_a, n_b) / n >= min_expected:
+            cells.append(pending)
+            pending = [0, 0]
+    if sum(pending) and cells:
+        cells[-1] = [cells[-1][0] + pending[0], cells[-1][1] + pending[1]]
+    stat = 0.0
+    for x, y in cells:
+        for observed, size in ((x, n_a), (y, n_b)):
+            expected = (x + y) * size / n
+            stat += (observed - expected) ** 2 / expected
+    df = len(cells) - 1
+    return stat, df, chi2_sf(stat, df)
+
+def mean_z(a, b):
+    """z statistic for the difference of two sample means"""
+    def moments(s):
+        m = sum(s) / len(s)
+        return m, sum((v - m) ** 2 for v in s) / (len(s) - 1)
+    (ma, va), (mb, vb) = moments(a), moments(b)
+    return (ma - mb) / math.sqrt(va / len(a) + vb / len(b))
+
+# ============================
+# --- CHECKS ---
+# ============================
+def matchups(teams, games):
+    """A fixed rotation of `games` pairings"""
+    pairs = []
+    for i in range(games):
+        team1, team2 = teams[i % len(teams)], teams[(i * 7 + 3) % len(teams)]
+        if team1 is team2:
+            team2 = teams[(i + 1) % len(teams)]
+        pairs.append((team1, team2))
+    return pairs
+
+def game_scores(teams, games, seed, stats, drives=None):
+    """Both teams' final scores for `games` seeded games over matchups(teams, games)"""
+    scores = []
+    for i, (team1, team2) in enumerate(matchups(teams, games)):
+        fs.simulate_game(team1, team2, out=fs.SILENT_OUTPUT, seed=fs.game_seed(seed, 0, 0, i), stats=stats,
+                         drives=drives)
+        scores += [team1.score, team2.score]
+    return scores
+
+def check_score_mode(games=4000, seed=0, alpha=0.001):
+    """Score-only games (stats=False) against full games: same score distribution?
+
+    Runs the same matchups in both modes on independent seeds and compares the pooled
+    score histograms (chi-square homogeneity) and mean scores (z test).
+    """
+    random.seed(seed)
+    teams = fs.create_new_league()
+    full = game_scores(teams, games, 2 * seed, True)
+    fast = game_scores(teams, games, 2 * seed + 1, False)
+    stat, df, p = homogeneity(full, fast)
+    z = mean_z(full, fast)
+    p_mean = math.erfc(abs(z) / math.sqrt(2))
+    return {
+        "name": "score_mode",
+        "passed": p >= alpha and p_mean >= alpha,
+        "detail": (f"{games} games each: mean {sum(full) / len(full):.2f} vs {sum(fast) / len(fast):.2f} "
+                   f"(z={z:+.2f}, p={p_mean:.3f}); chi2={stat:.1f} df={df} p={p:.3f}"),
+    }
+
+def check_drive_model(games=4000, seed=0, alpha=0.001):
+    """Drive-level games (drive_engine.DriveModel) against score-only games played down by down.
+
+    Same comparison as score_mode. The model is exact, so this only fails if it drifts from
+    simulate_drive's rules (field goal range, 4th-down decisions, starting field position).
+    """
+    from drive_engine import DriveModel
+    random.seed(seed)
+    teams = fs.create_new_league()
+    plays = game_scores(teams, games, 2 * seed, False)
+    drives = game_scores(teams, games, 2 * seed + 1, False, DriveModel())
+    stat, df, p = homogeneity(plays, drives)
+    z = mean_z(plays, drives)
+    p_mean = math.erfc(abs(z) / math.sqrt(2))
+    return {
+        "name": "drive_model",
+        "passed": p >= alpha and p_mean >= alpha,
+        "detail": (f"{games} games each: mean {sum(plays) / len(plays):.2f} vs {sum(drives) / len(drives):.2f} "
+                   f"(z={z:+.2f}, p={p_mean:.3f}); chi2={stat:.1f} df={df} p={p:.3f}"),
+    }
+
+def check_kernel(games=4000, seed=0, alpha=0.001, paired=200):
+    """sim_kernel: numba and pure-Python paths agree exactly, and kernel games score like simulate_game.
+
+    The first `paired` seeds are played on both paths and every outcome row must match (only
+    the Python path runs when numba is not installed), and the score-only entry point must
+    give the same scores. Then kernel games are compared with regular games as in score_mode.
+    """
+    import sim_kernel
+    random.seed(seed)
+    teams = fs.create_new_league()
+    pairs = matchups(teams, games)
+
+    mismatched = 0
+    for i, (team1, team2) in enumerate(pairs[:paired]):
+        game_seed = fs.game_seed(2 * seed, 0, 0, i)
+        played = sim_kernel.run_kernel(team1, team2, game_seed, jit=False)
+        if sim_kernel.play_scores(team1, team2, game_seed, jit=False)[1:] != played[2:] or \
+                sim_kernel.njit is not None and sim_kernel.run_kernel(team1, team2, game_seed, jit=True) != played:
+            mismatched += 1
+    if sim_kernel.njit is not None:
+        paths = f"numba vs Python vs score-only: {mismatched}/{paired} games differ"
+    else:
+        paths = f"numba not installed; Python vs score-only: {mismatched}/{paired} games differ"
+
+    regular = game_scores(teams, games, 2 * seed, True)
+    kernel = []
+    for i, (team1, team2) in enumerate(pairs):
+        sim_kernel.simulate_game(team1, team2, out=fs.SILENT_OUTPUT, seed=fs.game_seed(2 * seed + 1, 0, 0, i))
+        kernel += [team1.score, team2.score]
+    stat, df, p = homogeneity(regular, kernel)
+    z = mean_z(regular, kernel)
+    p_mean = math.erfc(abs(z) / math.sqrt(2))
+    return {
+        "name": "kernel",
+        "passed": not mismatched and p >= alpha and p_mean >= alpha,
+        "detail": (f"{paths}; {games} games each: mean {sum(regular) / len(regular):.2f} vs "
+                   f"{sum(kernel) / len(kernel):.2f} (z={z:+.2f}, p={p_mean:.3f}); chi2={stat:.1f} df={df} p={p:.3f}"),
+    }
+
+def check_batch(games=4000, seed=0, alpha=0.001):
+    """batch_engine.BatchGames against simulate_game: same scores and per-player stat lines?
+
+    Plays the same matchups on both engines. Scores are compared as in score_mode; the
+    players with a line per team-game and every stat's mean over those lines by z tests,
+    Bonferroni-corrected over the stats.
+    """
+    from batch_engine import BatchGames
+    random.seed(seed)
+    teams = fs.create_new_league()
+    pairs = matchups(teams, games)
+
+    regular, regular_lines, regular_counts = [], [], []
+    for i, (team1, team2) in enumerate(pairs):
+        fs.simulate_game(team1, team2, out=fs.SILENT_OUTPUT, seed=fs.game_seed(2 * seed, 0, 0, i))
+        regular += [team1.score, team2.score]
+        for team in (team1, team2):
+            regular_lines += team.last_game_stats.values()
+            regular_counts.append(len(team.last_game_stats))
+
+    batch = BatchGames(pairs, seed=2 * seed + 1)
+    batch.run()
+    batched = [score for game in batch.results() for score in game[2:]]
+    batched_lines, batched_counts = [], []
+    for i in range(games):
+        for side in (0, 1):
+            lines = batch.lines(i, side)
+            batched_lines += lines.values()
+            batched_counts.append(len(lines))
+
+    stat, df, p = homogeneity(regular, batched)
+    tests = len(fs.STAT_ATTRS) + 2
+    failed = [] if p >= alpha / tests else ["score"]
+    z_scores = {"score": mean_z(regular, batched), "lines": mean_z(regular_counts, batched_counts)}
+    for i, attr in enumerate(fs.STAT_ATTRS):
+        a, b = [line[i] for line in regular_lines], [line[i] for line in batched_lines]
+        if any(a) or any(b):
+            z_scores[attr] = mean_z(a, b)
+    for name, z in z_scores.items():
+        if math.erfc(abs(z) / math.sqrt(2)) < alpha / tests and name not in failed:
+            failed.append(name)
+    worst = max(z_scores, key=lambda name: abs(z_scores[name]))
+    return {
+        "name": "batch",
+        "passed": not failed,
+        "detail": (f"{games} games each: mean score {sum(regular) / len(regular):.2f} vs "
+                   f"{sum(batched) / len(batched):.2f}, chi2={stat:.1f} df={df} p={p:.3f}; "
+                   f"{len(z_scores)} z tests, largest |z| {abs(z_scores[worst]):.2f} ({worst})"
+                   + (f"; differ: {', '.join(failed)}" if failed else "")),
+    }
+
+def old_pass_odds(qb_diff, rec_offset, rb_target):
+    """The pass branches of the original simulate_play, enumerated: (flags, yards) -> probability"""
+    odds = {}
+    def add(flags, yards, p):
+        odds[(flags, yards)] = odds.get((flags, yards), 0.0) + p
+    for yards in range(3, 9):  # sack: -randint(3, 8)
+        add(fs.FLAG_SACK, -yards, 0.08 * 0.60 / 6)
+    for yards in range(2, 13):  # scramble: randint(2, 12), fumbled (and lost) 2% of the time
+        add(fs.FLAG_SCRAMBLE, yards, 0.08 * 0.40 * 0.98 / 11)
+        add(fs.FLAG_SCRAMBLE | fs.FLAG_FUMBLE | fs.FLAG_FUMBLE_LOST, yards, 0.08 * 0.40 * 0.02 / 11)
+    add(fs.FLAG_INTERCEPTION, 0, 0.92 * 0.025)
+    thrown = 0.92 * 0.975
+    success_rate = 0.63 + qb_diff / 200
+    incomplete = 1.0 if success_rate < 0 else max(0.0, 1 - success_rate)  # random.random() > success_rate
+    add(fs.FLAG_INCOMPLETE, 0, thrown * incomplete * 0.85)
+    add(fs.FLAG_INCOMPLETE | fs.FLAG_DROP, 0, thrown * incomplete * 0.15)
+    complete = thrown * (1 - incomplete)
+    for yards in range(20, 76):  # big play: randint(20, 75)
+        add(fs.FLAG_COMPLETE | fs.FLAG_BIG_PLAY, yards, complete * 0.08 / 56)
+    lo, hi = (1, 12) if rb_target else (3, 18)
+    for yards in range(lo, hi + 1):
+        add(fs.FLAG_COMPLETE, yards + rec_offset, complete * 0.92 / (hi - lo + 1))
+    return odds
+
+def old_run_odds(rb_offset):
+    """The run branches of the original simulate_play, enumerated: (flags, yards) -> probability"""
+    odds = {}
+    def add(flags, yards, p):
+        odds[(flags, yards)] = odds.get((flags, yards), 0.0) + p
+    for flags, lo, hi, p, offset in ((fs.FLAG_BIG_PLAY, 15, 80, 0.05, 0), (0, -2, 10, 0.95, rb_offset)):
+        for yards in range(lo + offset, hi + offset + 1):
+            share = p / (hi - lo + 1)
+            add(flags, yards, share * 0.985)  # fumbled 1.5% of the time, lost half of those
+            add(flags | fs.FLAG_FUMBLE, yards, share * 0.015 * 0.5)
+            add(flags | fs.FLAG_FUMBLE | fs.FLAG_FUMBLE_LOST, yards, share * 0.015 * 0.5)
+    return odds
+
+def check_outcome_tables(samples=20000, seed=0, alpha=0.001, tolerance=1e-9):
+    """Alias tables against the original simulate_play branch odds, over the skill-differential range.
+
+    Every table's distribution() must equal the enumerated odds of the original pass and run
+    branches (including the clamped ends of the completion rate). Draws from a few tables are
+    then compared with draws from their exact odds (chi-square homogeneity over outcomes).
+    """
+    tables = fs.OutcomeTables()
+    cases = [(tables.passing(qb_diff, rec_offset, rb_target), old_pass_odds(qb_diff, rec_offset, rb_target))
+             for qb_diff in range(-150, 151) for rec_offset in range(-8, 9) for rb_target in (False, True)]
+    cases += [(tables.running(rb_offset), old_run_odds(rb_offset)) for rb_offset in range(-8, 9)]
+    worst = 0.0
+    for table, odds in cases:
+        dist = table.distribution()
+        for outcome in set(dist) | set(odds):
+            worst = max(worst, abs(dist.get(outcome, 0.0) - odds.get(outcome, 0.0)))
+
+    rng = random.Random(seed)
+    sampled = [tables.passing(-40, -2, False), tables.passing(0, 0, True), tables.passing(35, 1, False),
+               tables.running(-2), tables.running(0), tables.running(2)]
+    p_min = 1.0
+    for table in sampled:
+        odds = table.distribution()
+        outcomes = sorted(odds)
+        index = {outcome: i for i, outcome in enumerate(outcomes)}
+        drawn = [index[table.sample(rng)] for _ in range(samples)]
+        expected = rng.choices(range(len(outcomes)), weights=[odds[o] for o in outcomes], k=samples)
+        p_min = min(p_min, homogeneity(drawn, expected)[2])
+    return {
+        "name": "outcome_tables",
+        "passed": worst <= tolerance and p_min >= alpha / len(sampled),
+        "detail": (f"{len(cases)} tables vs original branch odds: largest difference {worst:.1e}; "
+                   f"{len(sampled)} tables x {samples} draws, smallest chi2 p={p_min:.3f}"),
+    }
+
+CHECKS = {
+    "outcome_tables": check_outcome_tables,
+    "score_mode": check_score_mode,
+    "drive_model": check_drive_model,
+    "kernel": check_kernel,
+    "batch": check_batch,
+}
+
+# ============================
+# --- CLI ---
+# ============================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Statistical agreement checks between simulation modes")
+    parser.add_argument("names", nargs="*", help=f"checks to run (default: all of {', '.join(CHECKS)})")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    unknown = [n for n in args.names if n not in CHECKS]
+    if unknown:
+        parser.error(f"unknown check(s): {', '.join(unknown)}")
+
+    failed = 0
+    for name in args.names or CHECKS:
+        result = CHECKS[name](seed=args.seed)
+        print(f"{'PASS' if result['passed'] else 'FAIL'} {result['name']}: {result['detail']}")
+        failed += not result["passed"]
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,450 @@
+import random
+
+import numpy as np
+
+import football_sim as fs
+from football_sim import (FLAG_CLOCK_STOPS, FLAG_DROP, FLAG_FG_GOOD, FLAG_FUMBLE, FLAG_FUMBLE_LOST, FLAG_INCOMPLETE,
+                          FLAG_INTERCEPTION, FLAG_SACK, FLAG_SCRAMBLE, FLAG_TOUCHDOWN, FLAG_TURNOVER,
+                          PASS_ODDS, PLAY_FIELD_GOAL, PLAY_PASS, PLAY_PUNT, PLAY_RUN)
+
+try:
+    from numba import njit
+except ImportError:  # optional: the kernel runs as plain Python, with the same results
+    njit = None
+
+# ============================
+# --- OUTCOME CODES ---
+# ============================
+# The kernel writes one row of N_COLS ints per snap (plays, field goals, punts) into a flat buffer.
+# RB, DEF and TARGET index the offense's rb_starters, the defense's defense_starters and the
+# offense's wr_starters + te_starters (TARGET -1: the RB was thrown to, or a run).
+(C_OFFENSE, C_KIND, C_DOWN, C_DISTANCE, C_YTG, C_RB, C_DEF, C_TARGET,
+ C_FLAGS, C_YARDS, C_TIME, C_EXTRA) = range(12)
+N_COLS = 12
+EXTRA_PRESSURE, EXTRA_DEFLECTION = 1, 2
+MAX_ROWS = 1024  # a game averages ~150 snaps
+
+# Per offense in the `sides` array: starter counts, then offsets of its table-id blocks in `tabs`
+S_RB, S_REC, S_DEF, S_PASS_RB, S_PASS_REC, S_RUN = range(6)
+N_SIDE = 6
+
+# splitmix64: a 64-bit state, one add and two multiply-xorshifts per draw
+MASK64 = 0xFFFFFFFFFFFFFFFF
+GOLDEN, MIX1, MIX2 = 0x9E3779B97F4A7C15, 0xBF58476D1CE4E5B9, 0x94D049BB133111EB
+UNIT = 1.0 / (1 << 53)
+
+# ============================
+# --- KERNEL ---
+# ============================
+def play_game(state, drives, t_off, t_n, a_prob, a_alias, a_flags, a_yards, sides, tabs, out):
+    """One game on plain ints and arrays: simulate_game/simulate_drive/simulate_play's rules and odds.
+
+    state[0] is the splitmix64 state (advanced in place); drives per team are drawn from it
+    when drives is 0. The alias tables are packed by KernelTables; sides/tabs describe both
+    matchups (offense 0 is team1). Every snap is written to out as an outcome row. Returns
+    (rows, plays, score1, score2), tie-breaker included.
+    Runs unchanged as Python (lists or arrays) or compiled by numba.
+    """
+    def uniform(state):
+        z = (state[0] + GOLDEN) & MASK64
+        state[0] = z
+        z = ((z ^ (z >> 30)) * MIX1) & MASK64
+        z = ((z ^ (z >> 27)) * MIX2) & MASK64
+        return ((z ^ (z >> 31)) >> 11) * UNIT
+
+    def emit(out, row, k, kind, down, distance, ytg, rb, dfn, target, flags, yards, time, extra):
+        if row >= MAX_ROWS:
+            raise ValueError("outcome buffer full")
+        i = row * N_COLS
+        out[i + C_OFFENSE] = k
+        out[i + C_KIND] = kind
+        out[i + C_DOWN] = down
+        out[i + C_DISTANCE] = distance
+        out[i + C_YTG] = ytg
+        out[i + C_RB] = rb
+        out[i + C_DEF] = dfn
+        out[i + C_TARGET] = target
+        out[i + C_FLAGS] = flags
+        out[i + C_YARDS] = yards
+        out[i + C_TIME] = time
+        out[i + C_EXTRA] = extra
+        return row + 1
+
+    rows = 0
+    plays = 0
+    score1 = 0
+    score2 = 0
+    if drives <= 0:
+        drives = 11 + int(uniform(state) * 3)
+    for drive in range(2 * drives):
+        k = drive % 2  # team1 and team2 alternate possessions
+        side = k * N_SIDE
+        n_rb, n_rec, n_def = sides[side + S_RB], sides[side + S_REC], sides[side + S_DEF]
+        points = 0
+
+        yards_to_go = 100 - (20 + int(uniform(state) * 21))
+        down = 1
+        distance = 10
+        while yards_to_go > 0:
+            if down == 4:
+                if yards_to_go <= 40 and uniform(state) < 0.75:
+                    good = uniform(state) < 0.80
+                    rows = emit(out, rows, k, PLAY_FIELD_GOAL, down, distance, yards_to_go, -1, -1, -1,
+                                FLAG_FG_GOOD if good else 0, yards_to_go + 17, 5, 0)
+                    if good:
+                        points += 3
+                    break
+                elif not (distance <= 2 and uniform(state) < 0.30):
+                    rows = emit(out, rows, k, PLAY_PUNT, down, distance, yards_to_go, -1, -1, -1, 0, 0, 8, 0)
+                    break
+
+            plays += 1
+            rb = int(uniform(state) * n_rb)
+            dfn = int(uniform(state) * n_def)
+            if down == 3 and distance > 7:
+                odds = PASS_ODDS[0]
+            elif distance <= 3:
+                odds = PASS_ODDS[1]
+            else:
+                odds = PASS_ODDS[2]
+            target = -1
+            if uniform(state) < odds:
+                kind = PLAY_PASS
+                if uniform(state) < 0.30:
+                    table = tabs[sides[side + S_PASS_RB] + dfn * n_rb + rb]
+                else:
+                    target = int(uniform(state) * n_rec)
+                    table = tabs[sides[side + S_PASS_REC] + dfn * n_rec + target]
+            else:
+                kind = PLAY_RUN
+                table = tabs[sides[side + S_RUN] + dfn * n_rb + rb]
+
+            # Alias draw, as AliasTable.sample
+            u = uniform(state) * t_n[table]
+            i = int(u)
+            j = t_off[table] + i
+            if u - i >= a_prob[j]:
+                j = a_alias[j]
+            flags = a_flags[j]
+            yards = a_yards[j]
+
+            turnover = False
+            clock_stops = False
+            if kind == PLAY_PASS:
+                if flags & FLAG_SACK:
+                    time = 4 + int(uniform(state) * 5)
+                elif flags & FLAG_SCRAMBLE:
+                    if flags & FLAG_FUMBLE:
+                        time = 6 + int(uniform(state) * 5)
+                        turnover = True
+                    else:
+                        time = 4 + int(uniform(state) * 5)
+                elif flags & FLAG_INTERCEPTION:
+                    time = 5 + int(uniform(state) * 8)
+                    turnover = True
+                elif flags & FLAG_INCOMPLETE:
+                    time = 4 + int(uniform(state) * 5)
+                    clock_stops = True
+                else:
+                    if uniform(state) < 0.25:  # out of bounds
+                        clock_stops = True
+                    time = 6 + int(uniform(state) * 7)
+            elif flags & FLAG_FUMBLE_LOST:
+                time = 6 + int(uniform(state) * 5)
+                turnover = True
+            else:
+                time = 3 + int(uniform(state) * 5)
+
+            if turnover:
+                rows = emit(out, rows, k, kind, down, distance, yards_to_go, rb, dfn, target,
+                            flags | FLAG_TURNOVER | FLAG_CLOCK_STOPS, yards, time, 0)
+                break
+
+            extra = 0
+            if uniform(state) < 0.12:
+                extra |= EXTRA_PRESSURE
+            if kind == PLAY_PASS and uniform(state) < 0.08:
+                extra |= EXTRA_DEFLECTION
+            if yards_to_go - yards <= 0:
+                flags |= FLAG_TOUCHDOWN
+                clock_stops = True
+                points += 7
+            if clock_stops:
+                flags |= FLAG_CLOCK_STOPS
+            rows = emit(out, rows, k, kind, down, distance, yards_to_go, rb, dfn, target, flags, yards, time, extra)
+
+            yards_to_go -= yards
+            distance -= yards
+            if yards_to_go <= 0:
+                break
+            if distance <= 0:
+                down = 1
+                distance = 10
+            else:
+                down += 1
+            if down > 4:
+                break
+
+        if k == 0:
+            score1 += points
+        else:
+            score2 += points
+
+    if score1 == score2:  # overtime / tie-breaker
+        if uniform(state) < 0.5:
+            score1 += 3
+        else:
+            score2 += 3
+    return rows, plays, score1, score2
+
+play_game_jit = njit(cache=True)(play_game) if njit is not None else None
+
+# ============================
+# --- PACKED TABLES ---
+# ============================
+class KernelTables:
+    """fs.OUTCOME_TABLES' alias tables packed into flat arrays the kernel indexes by table id,
+    plus each matchup's (sides, tabs) and the kernel's state and output buffers, ready to pass
+    as NumPy arrays (numba) or lists (Python). Cleared with fs.OUTCOME_TABLES.
+    """
+    def __init__(self):
+        self.ids = {}
+        self.offsets, self.sizes = [], []
+        self.prob, self.alias, self.flags, self.yards = [], [], [], []
+        self._packed = {}
+        self.matchups = {}  # (jit, starter skills of both teams) -> (sides, tabs)
+        self._buffers = {}
+
+    def _add(self, key, table):
+        offset = len(self.prob)
+        self.offsets.append(offset)
+        self.sizes.append(table.n)
+        self.prob += table.prob
+        self.alias += [offset + a for a in table.alias]
+        self.flags += [flags for flags, _ in table.outcomes]
+        self.yards += [yards for _, yards in table.outcomes]
+        self._packed.clear()
+        table_id = self.ids[key] = len(self.sizes) - 1
+        return table_id
+
+    def passing(self, qb_diff, rec_offset, rb_target):
+        key = (PLAY_PASS, qb_diff, rec_offset, rb_target)
+        table_id = self.ids.get(key)
+        if table_id is None:
+            table_id = self._add(key, fs.OUTCOME_TABLES.passing(qb_diff, rec_offset, rb_target))
+        return table_id
+
+    def running(self, rb_offset):
+        key = (PLAY_RUN, rb_offset)
+        table_id = self.ids.get(key)
+        if table_id is None:
+            table_id = self._add(key, fs.OUTCOME_TABLES.running(rb_offset))
+        return table_id
+
+    def packed(self, jit):
+        """(t_off, t_n, a_prob, a_alias, a_flags, a_yards): NumPy arrays for numba, lists for Python"""
+        packed = self._packed.get(jit)
+        if packed is None:
+            columns = (self.offsets, self.sizes, self.prob, self.alias, self.flags, self.yards)
+            if jit:
+                packed = tuple(np.array(c, dtype=np.float64 if c is self.prob else np.int64) for c in columns)
+            else:
+                packed = tuple(list(c) for c in columns)
+            self._packed[jit] = packed
+        return packed
+
+    def matchup(self, team1, team2, jit):
+        """matchup(team1, team2) in the kernel's input form, cached by both teams' starter skills"""
+        key = (jit, _starters(team1), _starters(team2))
+        packed = self.matchups.get(key)
+        if packed is None:
+            sides, tabs = matchup(team1, team2, self)
+            if jit:
+                sides, tabs = np.array(sides, dtype=np.int64), np.array(tabs, dtype=np.int64)
+            packed = self.matchups[key] = (sides, tabs)
+        return packed
+
+    def buffers(self, jit):
+        """(state, out): the kernel's RNG state and outcome buffer, reused from game to game"""
+        buffers = self._buffers.get(jit)
+        if buffers is None:
+            if jit:
+                buffers = (np.zeros(1, dtype=np.uint64), np.zeros(MAX_ROWS * N_COLS, dtype=np.int64))
+            else:
+                buffers = ([0], [0] * (MAX_ROWS * N_COLS))
+            self._buffers[jit] = buffers
+        return buffers
+
+    def clear(self):
+        self.__init__()
+
+KERNEL_TABLES = KernelTables()
+fs.OUTCOME_TABLES.derived.append(KERNEL_TABLES)
+
+# ============================
+# --- ADAPTER ---
+# ============================
+def _starters(team):
+    return (team.qb_starters[0].skill, tuple(p.skill for p in team.rb_starters),
+            tuple(p.skill for p in team.wr_starters + team.te_starters),
+            tuple(p.skill for p in team.defense_starters))
+
+def matchup(team1, team2, tables=None):
+    """(sides, tabs) for the kernel: starter counts and the table id of every pick for both offenses"""
+    tables = tables or KERNEL_TABLES
+    sides, tabs = [], []
+    for offense, defense in ((team1, team2), (team2, team1)):
+        qb = offense.qb_starters[0].skill
+        rbs = [p.skill for p in offense.rb_starters]
+        receivers = [p.skill for p in offense.wr_starters + offense.te_starters]
+        defenders = [p.skill for p in defense.defense_starters]
+        sides += [len(rbs), len(receivers), len(defenders)]
+        sides.append(len(tabs))
+        tabs += [tables.passing(qb - d, (r - d) // 20, True) for d in defenders for r in rbs]
+        sides.append(len(tabs))
+        tabs += [tables.passing(qb - d, (r - d) // 20, False) for d in defenders for r in receivers]
+        sides.append(len(tabs))
+        tabs += [tables.running((r - d) // 20) for d in defenders for r in rbs]
+    return sides, tabs
+
+def _kernel(team1, team2, seed, drives, jit, tables):
+    """Run the kernel into the shared buffer; returns (out, rows, plays, score1, score2)"""
+    if jit is None:
+        jit = njit is not None
+    elif jit and njit is None:
+        raise RuntimeError("numba is not installed")
+    tables = tables or KERNEL_TABLES
+    sides, tabs = tables.matchup(team1, team2, jit)
+    state, out = tables.buffers(jit)
+    state[0] = seed & MASK64
+    kernel = play_game_jit if jit else play_game
+    return (out,) + tuple(kernel(state, drives, *tables.packed(jit), sides, tabs, out))
+
+def run_kernel(team1, team2, seed, jit=None, tables=None):
+    """Play the game in the kernel; returns (outcome rows as a flat list, rows, score1, score2).
+
+    jit=None compiles with numba when it is installed, True requires it, False runs plain Python.
+    """
+    out, rows, _, score1, score2 = _kernel(team1, team2, seed, 0, jit, tables)
+    codes = out[:rows * N_COLS]
+    return codes if isinstance(codes, list) else codes.tolist(), rows, score1, score2
+
+def play_scores(team1, team2, seed, drives=0, jit=None, tables=None):
+    """Score-only kernel game: (plays, score1, score2), no outcome rows copied or applied.
+    drives=0 draws the drives per team from the seed, as run_kernel does."""
+    _, _, plays, score1, score2 = _kernel(team1, team2, seed, drives, jit, tables)
+    return plays, score1, score2
+
+class KernelScores:
+    """Score-only games on the kernel, pluggable as simulate_game(..., stats=False, drives=KernelScores()).
+
+    Each game is seeded from the caller's rng, so seeded games replay; the kernel settles ties
+    itself. Holds no tables, so it pickles to worker processes as is.
+    """
+    def __init__(self, jit=None):
+        self.jit = jit
+
+    def play_drives(self, team1, team2, possessions, rng):
+        """Add each team's points over `possessions` drives to its score; returns the plays run"""
+        plays, score1, score2 = play_scores(team1, team2, int(rng.random() * (1 << 53)), possessions, self.jit)
+        team1.score += score1
+        team2.score += score2
+        return plays
+
+def apply_rows(box, team1, team2, codes, rows):
+    """Credit every outcome row to the players involved (and emit events); returns plays run"""
+    plays = 0
+    for n in range(rows):
+        (k, kind, down, distance, ytg, rb, dfn, target,
+         flags, yards, time, extra) = codes[n * N_COLS:(n + 1) * N_COLS]
+        offense, defense = (team1, team2) if k == 0 else (team2, team1)
+        if kind == PLAY_FIELD_GOAL or kind == PLAY_PUNT:
+            if box.events is not None:
+                fs._emit_play(box, offense, down, distance, ytg, kind, None, None, None, yards, time, flags)
+            continue
+        plays += 1
+        qb = box.line(offense.qb_starters[0])
+        back = box.line(offense.rb_starters[rb])
+        defender = box.line(defense.defense_starters[dfn])
+
+        if kind == PLAY_PASS:
+            receiver = back if target < 0 else box.line((offense.wr_starters + offense.te_starters)[target])
+            qb.pass_attempts += 1
+            receiver.rec_targets += 1
+            if flags & FLAG_SACK:
+                qb.sacks_taken += 1
+            elif flags & FLAG_SCRAMBLE:
+                qb.rush_attempts += 1
+                qb.rush_yards += yards
+                qb.longest_rush = max(qb.longest_rush, yards)
+                if flags & FLAG_FUMBLE:
+                    qb.fumbles += 1
+            elif flags & FLAG_INTERCEPTION:
+                qb.interceptions += 1
+                defender.interceptions_def += 1
+            elif flags & FLAG_INCOMPLETE:
+                if flags & FLAG_DROP:
+                    receiver.drops += 1
+            else:
+                qb.pass_completions += 1
+                qb.pass_yards += yards
+                receiver.rec_catches += 1
+                receiver.rec_yards += yards
+                qb.longest_pass = max(qb.longest_pass, yards)
+                receiver.longest_rec = max(receiver.longest_rec, yards)
+            if flags & FLAG_TOUCHDOWN:
+                qb.pass_td += 1
+                receiver.rec_td += 1
+        else:
+            receiver = back
+            back.rush_attempts += 1
+            back.rush_yards += yards
+            back.longest_rush = max(back.longest_rush, yards)
+            if flags & FLAG_FUMBLE:
+                back.fumbles += 1
+                defender.forced_fumbles += 1
+                if flags & FLAG_FUMBLE_LOST:
+                    defender.fumble_recoveries += 1
+            if flags & FLAG_TOUCHDOWN:
+                back.rush_td += 1
+
+        if not flags & FLAG_TURNOVER:
+            defender.tackles += 1
+            if extra & EXTRA_PRESSURE:
+                defender.qb_pressure += 1
+            if extra & EXTRA_DEFLECTION:
+                defender.pass_deflections += 1
+        if box.events is not None:
+            fs._emit_play(box, offense, down, distance, ytg, kind, qb, receiver, defender, yards, time, flags)
+    return plays
+
+def simulate_game(team1, team2, user_team=None, out=None, events=None, seed=None, jit=None):
+    """fs.simulate_game with every draw and decision made by the kernel.
+
+    Teams and players are only touched here, when the outcome rows are applied. A seed
+    gives the same game on either kernel path; without one a seed is drawn from random.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    codes, rows, score1, score2 = run_kernel(team1, team2, seed, jit)
+    box = fs.GameStats(events, events.begin_game(team1, team2, seed) if events is not None else 0)
+    team1.score = 0
+    team2.score = 0
+    plays = apply_rows(box, team1, team2, codes, rows)
+    team1.score, team2.score = score1, score2
+    fs.SIM_COUNTERS["games"] += 1
+    fs.SIM_COUNTERS["plays"] += plays
+
+    winner = team1 if score1 > score2 else team2
+    if events is not None:
+        events.end_game(box.game_id, score1, score2)
+    team1.record_game(score1, score2, winner is team1)
+    team2.record_game(score2, score1, winner is team2)
+    box.fold()
+    team1.last_game_stats = box.team_lines(team1)
+    team2.last_game_stats = box.team_lines(team2)
+
+    out = out or fs.OUTPUT
+    if out.enabled(fs.SUMMARY) and (user_team is None or user_team in [team1.name, team2.name]):
+        out.write(f"{team1.name} {score1} - {team2.name} {score2}", fs.SUMMARY)
+    return winner